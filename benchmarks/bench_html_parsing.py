@@ -0,0 +1,91 @@
+# benchmarks/bench_html_parsing.py
+"""
+Compare the original manual-source HTML handling with html_parsing.
+
+Usage:
+    python benchmarks/bench_html_parsing.py [--provider NAME] [--repeat N] [page.html ...]
+
+Without page arguments a large synthetic release-notes page is generated.
+"""
+import argparse
+import os
+import sys
+import timeit
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.aggregator.html_parsing import find_content_elements, html_to_text  # noqa: E402
+
+
+def synthetic_page(sections=400):
+    """
+    Build a release-notes page padded with navigation, scripts and sidebars.
+    """
+    nav = '<nav>' + ''.join(f'<a href="/docs/{i}">Docs {i}</a>' for i in range(300)) + '</nav>'
+    scripts = ''.join(f'<script>window.__data{i} = {{"k": {i}}};</script>' for i in range(50))
+    cards = ''.join(f'<div class="card"><p>Related {i}</p></div>' for i in range(500))
+    sidebar = f'<aside>{cards}</aside>'
+    notes = ''.join(
+        f'<section><h2>Release 1.{i}.0</h2><time datetime="2024-01-{i % 28 + 1:02d}">Jan</time>'
+        f'<ul><li>Added feature {i} with <code>flag_{i}</code></li><li>Fixed bug #{i * 7}</li></ul>'
+        f'<p>Paragraph describing <a href="/r/{i}">change {i}</a> in more detail.</p></section>'
+        for i in range(sections)
+    )
+    return (
+        f'<html><head><title>Release notes</title>{scripts}<style>body{{margin:0}}</style></head>'
+        f'<body><header>Header</header>{nav}{sidebar}<main><article>{notes}</article></main>'
+        f'<footer>Footer</footer></body></html>'
+    ).encode('utf-8')
+
+
+def original_content_elements(markup, provider):
+    soup = BeautifulSoup(markup, 'html.parser')
+    for element in soup(['script', 'style', 'nav', 'header', 'footer']):
+        element.decompose()
+    if provider == 'azuredevops':
+        return soup.select('article') or soup.select('.content-article')
+    if provider == 'openai':
+        return soup.select('article') or soup.select('.article-content')
+    if provider == 'anthropic':
+        return soup.select('article') or soup.select('.blog-post')
+    return soup.select('main') or soup.select('article') or [soup]
+
+
+def bench(label, func, repeat):
+    seconds = min(timeit.repeat(func, number=1, repeat=repeat))
+    print(f"  {label:<38} {seconds * 1000:9.2f} ms")
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('pages', nargs='*', help='Saved release-notes pages')
+    parser.add_argument('--provider', default='',
+                        help='Provider rule to apply (default: main/article)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    pages = [(path, open(path, 'rb').read()) for path in args.pages]
+    pages = pages or [('synthetic', synthetic_page())]
+
+    for name, markup in pages:
+        print(f"{name} ({len(markup) / 1024:.0f} KiB)")
+        before = bench('html.parser full parse + select',
+                       lambda: original_content_elements(markup, args.provider), args.repeat)
+        for backend in ('html.parser', 'auto'):
+            after = bench(f'strained parse ({backend})',
+                          lambda: find_content_elements(markup, args.provider, backend),
+                          args.repeat)
+            print(f"    speedup x{before / after:.1f}")
+
+        text = markup.decode('utf-8', errors='replace')
+        before = bench('BeautifulSoup get_text',
+                       lambda: BeautifulSoup(text, 'html.parser').get_text(), args.repeat)
+        after = bench('html_to_text', lambda: html_to_text(text), args.repeat)
+        print(f"    speedup x{before / after:.1f}")
+
+
+if __name__ == '__main__':
+    main()
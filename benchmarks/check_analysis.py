@@ -0,0 +1,225 @@
+# benchmarks/check_analysis.py
+"""
+Check analysis against the fake Messages API in benchmarks/fixtures.py.
+
+Concurrent mode must recover from 429 responses, honouring ``retry-after``
+both through the RateLimiter and through the SDK's own retries, must retry
+5xx responses without giving up on the entry, and must overlap requests. In
+Message Batches mode, a batch that outlives ``max_wait`` is resumed from the
+state file on the next run instead of being resubmitted, and a failing batch
+API degrades to unanalyzed entries instead of failing the run.
+
+Usage:
+    python benchmarks/check_analysis.py
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fixtures import FakeLLMServer  # noqa: E402
+
+
+def sample_entries(count=5):
+    return [
+        {
+            'title': f"Release v1.{index}.0",
+            'content': f"Added feature {index}. Fixed bug {index * 7}.",
+            'source_name': 'Fake Source',
+            'source_type': 'devops_tools',
+            'provider_name': 'github',
+            'link': f"https://example.com/releases/v1.{index}.0",
+        }
+        for index in range(count)
+    ]
+
+
+def _analyzed(analyses):
+    return sum(1 for analysis in analyses if not analysis.get('is_fallback'))
+
+
+def _executor(llm, max_workers=4):
+    from src.analysis.executor import AnalysisExecutor
+
+    os.environ['ANTHROPIC_BASE_URL'] = llm.url
+    return AnalysisExecutor(
+        f"key-{llm.url}", max_workers=max_workers,
+        requests_per_minute=100000, tokens_per_minute=100000000, max_retries=5
+    )
+
+
+def check_rate_limit_backoff(workdir):
+    """
+    429s with retry-after are retried by the limiter until every entry is analyzed.
+    """
+    llm = FakeLLMServer(latency=0, rate_limited=3, retry_after=0.3)
+    entries = sample_entries(8)
+    try:
+        executor = _executor(llm)
+        started = time.perf_counter()
+        analyses = [analysis for _, analysis in executor.analyze_iter(entries)]
+        elapsed = time.perf_counter() - started
+        problems = []
+        if _analyzed(analyses) != len(entries):
+            problems.append(f"analyzed {_analyzed(analyses)} of {len(entries)} entries after 429s")
+        if llm.throttled != 3:
+            problems.append(f"fake server sent {llm.throttled} 429s, expected 3")
+        if elapsed < llm.retry_after:
+            problems.append(f"finished in {elapsed:.2f}s, before retry-after {llm.retry_after}s")
+        if executor.limiter.scale >= 1.0:
+            problems.append("limiter did not slow down after 429s")
+        return problems
+    finally:
+        llm.close()
+
+
+def check_server_errors(workdir):
+    """
+    500 and 529 (overloaded) responses are retried instead of shipping unanalyzed entries.
+    """
+    problems = []
+    for status in (500, 529):
+        llm = FakeLLMServer(latency=0, server_errors=2, error_status=status, retry_after=0.1)
+        entries = sample_entries(4)
+        try:
+            executor = _executor(llm)
+            analyses = [analysis for _, analysis in executor.analyze_iter(entries)]
+            if _analyzed(analyses) != len(entries):
+                problems.append(
+                    f"analyzed {_analyzed(analyses)} of {len(entries)} entries after {status}s"
+                )
+            if llm.failed != 2:
+                problems.append(f"fake server sent {llm.failed} {status}s, expected 2")
+            if executor.limiter.scale < 1.0:
+                problems.append(f"limiter slowed down after {status}s")
+        finally:
+            llm.close()
+    return problems
+
+
+def check_sdk_retry(workdir):
+    """
+    Without a limiter the SDK's own retry policy recovers from a 429.
+    """
+    from src.analysis.analyze_with_claude import analyze_entry
+
+    llm = FakeLLMServer(latency=0, rate_limited=1, retry_after=0.1)
+    os.environ['ANTHROPIC_BASE_URL'] = llm.url
+    entry = sample_entries(1)[0]
+    try:
+        analysis = analyze_entry(entry['content'], entry['source_name'], entry['title'],
+                                 f"key-{llm.url}", source_type=entry['source_type'])
+        if analysis.get('is_fallback') or llm.throttled != 1:
+            return ["SDK retry did not recover from a 429"]
+        return []
+    finally:
+        llm.close()
+
+
+def check_concurrent_throughput(workdir):
+    """
+    Requests overlap: 16 entries on 8 workers take well under half the serial time.
+    """
+    llm = FakeLLMServer(latency=0.2)
+    entries = sample_entries(16)
+    try:
+        executor = _executor(llm, max_workers=8)
+        started = time.perf_counter()
+        analyses = [analysis for _, analysis in executor.analyze_iter(entries)]
+        elapsed = time.perf_counter() - started
+        serial = len(entries) * llm.latency
+        problems = []
+        if _analyzed(analyses) != len(entries):
+            problems.append(f"analyzed {_analyzed(analyses)} of {len(entries)} entries")
+        if elapsed > serial / 2:
+            problems.append(f"took {elapsed:.2f}s; serial requests would take {serial:.2f}s")
+        return problems
+    finally:
+        llm.close()
+
+
+def check_batch_resume(workdir):
+    """
+    A batch still running at ``max_wait`` is polled again, not resubmitted, on the next run.
+    """
+    from src.analysis.batch import BatchAnalyzer
+
+    llm = FakeLLMServer(latency=0, batch_polls=2)
+    os.environ['ANTHROPIC_BASE_URL'] = llm.url
+    state_path = os.path.join(workdir, 'resume', 'analysis_batch.json')
+    entries = sample_entries()
+    try:
+        analyzer = BatchAnalyzer(f"key-{llm.url}", state_path, poll_interval=0.01, max_wait=0)
+        first = analyzer.analyze(entries)
+        problems = []
+        if _analyzed(first) or not os.path.exists(state_path):
+            problems.append("unfinished batch: expected default analyses and a saved state file")
+
+        analyzer.max_wait = 5
+        second = analyzer.analyze(entries)
+        if len(llm.batches) != 1:
+            problems.append(f"resume submitted {len(llm.batches)} batches, expected 1")
+        if _analyzed(second) != len(entries):
+            problems.append(f"resume analyzed {_analyzed(second)} of {len(entries)} entries")
+        if os.path.exists(state_path):
+            problems.append("state file left behind after the batch ended")
+        return problems
+    finally:
+        llm.close()
+
+
+def check_batch_failure(workdir):
+    """
+    An API error from the batch routes leaves entries unanalyzed instead of raising.
+    """
+    from src.analysis.batch import BatchAnalyzer
+
+    llm = FakeLLMServer(latency=0, batch_error=401)
+    os.environ['ANTHROPIC_BASE_URL'] = llm.url
+    state_path = os.path.join(workdir, 'failure', 'analysis_batch.json')
+    entries = sample_entries()
+    try:
+        analyzer = BatchAnalyzer(f"key-{llm.url}", state_path, poll_interval=0.01, max_wait=5)
+        try:
+            analyses = analyzer.analyze(entries)
+        except Exception as e:
+            return [f"batch API failure raised {type(e).__name__}: {e}"]
+        if len(analyses) != len(entries) or _analyzed(analyses):
+            return ["batch API failure: expected one default analysis per entry"]
+        return []
+    finally:
+        llm.close()
+
+
+CHECKS = {
+    'rate_limit_backoff': check_rate_limit_backoff,
+    'server_errors': check_server_errors,
+    'sdk_retry': check_sdk_retry,
+    'concurrent_throughput': check_concurrent_throughput,
+    'batch_resume': check_batch_resume,
+    'batch_failure': check_batch_failure,
+}
+
+
+def main():
+    os.environ['NO_PROXY'] = '127.0.0.1'
+    workdir = tempfile.mkdtemp(prefix='aggregator-check-')
+    failures = 0
+    try:
+        for name, check in CHECKS.items():
+            problems = check(workdir)
+            for problem in problems:
+                print(f"  {problem}")
+            print(f"{'FAIL' if problems else 'ok  '} {name}")
+            failures += bool(problems)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+# benchmarks/check_feed_parity.py
+"""
+Check that the streaming feed parser and the feedparser fallback agree on hostile input.
+
+Both paths must resolve relative links against the feed URL and strip scripts,
+event handlers and other unsafe markup before content reaches the templates.
+The streaming parser's early stop must not drop items of oldest-first feeds.
+
+Usage:
+    python benchmarks/check_feed_parity.py
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+from html.parser import HTMLParser
+from urllib.parse import urlparse
+from xml.sax.saxutils import escape
+
+import pytz
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.aggregator.feed_fetcher import _parse_with_feedparser  # noqa: E402
+from src.aggregator.http_cache import CachedResponse  # noqa: E402
+from src.aggregator.stream_parser import iter_feed_items  # noqa: E402
+
+FEED_URL = 'https://github.com/hashicorp/terraform/releases.atom'
+HOSTILE = (
+    '<p onclick="alert(1)">hi</p><script>alert(2)</script><a href="/x">x</a>'
+    '<img src="img.png" onerror="alert(3)"><iframe src="https://evil.example/"></iframe>'
+    '<a href="javascript:alert(4)">js</a><style>body{display:none}</style>'
+)
+UNSAFE_TAGS = {'script', 'style', 'iframe'}
+PUBLISHED = datetime(2025, 1, 6, 10, tzinfo=pytz.UTC)
+WEEK_RANGE = (PUBLISHED - timedelta(days=3), PUBLISHED + timedelta(days=3))
+
+
+def atom_document():
+    date = PUBLISHED.isoformat()
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<title>Releases</title>
+<entry><id>tag:1</id><updated>{date}</updated><link rel="alternate" href="/releases/v1"/>
+<title type="html">{escape('v1 <script>alert(5)</script>')}</title>
+<content type="html">{escape(HOSTILE)}</content></entry>
+<entry><id>tag:2</id><updated>{date}</updated><link href="javascript:alert(6)"/><title>v2</title>
+<content type="text">{escape(HOSTILE)}</content></entry>
+<entry><id>tag:3</id><updated>{date}</updated><link href="v3"/><title>v3</title>
+<content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml">
+<p onclick="alert(7)">hi</p><script>alert(8)</script><a href="/y">y</a></div></content></entry>
+<entry xml:base="https://example.com/base/"><id>tag:4</id><updated>{date}</updated>
+<link href="v4"/><title>v4</title><summary type="html">{escape(HOSTILE)}</summary></entry>
+</feed>""".encode('utf-8')
+
+
+def rss_document():
+    date = PUBLISHED.strftime('%a, %d %b %Y %H:%M:%S GMT')
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel>
+<title>Releases</title><link>https://github.com/</link>
+<item><title>r1</title><link>/releases/r1</link><guid>r1</guid><pubDate>{date}</pubDate>
+<description>{escape(HOSTILE)}</description></item>
+<item><title>r2</title><link>https://example.com/r2</link><guid>r2</guid><pubDate>{date}</pubDate>
+<content:encoded>{escape(HOSTILE)}</content:encoded></item>
+</channel></rss>""".encode('utf-8')
+
+
+def oldest_first_document():
+    # The first item is older than the window; stopping there would drop the rest
+    dates = (PUBLISHED - timedelta(days=30), PUBLISHED - timedelta(days=1), PUBLISHED)
+    items = ''.join(
+        f"<item><title>o{index}</title><link>https://example.com/o{index}</link>"
+        f"<guid>o{index}</guid><pubDate>{date.strftime('%a, %d %b %Y %H:%M:%S GMT')}</pubDate>"
+        f"<description>post {index}</description></item>"
+        for index, date in enumerate(dates)
+    )
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"><channel><title>Oldest first</title><link>https://example.com/</link>
+{items}</channel></rss>""".encode('utf-8')
+
+
+def _absolute(url):
+    return urlparse(url).scheme in ('http', 'https')
+
+
+class _UnsafeMarkup(HTMLParser):
+    """
+    Collect unsafe tags, event handlers and relative or script URLs in a fragment.
+    """
+
+    def __init__(self, markup):
+        super().__init__()
+        self.found = []
+        self.feed(markup)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in UNSAFE_TAGS:
+            self.found.append(f"<{tag}>")
+        for name, value in attrs:
+            if name.startswith('on'):
+                self.found.append(f"{name}=")
+            elif name in ('href', 'src') and value and not _absolute(value):
+                self.found.append(f"{name}={value!r}")
+
+
+def compare(name, body, expected=None):
+    """
+    Parse ``body`` with both parsers; return a list of problems.
+    """
+    streamed = list(iter_feed_items(body, WEEK_RANGE, base_url=FEED_URL))
+    response = CachedResponse(FEED_URL, 200, body, {}, False)
+    parsed = _parse_with_feedparser(response, FEED_URL, WEEK_RANGE)
+
+    problems = []
+    if expected is not None and len(parsed) != expected:
+        problems.append(f"{name}: {len(parsed)} items from feedparser, expected {expected}")
+    if len(streamed) != len(parsed):
+        problems.append(f"{name}: {len(streamed)} streamed items, {len(parsed)} from feedparser")
+    for fast, reference in zip(streamed, parsed):
+        # guids are identifiers, never rendered; feedparser resolves RSS guids as URLs
+        for key in ('title', 'link', 'published', 'content'):
+            if fast[key] != reference[key]:
+                problems.append(f"{name} {reference['guid']}: {key} differs\n"
+                                f"  stream:     {fast[key]!r}\n  feedparser: {reference[key]!r}")
+        for item in (fast, reference):
+            unsafe = _UnsafeMarkup(item['content'] + item['title']).found
+            if unsafe or item['link'] != '#' and not _absolute(item['link']):
+                problems.append(
+                    f"{name} {item['guid']}: unsafe output {unsafe} link={item['link']!r}"
+                )
+    return problems
+
+
+def main():
+    problems = (
+        compare('atom', atom_document()) + compare('rss', rss_document())
+        + compare('oldest-first rss', oldest_first_document(), expected=2)
+    )
+    for problem in problems:
+        print(problem)
+    print(f"{'FAIL' if problems else 'ok'}: streaming parser vs feedparser on hostile and "
+          f"oldest-first feeds")
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
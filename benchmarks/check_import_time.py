@@ -0,0 +1,93 @@
+# benchmarks/check_import_time.py
+"""
+Check import-time budgets of the aggregator's entry modules with ``-X importtime``.
+
+Each module is imported in a fresh interpreter; the check fails when its
+cumulative import time exceeds the budget or when it loads a heavy dependency
+that should only be imported on first use.
+
+Usage:
+    python benchmarks/check_import_time.py [--repeat 5] [--scale 2.0]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Dependencies loaded lazily by the code that needs them
+HEAVY_MODULES = (
+    'anthropic', 'jinja2', 'markdown', 'pygments', 'bs4', 'soupsieve', 'feedparser', 'lxml',
+)
+
+# module -> cumulative import budget in milliseconds
+BUDGETS = {
+    'src.output': 30,
+    'src.output.history': 80,
+    'src.analysis.analyze_with_claude': 120,
+    'src.aggregator.news_aggregator': 300,
+    'src.pipeline': 300,
+    'run_aggregator': 400,
+    'query_history': 120,
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='Fresh interpreters per module')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='Multiply every budget, e.g. on slow CI machines')
+    return parser.parse_args(argv)
+
+
+def measure(module):
+    """
+    Import ``module`` in a fresh interpreter.
+
+    Returns (cumulative ms, loaded top-level packages).
+    """
+    code = (
+        f"import sys, {module}; "
+        f"print(' '.join(sorted({{name.split('.')[0] for name in sys.modules}})))"
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    cumulative = None
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == module:
+            cumulative = int(parts[1]) / 1000
+    return cumulative, set(result.stdout.split())
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    failures = []
+    for module, budget in BUDGETS.items():
+        timings = []
+        loaded = set()
+        for _ in range(args.repeat):
+            elapsed, loaded = measure(module)
+            timings.append(elapsed)
+        median = statistics.median(timings)
+        heavy = sorted(loaded.intersection(HEAVY_MODULES))
+        limit = budget * args.scale
+        ok = median <= limit and not heavy
+        print(f"{'ok  ' if ok else 'FAIL'} {module:<36} {median:8.1f} ms (budget {limit:.0f} ms)"
+              + (f"  loads {', '.join(heavy)}" if heavy else ''))
+        if not ok:
+            failures.append(module)
+
+    if failures:
+        print(f"{len(failures)} module(s) over budget: {', '.join(failures)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+# benchmarks/check_pipeline.py
+"""
+Check the streaming pipeline end to end against local fixture feeds.
+
+Deduplication runs in its own stage and appends later duplicates to an entry
+that has already been streamed on to the HTML generator; the "Also reported
+by" references must still reach index.html.
+
+Usage:
+    python benchmarks/check_pipeline.py
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fixtures import FixtureServer, atom_feed  # noqa: E402
+
+
+def _aggregator(workdir, sources):
+    from src.aggregator.news_aggregator import NewsAggregator
+
+    config = {
+        'sources': {'devops_tools': sources},
+        'settings': {'cache_dir': os.path.join(workdir, 'cache'), 'incremental': False},
+    }
+    return NewsAggregator(config), config
+
+
+def check_duplicate_references(workdir):
+    """
+    The same release mirrored by two sources renders once, with a back-reference.
+    """
+    from src.output import generate_html
+    from src.pipeline import build_pipeline
+
+    week_range = _aggregator(os.path.join(workdir, 'probe'), [])[0].current_week_range
+    body = atom_feed('mirrored', week_range, items=5, in_window=3, sections=2)
+    # The mirror answers late, so its copies are merged into entries the HTML
+    # generator has already received
+    documents = {'/releases.xml': (body, 'application/xml')}
+    primary = FixtureServer(documents)
+    mirror = FixtureServer(documents, latency=0.5)
+    sources = [
+        {'name': name, 'provider_name': 'github', 'url': server.url + '/releases.xml'}
+        for name, server in (('GitHub Releases', primary), ('GitHub Copilot', mirror))
+    ]
+    try:
+        aggregator, config = _aggregator(workdir, sources)
+        entries = []
+
+        def collect(stream):
+            for entry in stream:
+                entries.append(entry)
+                yield entry
+
+        output_dir = os.path.join(workdir, 'dist')
+        os.makedirs(output_dir, exist_ok=True)
+        generate_html(collect(build_pipeline(aggregator, config)),
+                      aggregator.current_week_range, '', [], [], output_dir=output_dir)
+        with open(os.path.join(output_dir, 'index.html'), encoding='utf-8') as f:
+            html = f.read()
+
+        problems = []
+        merged = [entry for entry in entries if entry.get('duplicates')]
+        if len(entries) != 3 or len(merged) != 3:
+            problems.append(f"{len(entries)} entries, {len(merged)} with duplicates; expected 3")
+        rendered = html.count('Also reported by')
+        if rendered != len(merged):
+            problems.append(
+                f"index.html shows {rendered} back-references for {len(merged)} merged entries"
+            )
+        return problems
+    finally:
+        primary.close()
+        mirror.close()
+
+
+CHECKS = {
+    'duplicate_references': check_duplicate_references,
+}
+
+
+def main():
+    os.environ['NO_PROXY'] = '127.0.0.1'
+    workdir = tempfile.mkdtemp(prefix='aggregator-check-')
+    failures = 0
+    try:
+        for name, check in CHECKS.items():
+            problems = check(workdir)
+            for problem in problems:
+                print(f"  {problem}")
+            print(f"{'FAIL' if problems else 'ok  '} {name}")
+            failures += bool(problems)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
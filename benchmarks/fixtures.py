@@ -0,0 +1,330 @@
+# benchmarks/fixtures.py
+"""
+Synthetic feeds, manual pages and local servers for the benchmark suite.
+"""
+import http.server
+import json
+import random
+import threading
+import time
+from datetime import timedelta
+from email.utils import format_datetime
+from urllib.parse import urlsplit
+from xml.sax.saxutils import escape
+
+BATCHES_PATH = '/v1/messages/batches'
+
+WORDS = (
+    'provider resource added fixed deprecated support cluster network storage identity '
+    'policy runner workflow token model endpoint release region timeout retry schema'
+).split()
+
+
+def _paragraph(rng, words=40):
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def release_notes(rng, sections=6, code=True):
+    """
+    Markdown release notes with headings, bullet lists and code blocks.
+    """
+    parts = []
+    for section in range(sections):
+        parts.append(f"## {rng.choice(WORDS).title()} changes {section}\n")
+        parts.extend(f"* {_paragraph(rng, 12)}" for _ in range(rng.randint(3, 8)))
+        if code and section % 2 == 0:
+            parts.append(
+                f"\n```hcl\nresource \"example\" \"r{section}\" {{\n"
+                f"  name = \"{rng.choice(WORDS)}\"\n}}\n```"
+            )
+        parts.append('')
+    return '\n'.join(parts)
+
+
+def _item_dates(week_range, count, in_window):
+    # Newest first; the first ``in_window`` items fall inside the window
+    start, end = week_range
+    span = (end - start) / max(in_window, 1)
+    for index in range(count):
+        if index < in_window:
+            yield end - span * (index + 0.5)
+        else:
+            yield start - timedelta(days=index - in_window + 1)
+
+
+def atom_feed(name, week_range, items=50, in_window=10, sections=6, seed=0):
+    """
+    A GitHub-releases style Atom feed with markdown-ish HTML content.
+    """
+    rng = random.Random(seed)
+    entries = []
+    for index, date in enumerate(_item_dates(week_range, items, in_window)):
+        link = f"https://example.com/{name}/releases/v{items - index}"
+        entries.append(
+            f"<entry><id>{link}</id><updated>{date.isoformat()}</updated>"
+            f"<link rel=\"alternate\" href=\"{link}\"/><title>{name} v{items - index}</title>"
+            f"<content type=\"html\">{escape(release_notes(rng, sections))}</content></entry>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+        f'<id>https://example.com/{name}</id><title>{name}</title>'
+        f'<updated>{week_range[1].isoformat()}</updated>' + ''.join(entries) + '</feed>'
+    ).encode('utf-8')
+
+
+def rss_feed(name, week_range, items=50, in_window=10, sections=6, seed=0):
+    """
+    A blog-style RSS 2.0 feed with HTML descriptions.
+    """
+    rng = random.Random(seed)
+    entries = []
+    for index, date in enumerate(_item_dates(week_range, items, in_window)):
+        link = f"https://example.com/{name}/post-{items - index}"
+        body = ''.join(f"<p>{_paragraph(rng)}</p>" for _ in range(sections))
+        entries.append(
+            f"<item><title>{name} post {items - index}</title><link>{link}</link>"
+            f"<guid>{link}</guid><pubDate>{format_datetime(date)}</pubDate>"
+            f"<description>{escape(body)}</description></item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f'<title>{name}</title><link>https://example.com/{name}</link>'
+        + ''.join(entries) + '</channel></rss>'
+    ).encode('utf-8')
+
+
+def manual_page(name, week_range, sections=40, seed=0):
+    """
+    A release-notes page with navigation, scripts and dated articles.
+    """
+    rng = random.Random(seed)
+    nav = '<nav>' + ''.join(f'<a href="/docs/{i}">Docs {i}</a>' for i in range(200)) + '</nav>'
+    scripts = ''.join(f'<script>window.__d{i} = {{"k": {i}}};</script>' for i in range(30))
+    articles = ''.join(
+        f'<article><h2>{name} update {index}</h2>'
+        f'<time datetime="{date.isoformat()}">{date:%B %d}</time>'
+        + ''.join(f'<p>{_paragraph(rng)}</p>' for _ in range(4)) + '</article>'
+        for index, date in enumerate(_item_dates(week_range, sections, sections // 4))
+    )
+    return (
+        f'<html><head><title>{name}</title>{scripts}</head><body><header>{name}</header>'
+        f'{nav}<main>{articles}</main><footer>Footer</footer></body></html>'
+    ).encode('utf-8')
+
+
+class _QuietHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _Server:
+    def __init__(self, handler):
+        self.httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class FixtureServer(_Server):
+    """
+    Serve in-memory documents by path, optionally delaying every response.
+    """
+
+    def __init__(self, documents, latency=0.0):
+        server = self
+
+        class Handler(_QuietHandler):
+            def do_GET(self):
+                document = server.documents.get(self.path)
+                time.sleep(server.latency)
+                if document is None:
+                    self._send(404, b'not found', 'text/plain')
+                    return
+                body, content_type = document
+                self._send(200, body, content_type)
+
+        self.documents = documents
+        self.latency = latency
+        super().__init__(Handler)
+
+
+class _FakeLLMHandler(_QuietHandler):
+    # Set on the per-server subclass
+    fake = None
+
+    def _json(self, status, payload, headers=None):
+        self._send(status, json.dumps(payload).encode('utf-8'), 'application/json', headers)
+
+    def _error(self, status, error_type, message='', headers=None):
+        payload = {'type': 'error', 'error': {'type': error_type, 'message': message}}
+        self._json(status, payload, headers)
+
+    def _batch_failed(self):
+        if not self.fake.batch_error:
+            return False
+        self._error(self.fake.batch_error, 'api_error', 'Batch API unavailable')
+        return True
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        if urlsplit(self.path).path.rstrip('/') == BATCHES_PATH:
+            if not self._batch_failed():
+                self._json(200, self.fake.create_batch(request['requests']))
+            return
+        if self.fake.take_rate_limit():
+            self._error(429, 'rate_limit_error', 'Rate limited',
+                        {'retry-after': str(self.fake.retry_after)})
+            return
+        if self.fake.take_server_error():
+            self._error(self.fake.error_status, 'api_error', 'Server error',
+                        {'retry-after': str(self.fake.retry_after)})
+            return
+        time.sleep(self.fake.latency)
+        with self.fake.lock:
+            self.fake.requests += 1
+        self._json(200, self.fake.message(request))
+
+    def do_GET(self):
+        path = urlsplit(self.path).path.rstrip('/')
+        if not path.startswith(BATCHES_PATH + '/'):
+            self._error(404, 'not_found_error')
+            return
+        if self._batch_failed():
+            return
+        batch_id, _, action = path[len(BATCHES_PATH) + 1:].partition('/')
+        if batch_id not in self.fake.batches:
+            self._error(404, 'not_found_error')
+        elif action == 'results':
+            self._send(200, self.fake.batch_results(batch_id), 'application/binary')
+        else:
+            self._json(200, self.fake.poll_batch(batch_id))
+
+
+class FakeLLMServer(_Server):
+    """
+    Minimal Messages API that answers every request after ``latency`` seconds
+    with a well-formed analysis. Point the SDK at it via ANTHROPIC_BASE_URL.
+
+    The first ``rate_limited`` Messages requests are answered with a 429 and
+    a ``retry-after`` of ``retry_after`` seconds instead; the next
+    ``server_errors`` ones fail with ``error_status`` (e.g. 500, or 529 for
+    overloaded) and the same ``retry-after``.
+
+    It also serves the Message Batches routes: a batch ends after
+    ``batch_polls`` status requests and then returns one result per request.
+    ``batch_error`` makes every batch route fail with that HTTP status, e.g.
+    401 for an expired key.
+    """
+
+    def __init__(self, latency=0.2, rate_limited=0, retry_after=0.2, batch_polls=1,
+                 batch_error=None, server_errors=0, error_status=500):
+        self.latency = latency
+        self.rate_limited = rate_limited
+        self.retry_after = retry_after
+        self.throttled = 0
+        self.server_errors = server_errors
+        self.error_status = error_status
+        self.failed = 0
+        self.batch_polls = batch_polls
+        self.batch_error = batch_error
+        self.requests = 0
+        self.batches = {}
+        self.lock = threading.Lock()
+        super().__init__(type('Handler', (_FakeLLMHandler,), {'fake': self}))
+
+    def take_rate_limit(self):
+        """
+        Return True while the next request should still be rate limited.
+        """
+        with self.lock:
+            if self.throttled >= self.rate_limited:
+                return False
+            self.throttled += 1
+            return True
+
+    def take_server_error(self):
+        """
+        Return True while the next request should still fail with ``error_status``.
+        """
+        with self.lock:
+            if self.failed >= self.server_errors:
+                return False
+            self.failed += 1
+            return True
+
+    def message(self, request):
+        """
+        The Messages API response to one request.
+        """
+        prompt = request['messages'][0]['content']
+        title = prompt.split('Title: ', 1)[-1].split('\n', 1)[0][:80]
+        text = json.dumps({
+            'summary': f"Synthetic summary of {title}",
+            'impact_level': 'MEDIUM',
+            'key_changes': ['Added a feature', 'Fixed a bug'],
+            'breaking_changes': [],
+            'security_updates': [],
+            'new_features': ['Added a feature'],
+            'deprecations': [],
+            'action_items': [],
+            'affected_services': [],
+        })[:-1]  # The stop sequence swallows the closing brace
+        return {
+            'id': f"msg_{self.requests}", 'type': 'message', 'role': 'assistant',
+            'model': request['model'], 'content': [{'type': 'text', 'text': text}],
+            'stop_reason': 'stop_sequence', 'stop_sequence': '}',
+            'usage': {'input_tokens': len(prompt) // 4, 'output_tokens': len(text) // 4},
+        }
+
+    def _batch(self, batch_id):
+        batch = self.batches[batch_id]
+        ended = batch['polls'] >= self.batch_polls
+        count = len(batch['requests'])
+        return {
+            'id': batch_id, 'type': 'message_batch',
+            'processing_status': 'ended' if ended else 'in_progress',
+            'request_counts': {
+                'processing': 0 if ended else count, 'succeeded': count if ended else 0,
+                'errored': 0, 'canceled': 0, 'expired': 0,
+            },
+            'created_at': '2025-01-01T00:00:00Z', 'expires_at': '2025-01-02T00:00:00Z',
+            'ended_at': '2025-01-01T00:10:00Z' if ended else None,
+            'archived_at': None, 'cancel_initiated_at': None,
+            'results_url': f"{self.url}/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+    def create_batch(self, requests):
+        with self.lock:
+            batch_id = f"msgbatch_{len(self.batches) + 1}"
+            self.batches[batch_id] = {'requests': requests, 'polls': 0}
+        return self._batch(batch_id)
+
+    def poll_batch(self, batch_id):
+        with self.lock:
+            self.batches[batch_id]['polls'] += 1
+        return self._batch(batch_id)
+
+    def batch_results(self, batch_id):
+        lines = [
+            json.dumps({
+                'custom_id': request['custom_id'],
+                'result': {'type': 'succeeded', 'message': self.message(request['params'])},
+            })
+            for request in self.batches[batch_id]['requests']
+        ]
+        return ('\n'.join(lines) + '\n').encode('utf-8')
@@ -0,0 +1,337 @@
+# benchmarks/run_benchmarks.py
+"""
+Time the aggregator's hot paths against synthetic sources and a fake LLM.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--feeds 10] [--repeat 3] \
+        [--only fetch_rss_entries,generate_html]
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/<previous>.json
+
+Every run writes a JSON report (default: benchmarks/results/<commit>-<timestamp>.json).
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fixtures import FakeLLMServer, FixtureServer, atom_feed, manual_page, rss_feed  # noqa: E402
+
+BENCHMARKS = [
+    'fetch_rss_entries', 'fetch_manual_entries', 'aggregate', 'analyze_entry',
+    'generate_html', 'generate_rss', 'end_to_end_cold', 'end_to_end_warm',
+]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--feeds', type=int, default=10, help='Number of synthetic feeds')
+    parser.add_argument('--items', type=int, default=50, help='Items per feed')
+    parser.add_argument('--in-window', type=int, default=10,
+                        help='Items per feed inside the week window')
+    parser.add_argument('--sections', type=int, default=6, help='Sections per item body')
+    parser.add_argument('--pages', type=int, default=3, help='Number of manual pages')
+    parser.add_argument('--page-sections', type=int, default=40, help='Articles per manual page')
+    parser.add_argument('--feed-latency', type=float, default=0.0,
+                        help='Seconds added to every fixture response')
+    parser.add_argument('--llm-latency', type=float, default=0.2,
+                        help='Seconds per fake LLM response')
+    parser.add_argument('--analyze-entries', type=int, default=5,
+                        help='Entries analyzed by analyze_entry')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--only', help='Comma-separated subset of: ' + ', '.join(BENCHMARKS))
+    parser.add_argument('--output', help='Report path')
+    parser.add_argument('--compare', help='Previous report to compare against')
+    return parser.parse_args(argv)
+
+
+class Environment:
+    """
+    Fixture servers plus the config and week range every benchmark shares.
+    """
+
+    def __init__(self, args):
+        from src.aggregator.news_aggregator import NewsAggregator
+
+        self.args = args
+        self.workdir = tempfile.mkdtemp(prefix='aggregator-bench-')
+        probe = NewsAggregator({
+            'sources': {}, 'settings': {'cache_dir': self.path('probe'), 'incremental': False}
+        })
+        self.week_range = probe.current_week_range
+
+        documents = {}
+        self.feeds = []
+        for index in range(args.feeds):
+            name = f"feed{index}"
+            build = atom_feed if index % 2 == 0 else rss_feed
+            body = build(
+                name, self.week_range, args.items, args.in_window, args.sections, seed=index
+            )
+            documents[f"/{name}.xml"] = (body, 'application/xml')
+            self.feeds.append({
+                'name': f"Feed {index}",
+                'provider_name': ['github', 'terraform', 'openai', 'aws'][index % 4],
+                'content_type': 'markdown' if index % 2 == 0 else 'html', 'path': f"/{name}.xml",
+            })
+        self.pages = []
+        for index in range(args.pages):
+            name = f"page{index}"
+            documents[f"/{name}.html"] = (
+                manual_page(name, self.week_range, args.page_sections, seed=index), 'text/html'
+            )
+            self.pages.append({
+                'name': f"Page {index}", 'provider_name': 'anthropic', 'manual': True,
+                'content_type': 'html', 'path': f"/{name}.html",
+            })
+
+        self.fixtures = FixtureServer(documents, args.feed_latency)
+        self.llm = FakeLLMServer(args.llm_latency)
+        os.environ['ANTHROPIC_BASE_URL'] = self.llm.url
+        os.environ['ANTHROPIC_API_KEY'] = 'bench-key'
+        os.environ['NO_PROXY'] = '127.0.0.1'
+        for source in self.feeds + self.pages:
+            source['url'] = self.fixtures.url + source.pop('path')
+
+    def path(self, *parts):
+        return os.path.join(self.workdir, *parts)
+
+    def config(self, cache_dir):
+        return {
+            'sources': {
+                'devops_tools': [dict(source) for source in self.feeds],
+                'ai_tools': [dict(source) for source in self.pages],
+            },
+            'settings': {
+                'cache_dir': cache_dir,
+                'cache_duration': 3600,
+                'html_mode': 'sharded',
+                'markdown': {'workers': 1},
+                'analysis': {
+                    'max_workers': 8, 'requests_per_minute': 100000,
+                    'tokens_per_minute': 100000000,
+                },
+            },
+        }
+
+    def fresh_dir(self, name):
+        path = self.path(name)
+        shutil.rmtree(path, ignore_errors=True)
+        return path
+
+    def close(self):
+        self.fixtures.close()
+        self.llm.close()
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+def _analyzed(entries):
+    for entry in entries:
+        entry.setdefault('analysis', {
+            'summary': f"Summary of {entry.get('title')}", 'impact_level': 'MEDIUM',
+            'categories': ['Devops Tools'], 'key_changes': ['Change'], 'new_features': ['Feature'],
+        })
+    return entries
+
+
+def _run_end_to_end(env, cache_dir, output_dir):
+    from run_aggregator import build_analyzer
+    from src.aggregator.news_aggregator import NewsAggregator, entry_sort_key
+    from src.output import generate_html, generate_rss
+    from src.output.feed_writer import FeedWriter
+    from src.output.markdown_renderer import MarkdownRenderer
+    from src.pipeline import build_pipeline
+
+    config = env.config(cache_dir)
+    aggregator = NewsAggregator(config)
+    entries = []
+
+    def collect(stream):
+        for entry in stream:
+            entries.append(entry)
+            yield entry
+
+    renderer = MarkdownRenderer.from_config(config)
+    generate_html(
+        collect(build_pipeline(aggregator, config, build_analyzer(config))),
+        aggregator.current_week_range, '', [], [],
+        output_dir=output_dir, markdown_renderer=renderer, mode='sharded'
+    )
+    renderer.close()
+    entries.sort(key=entry_sort_key, reverse=True)
+    feed_writer = FeedWriter.from_config(config, output_dir)
+    generate_rss(entries, aggregator.current_week_range, feed_writer=feed_writer)
+    return len(entries)
+
+
+def _analyze(entries):
+    from src.analysis.analyze_with_claude import analyze_entry
+
+    for entry in entries:
+        analyze_entry(entry['content'], entry['source_name'], entry['title'], 'bench-key',
+                      source_type=entry.get('source_type'))
+    return len(entries)
+
+
+def _warm_cache(env):
+    cache_dir = env.path('warm-cache')
+    if not os.path.exists(cache_dir):
+        _run_end_to_end(env, cache_dir, env.path('warm-output'))
+    return cache_dir
+
+
+def make_benchmarks(env):
+    """
+    Return name -> (setup, run) pairs; setup runs untimed before every repeat.
+    """
+    from src.aggregator.feed_fetcher import fetch_rss_entries
+    from src.aggregator.manual_fetcher import fetch_manual_entries
+    from src.aggregator.news_aggregator import NewsAggregator
+    from src.output import generate_html, generate_rss
+    from src.output.feed_writer import FeedWriter
+
+    state = {}
+
+    def sample_entries():
+        if 'entries' not in state:
+            aggregator = NewsAggregator(env.config(env.fresh_dir('sample')))
+            state['entries'] = _analyzed(aggregator.aggregate())
+        return [dict(entry) for entry in state['entries']]
+
+    def fetch_rss():
+        return sum(len(fetch_rss_entries(s['url'], env.week_range, s)) for s in env.feeds)
+
+    def fetch_manual():
+        return sum(len(fetch_manual_entries(s, env.week_range)) for s in env.pages)
+
+    def aggregate(aggregator):
+        return len(aggregator.aggregate())
+
+    def html(entries):
+        output_dir = env.fresh_dir('html')
+        generate_html(iter(entries), env.week_range, '', [], [],
+                      output_dir=output_dir, mode='sharded')
+        return len(entries)
+
+    def rss(entries):
+        output_dir = env.fresh_dir('rss')
+        feed_writer = FeedWriter(output_dir, state_path=os.path.join(output_dir, 'feed_items.json'))
+        generate_rss(entries, env.week_range, feed_writer=feed_writer)
+        return len(entries)
+
+    return {
+        'fetch_rss_entries': (lambda: (), fetch_rss),
+        'fetch_manual_entries': (lambda: (), fetch_manual),
+        'aggregate': (
+            lambda: (NewsAggregator(env.config(env.fresh_dir('aggregate'))),), aggregate
+        ),
+        'analyze_entry': (lambda: (sample_entries()[:env.args.analyze_entries],), _analyze),
+        'generate_html': (lambda: (sample_entries(),), html),
+        'generate_rss': (lambda: (sample_entries(),), rss),
+        'end_to_end_cold': (
+            lambda: (env.fresh_dir('cold-cache'), env.fresh_dir('cold-output')),
+            lambda cache_dir, output_dir: _run_end_to_end(env, cache_dir, output_dir)
+        ),
+        'end_to_end_warm': (
+            lambda: (_warm_cache(env), env.path('warm-output')),
+            lambda cache_dir, output_dir: _run_end_to_end(env, cache_dir, output_dir)
+        ),
+    }
+
+
+def run(args):
+    env = Environment(args)
+    benchmarks = make_benchmarks(env)
+    selected = args.only.split(',') if args.only else BENCHMARKS
+    results = {}
+    try:
+        for name in selected:
+            setup, body = benchmarks[name]
+            timings = []
+            items = None
+            for _ in range(args.repeat):
+                setup_args = setup()
+                started = time.perf_counter()
+                items = body(*setup_args)
+                timings.append(time.perf_counter() - started)
+            results[name] = {
+                'runs': timings,
+                'min': min(timings),
+                'median': statistics.median(timings),
+                'mean': statistics.mean(timings),
+                'items': items,
+            }
+            print(f"{name:<22} median {results[name]['median'] * 1000:10.1f} ms  "
+                  f"min {results[name]['min'] * 1000:10.1f} ms  items {items}")
+        llm_requests = env.llm.requests
+    finally:
+        env.close()
+    return results, llm_requests
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def compare(report, previous_path):
+    with open(previous_path, encoding='utf-8') as f:
+        previous = json.load(f)
+    print(f"\nCompared with {previous.get('commit')} ({previous_path}):")
+    for name, result in report['results'].items():
+        before = previous.get('results', {}).get(name)
+        if not before:
+            continue
+        ratio = result['median'] / before['median'] if before['median'] else float('inf')
+        print(f"  {name:<22} {before['median'] * 1000:10.1f} ms -> "
+              f"{result['median'] * 1000:10.1f} ms  x{ratio:.2f}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    os.chdir(ROOT)
+
+    results, llm_requests = run(args)
+    commit = _git_commit()
+    report = {
+        'commit': commit,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parameters': {
+            key: value for key, value in vars(args).items() if key not in ('output', 'compare')
+        },
+        'llm_requests': llm_requests,
+        'results': results,
+    }
+    output = args.output or os.path.join(
+        ROOT, 'benchmarks', 'results', f"{commit}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == '__main__':
+    main()
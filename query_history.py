@@ -0,0 +1,98 @@
+# query_history.py
+"""
+Query the archive of every entry the aggregator has published.
+
+Examples:
+    python query_history.py --source azurerm --breaking --limit 1
+    python query_history.py "oidc OR workload identity" --provider github --since 2024-01-01
+    python query_history.py --impact high --category Security --json
+    python query_history.py terraform-provider-azurerm --since 2024-06-01
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import date
+
+from src.aggregator.config_loader import load_config
+from src.output.history import HistoryArchive
+
+
+def iso_date(value):
+    """
+    argparse type for YYYY-MM-DD dates.
+    """
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an ISO date (YYYY-MM-DD): {value!r}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Search archived DevOps platform updates.",
+        epilog=__doc__.split('Examples:')[1],
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        'text', nargs='?',
+        help='Full-text query (FTS5 syntax; words with punctuation match as phrases)'
+    )
+    parser.add_argument('--provider', help='Provider name, e.g. azure, github, openai')
+    parser.add_argument('--source', help='Part of the source name, e.g. azurerm')
+    parser.add_argument('--impact', choices=['high', 'medium', 'low'], type=str.lower)
+    parser.add_argument('--category', help='Analysis category, e.g. Security, CI/CD')
+    parser.add_argument('--since', type=iso_date, help='Published on or after this ISO date')
+    parser.add_argument('--until', type=iso_date, help='Published before this ISO date')
+    parser.add_argument('--breaking', action='store_true',
+                        help='Only entries with breaking changes')
+    parser.add_argument('--security', action='store_true',
+                        help='Only entries with security updates')
+    parser.add_argument('--limit', type=int, default=50)
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    parser.add_argument('--db', help='Archive path (default: settings.history.db_path)')
+    parser.add_argument('--config', default='config.yml')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.db:
+        archive = HistoryArchive(args.db)
+    else:
+        archive = HistoryArchive.from_config(load_config(args.config))
+
+    started = time.perf_counter()
+    results = archive.query(
+        text=args.text,
+        provider=args.provider,
+        source=args.source,
+        impact=args.impact,
+        category=args.category,
+        since=args.since,
+        until=args.until,
+        breaking=args.breaking,
+        security=args.security,
+        limit=args.limit
+    )
+    elapsed = (time.perf_counter() - started) * 1000
+    archive.close()
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+
+    for result in results:
+        published = (result['published'] or '')[:10]
+        source = result['source_name'] or result['provider']
+        print(f"{published}  {result['impact'] or '-':<6}  {source}")
+        print(f"    {result['title']}")
+        print(f"    {result['link']}")
+        for change in result['breaking_changes'] if args.breaking else []:
+            print(f"    ! {change}")
+    print(f"{len(results)} result(s) in {elapsed:.1f} ms", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
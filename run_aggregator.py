@@ -1,31 +1,118 @@
 # run_aggregator.py
+import argparse
 import os
 from src.logger import setup_logging
 from src.aggregator.config_loader import load_config
-from src.aggregator.news_aggregator import NewsAggregator
+from src.aggregator.news_aggregator import NewsAggregator, entry_sort_key
+from src.metrics import get_metrics, write_run_metrics
+from src.pipeline import build_pipeline
 from src.output import generate_html, generate_rss
+from src.output.feed_writer import FeedWriter
+from src.output.history import HistoryArchive
+from src.output.markdown_renderer import MarkdownRenderer
 import logging
 
-def main():
+
+def build_analyzer(config):
+    """
+    Return the configured analyzer, or None when no API key is available.
+    """
+    api_key = os.environ.get('ANTHROPIC_API_KEY')
+    if not api_key:
+        logging.info("ANTHROPIC_API_KEY not set; skipping analysis")
+        return None
+
+    analysis_settings = (config.get('settings') or {}).get('analysis') or {}
+    if analysis_settings.get('mode', 'concurrent') == 'batch':
+        from src.analysis.batch import BatchAnalyzer
+        return BatchAnalyzer.from_config(api_key, config)
+
+    from src.analysis.executor import AnalysisExecutor
+    return AnalysisExecutor.from_config(api_key, config)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Aggregate DevOps platform updates into a weekly digest."
+    )
+    parser.add_argument('--config', default='config.yml')
+    parser.add_argument(
+        '--daemon', action='store_true',
+        help='Stay resident, refresh on settings.daemon.refresh_interval '
+             'and serve a rebuild endpoint'
+    )
+    parser.add_argument(
+        '--profile', nargs='?', const='', metavar='DIR',
+        help='Profile the run (cProfile + per-stage tracemalloc); '
+             'defaults to settings.metrics.profile_dir'
+    )
+    return parser.parse_args(argv)
+
+
+def write_outputs(config, stream, week_range, markdown_renderer):
+    """
+    Write the HTML digest, feeds and history archive; returns the entries newest first.
+    """
+    entries = []
+
+    def collect(stream):
+        for entry in stream:
+            entries.append(entry)
+            yield entry
+
+    # The HTML digest consumes entries as they are analyzed
+    generate_html(
+        collect(stream),
+        week_range,
+        "Raw updates from various sources",  # Simple summary
+        [],  # No action items for now
+        [],  # No additional resources for now
+        markdown_renderer=markdown_renderer,
+        mode=(config.get('settings') or {}).get('html_mode', 'full')
+    )
+    entries.sort(key=entry_sort_key, reverse=True)
+    logging.info(f"Total entries processed: {len(entries)}")
+    generate_rss(entries, week_range, feed_writer=FeedWriter.from_config(config))
+
+    # Keep every published entry searchable with query_history.py
+    if ((config.get('settings') or {}).get('history') or {}).get('enabled', True):
+        history = HistoryArchive.from_config(config)
+        with get_metrics().stage('archive'):
+            history.record(entries, week_range)
+        history.close()
+    return entries
+
+
+def main(argv=None):
+    args = parse_args(argv)
     logger = setup_logging()
     logger.info("Starting DevOps Platform Updates Aggregator")
 
+    if args.daemon:
+        from src.daemon import AggregatorDaemon
+        AggregatorDaemon(args.config, build_analyzer, write_outputs).serve_forever()
+        return
+
     # Load configuration
-    config = load_config()
+    config = load_config(args.config)
 
-    # Initialize aggregator
-    aggregator = NewsAggregator(config)
-    entries = aggregator.aggregate()
+    if args.profile is not None:
+        metrics_settings = (config.get('settings') or {}).get('metrics') or {}
+        get_metrics().enable_profiling(
+            args.profile or metrics_settings.get('profile_dir', '.cache/profile')
+        )
 
-    # Generate outputs with raw entries
-    generate_html(
-        entries,
+    # Initialize aggregator and stream entries through fetch -> analyze -> outputs
+    aggregator = NewsAggregator(config)
+    markdown_renderer = MarkdownRenderer.from_config(config)
+    write_outputs(
+        config,
+        build_pipeline(aggregator, config, build_analyzer(config)),
         aggregator.current_week_range,
-        "Raw updates from various sources",  # Simple summary
-        [],  # No action items for now
-        []   # No additional resources for now
+        markdown_renderer
     )
-    generate_rss(entries, aggregator.current_week_range)
+    markdown_renderer.close()
+    write_run_metrics(config)
 
     logger.info("DevOps Platform Updates Aggregator completed successfully.")
 
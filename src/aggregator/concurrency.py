@@ -0,0 +1,63 @@
+# src/aggregator/concurrency.py
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+
+def host_of(url):
+    """
+    Return the lower-cased host of a URL, used as the concurrency key.
+    """
+    return (urlparse(url).hostname or '').lower()
+
+
+class HostLimiter:
+    """
+    Caps the number of in-flight requests per host.
+
+    Most configured feeds live on github.com, so a global pool size alone
+    would still let every worker hit the same host at once.
+    """
+
+    def __init__(self, max_per_host=4):
+        self.max_per_host = max(1, int(max_per_host))
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, host):
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._semaphores[host]
+
+    @contextmanager
+    def limit(self, url):
+        semaphore = self._semaphore(host_of(url))
+        with semaphore:
+            yield
+
+
+class HostThrottle:
+    """
+    Spaces out requests to the same host by at least ``delay`` seconds.
+
+    Each caller reserves the next free slot for its host and sleeps outside
+    the lock, so waiting on one host never blocks requests to another.
+    """
+
+    def __init__(self, delay=0.0):
+        self.delay = max(0.0, float(delay))
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        if not self.delay:
+            return
+        host = host_of(url)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.delay
+        if slot > now:
+            time.sleep(slot - now)
@@ -0,0 +1,273 @@
+# src/aggregator/crawler.py
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urldefrag, urljoin, urlparse
+
+import pytz
+import requests
+
+from .concurrency import HostThrottle, host_of
+from .entry import Entry
+from .html_parsing import compile_selectors, resolve_parser, select_content, select_first
+from .http_cache import fetch
+
+# Page-level publication dates, most specific first
+PAGE_DATE_SELECTORS = (
+    'meta[name="ms.date"]', 'meta[property="article:published_time"]', 'meta[name="date"]',
+    'meta[itemprop="datePublished"]',
+)
+
+_MONTHS = {
+    name: index for index, names in enumerate([
+        ('january', 'jan'), ('february', 'feb'), ('march', 'mar'), ('april', 'apr'), ('may',),
+        ('june', 'jun'), ('july', 'jul'), ('august', 'aug'), ('september', 'sep', 'sept'),
+        ('october', 'oct'), ('november', 'nov'), ('december', 'dec'),
+    ], start=1) for name in names
+}
+_ISO_DATE = re.compile(r'\b(\d{4})-(\d{2})-(\d{2})(?:[T ][\d:.]+(?:Z|[+-]\d{2}:?\d{2})?)?\b')
+_US_DATE = re.compile(r'\b(\d{1,2})/(\d{1,2})/(\d{4})\b')
+_TEXT_DATE = re.compile(r'\b([A-Za-z]{3,9})\.? (\d{1,2})(?:st|nd|rd|th)?,? (\d{4})\b')
+
+
+def _iso_date(text):
+    match = _ISO_DATE.search(text)
+    if match:
+        try:
+            parsed = datetime.fromisoformat(match.group(0).replace('Z', '+00:00').replace(' ', 'T'))
+        except ValueError:
+            return None
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=pytz.UTC)
+    return None
+
+
+def _month_name_date(text):
+    for match in _TEXT_DATE.finditer(text):
+        month = _MONTHS.get(match.group(1).lower())
+        if month:
+            try:
+                return datetime(int(match.group(3)), month, int(match.group(2)), tzinfo=pytz.UTC)
+            except ValueError:
+                continue
+    return None
+
+
+def _us_date(text):
+    match = _US_DATE.search(text)
+    if match:
+        month, day, year = (int(group) for group in match.groups())
+        try:
+            return datetime(year, month, day, tzinfo=pytz.UTC)
+        except ValueError:
+            return None
+    return None
+
+
+def parse_date_text(text):
+    """
+    Find the first ISO, M/D/YYYY or "Month D, YYYY" date in text; returns a UTC datetime or None.
+    """
+    if not text:
+        return None
+    for parse in (_iso_date, _month_name_date, _us_date):
+        parsed = parse(text)
+        if parsed:
+            return parsed
+    return None
+
+
+def _element_date(element):
+    # A machine-readable <time>, the element itself or inside it
+    selector = compile_selectors(('time[datetime]',))[0]
+    time_element = element if selector.match(element) else selector.select_one(element)
+    if time_element is not None:
+        parsed = parse_date_text(time_element['datetime'])
+        if parsed:
+            return parsed
+    return None
+
+
+def page_date(soup):
+    """
+    Publication date of a whole page from its metadata, first <time> or title.
+    """
+    for selector in PAGE_DATE_SELECTORS:
+        element = select_first((selector,), soup)
+        parsed = parse_date_text(element.get('content')) if element is not None else None
+        if parsed:
+            return parsed
+    parsed = _element_date(soup)
+    if parsed:
+        return parsed
+    heading = select_first(('h1', 'title'), soup)
+    return parse_date_text(heading.get_text(' ', strip=True)) if heading is not None else None
+
+
+def split_sections(root, heading_selector):
+    """
+    Split a content element into (heading, [heading and following siblings]) sections.
+
+    A section runs from one matching heading to the next; content before the
+    first heading is dropped. Without headings the whole element is one section.
+    """
+    selector = compile_selectors((heading_selector,))[0]
+    headings = selector.select(root)
+    if not headings:
+        return [(None, [root])]
+    sections = []
+    for heading in headings:
+        elements = [heading]
+        for sibling in heading.find_next_siblings():
+            if selector.match(sibling) or selector.select_one(sibling) is not None:
+                break
+            elements.append(sibling)
+        sections.append((heading, elements))
+    return sections
+
+
+class _Crawl:
+    """
+    State of one crawl: settings, throttle and the fetch/parse of single pages.
+    """
+
+    def __init__(self, source, current_week_range, http_cache, parser):
+        settings = source.get('crawl') or {}
+        self.source = source
+        self.current_week_range = current_week_range
+        self.http_cache = http_cache
+        self.parser = resolve_parser(parser)
+        self.provider = source.get('provider_name', '').lower()
+        self.depth = settings.get('depth', 1)
+        self.link_selector = settings.get('link_selector', 'a[href]')
+        self.max_pages = settings.get('max_pages', 20)
+        self.max_workers = max(1, settings.get('max_workers', 4))
+        self.same_host = settings.get('same_host', True)
+        self.include_root = settings.get('include_root', self.depth == 0)
+        self.content_selector = settings.get('content_selector')
+        self.section_selector = settings.get('section_selector', 'h2')
+        self.throttle = HostThrottle(settings.get('delay', 0.5))
+
+    def crawl(self):
+        """
+        Breadth-first crawl; pages of one level are fetched concurrently.
+        """
+        root = urldefrag(self.source['url'])[0]
+        visited = {root}
+        frontier = [root]
+        entries = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for level in range(self.depth + 1):
+                if not frontier:
+                    break
+                want_entries = level > 0 or self.include_root
+                want_links = level < self.depth
+                results = executor.map(
+                    lambda url: self.page(url, want_entries, want_links), frontier
+                )
+                frontier = []
+                for page_entries, links in results:
+                    entries.extend(page_entries)
+                    for link in links:
+                        if link not in visited and len(visited) < self.max_pages:
+                            visited.add(link)
+                            frontier.append(link)
+        logging.info(f"Crawled {len(visited)} pages from {root}: {len(entries)} entries in range")
+        return entries
+
+    def page(self, url, want_entries=True, want_links=True):
+        """
+        Fetch one page; return (entries in the window, links to follow).
+        """
+        from bs4 import BeautifulSoup
+
+        self.throttle.wait(url)
+        try:
+            response = fetch(url, self.http_cache)
+        except requests.RequestException as e:
+            logging.error(f"Failed to fetch crawled page: {url} - {e}")
+            return [], []
+
+        soup = BeautifulSoup(response.body, self.parser)
+        links = self.links(soup, url) if want_links else []
+        entries = self.entries(soup, url) if want_entries else []
+        return entries, links
+
+    def links(self, soup, page_url):
+        links = []
+        for anchor in compile_selectors((self.link_selector,))[0].select(soup):
+            href = anchor.get('href')
+            if not href:
+                continue
+            link = urldefrag(urljoin(page_url, href))[0]
+            if urlparse(link).scheme not in ('http', 'https'):
+                continue
+            if self.same_host and host_of(link) != host_of(page_url):
+                continue
+            if link not in links:
+                links.append(link)
+        return links
+
+    def entries(self, soup, page_url):
+        """
+        Split a page into one dated entry per section.
+
+        A section's own <time> or a date in its heading wins; otherwise the
+        page date applies. Sections without any date are skipped rather than
+        stamped with the current time.
+        """
+        default_date = page_date(soup)
+        if self.content_selector:
+            roots = compile_selectors((self.content_selector,))[0].select(soup)
+        else:
+            roots = select_content(soup, self.provider)
+
+        content_type = self.source.get('content_type', 'html')
+        start, end = self.current_week_range
+        entries = []
+        for root in roots:
+            for heading, elements in split_sections(root, self.section_selector):
+                title = heading.get_text(' ', strip=True) if heading is not None else None
+                published = None
+                for element in elements:
+                    published = _element_date(element)
+                    if published:
+                        break
+                published = published or parse_date_text(title) or default_date
+                if published is None:
+                    logging.debug(f"Skipping undated section '{title}' on {page_url}")
+                    continue
+                if not start <= published < end:
+                    continue
+
+                if content_type == 'plain':
+                    content = '\n\n'.join(
+                        element.get_text(separator='\n\n', strip=True) for element in elements
+                    )
+                else:
+                    content = ''.join(str(element) for element in elements)
+                anchor = heading.get('id') if heading is not None else None
+                entries.append(Entry(
+                    title=title or self.source.get('name', 'No Title'),
+                    link=f"{page_url}#{anchor}" if anchor else page_url,
+                    content=content,
+                    content_type=content_type,
+                    published=published,
+                    provider_name=self.source.get('provider_name', 'Unknown Platform'),
+                    source_name=self.source.get('name', 'Unknown Source')
+                ))
+        return entries
+
+
+def crawl_manual_entries(source, current_week_range, http_cache=None, parser='auto'):
+    """
+    Crawl a manual source and its linked pages into per-section entries.
+
+    ``source['crawl']`` configures the crawl: ``link_selector`` and ``depth``
+    choose the pages to follow (``max_pages`` in total, same host only unless
+    ``same_host: false``), ``max_workers`` fetches pages of one level
+    concurrently, ``delay`` spaces requests to one host, and
+    ``section_selector`` (default ``h2``) splits each page's content, found
+    via ``content_selector`` or the provider's rules, into entries.
+    """
+    return _Crawl(source, current_week_range, http_cache, parser).crawl()
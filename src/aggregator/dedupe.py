@@ -0,0 +1,146 @@
+# src/aggregator/dedupe.py
+import hashlib
+import logging
+import re
+from urllib.parse import urlparse
+
+from src.metrics import get_metrics
+
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3
+# Eight 8-bit bands: fingerprints within 7 bits of each other always agree on
+# at least one band, so only entries sharing a band are compared in full.
+_BANDS = 8
+_BAND_BITS = SIMHASH_BITS // _BANDS
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_WORD_RE = re.compile(r'\w+')
+
+
+def _tokens(entry):
+    text = f"{entry.get('title', '')} {entry.get('content', '')}"
+    return _WORD_RE.findall(_TAG_RE.sub(' ', text).lower())
+
+
+def shingles(tokens):
+    """
+    Return the set of hashed word shingles of a token list.
+    """
+    if len(tokens) < SHINGLE_SIZE:
+        grams = [' '.join(tokens)]
+    else:
+        count = len(tokens) - SHINGLE_SIZE + 1
+        grams = [' '.join(tokens[i:i + SHINGLE_SIZE]) for i in range(count)]
+    return {
+        int.from_bytes(hashlib.blake2b(gram.encode('utf-8'), digest_size=8).digest(), 'big')
+        for gram in grams
+    }
+
+
+def simhash(shingle_set):
+    """
+    Compute a 64-bit SimHash over hashed shingles.
+    """
+    if not shingle_set:
+        return 0
+    # Count set bits per position column-wise on binary strings; this keeps the
+    # per-shingle work in C instead of a 64-step Python loop.
+    columns = zip(*(format(value, '064b') for value in shingle_set))
+    half = len(shingle_set) / 2
+    return int(''.join('1' if column.count('1') > half else '0' for column in columns), 2)
+
+
+def _similarity(first, second):
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def _link_key(entry):
+    # Only links that identify one entry: feed permalinks (entries with a guid)
+    # and section anchors. Manual and crawled sections without an anchor all
+    # link to their page, so they must match on text instead.
+    link = entry.get('link')
+    if not link or link == '#':
+        return None
+    if entry.get('guid') or urlparse(link).fragment:
+        return link
+    return None
+
+
+def _bands(fingerprint):
+    mask = (1 << _BAND_BITS) - 1
+    return [(index, fingerprint >> (index * _BAND_BITS) & mask) for index in range(_BANDS)]
+
+
+class DuplicateIndex:
+    """
+    Incremental index of entries for near-duplicate lookups.
+
+    Entries match when their entry-specific links (feed permalinks or section
+    anchors) are equal or, for entries whose SimHash fingerprints share a band,
+    when the Jaccard similarity of their word shingles is at least ``threshold``.
+    """
+
+    def __init__(self, threshold=0.8):
+        self.threshold = threshold
+        self._shingles = []
+        self._band_index = {}
+        self._link_index = {}
+
+    def add(self, entry):
+        """
+        Index an entry and return its position plus the positions it duplicates.
+        """
+        index = len(self._shingles)
+        shingle_set = shingles(_tokens(entry))
+        self._shingles.append(shingle_set)
+
+        matches = set()
+        link = _link_key(entry)
+        if link:
+            matches.update(self._link_index.get(link, []))
+            self._link_index.setdefault(link, []).append(index)
+
+        neighbours = set()
+        for band in _bands(simhash(shingle_set)):
+            neighbours.update(self._band_index.get(band, []))
+            self._band_index.setdefault(band, []).append(index)
+        matches.update(
+            other for other in neighbours
+            if _similarity(shingle_set, self._shingles[other]) >= self.threshold
+        )
+        return index, matches
+
+
+def iter_unique_entries(entries, threshold=0.8):
+    """
+    Collapse near-duplicate entries into one canonical entry per group.
+
+    The first entry of each group is yielded as the canonical one; later
+    duplicates are appended to its ``duplicates`` list instead of being yielded.
+    """
+    metrics = get_metrics()
+    index = DuplicateIndex(threshold)
+    canonical = {}
+    for entry in entries:
+        with metrics.stage('dedupe'):
+            position, matches = index.add(entry)
+        if matches:
+            first = canonical[min(matches)]
+            canonical[position] = first
+            first.setdefault('duplicates', []).append(_reference(entry))
+            metrics.increment('entries_merged', stage='dedupe')
+            logging.info(f"Merged duplicate into: {first.get('title')}")
+            continue
+        canonical[position] = entry
+        yield entry
+
+
+def _reference(entry):
+    return {
+        'title': entry.get('title', 'No Title'),
+        'link': entry.get('link', '#'),
+        'source_name': entry.get('source_name', 'Unknown Source'),
+        'provider_name': entry.get('provider_name', ''),
+    }
@@ -0,0 +1,168 @@
+# src/aggregator/entry.py
+import sys
+from collections.abc import MutableMapping
+from datetime import datetime
+
+import pytz
+
+EPOCH = datetime.min.replace(tzinfo=pytz.UTC)
+
+# Values shared by every entry of a source are interned, so thousands of
+# entries point at one string instead of one copy each
+_INTERNED = frozenset({'provider_name', 'source_name', 'source_type', 'content_type'})
+
+# Keys stored in slots; anything else goes to a small overflow dict
+_SLOT_KEYS = (
+    'title', 'link', 'guid', 'provider_name', 'source_name', 'source_type', 'content_type',
+    'status_url', 'entry_id', 'content_hash', 'status', 'analysis', 'duplicates',
+)
+
+
+def parse_published(value):
+    """
+    Return a timezone-aware datetime for an ISO string or datetime, or None.
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=pytz.UTC)
+    return parsed
+
+
+def utc_iso(value):
+    """
+    Return an ISO string or datetime as a UTC ISO string, or None if it is missing or invalid.
+
+    Stores compare ``published`` as text, which is only chronological when
+    every value carries the same offset.
+    """
+    try:
+        parsed = parse_published(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed.astimezone(pytz.UTC).isoformat() if parsed is not None else None
+
+
+class Entry(MutableMapping):
+    """
+    One aggregated update.
+
+    Fields live in ``__slots__``; provider, source and type names are
+    interned. ``published`` is parsed once into ``published_at`` (a native
+    datetime that doubles as the sort key) and content is held as UTF-8 bytes
+    and decoded on access.
+
+    Entries also behave as a mutable mapping with the historical dict keys,
+    so stores, templates and analysis code can keep using ``entry.get(...)``;
+    ``published`` reads back as an ISO string there. ``to_dict()`` returns a
+    plain JSON-serializable dict.
+    """
+
+    __slots__ = ('published_at', '_content', '_extra') + _SLOT_KEYS
+
+    def __init__(self, title=None, link=None, content='', published=None, **fields):
+        for key in _SLOT_KEYS:
+            object.__setattr__(self, key, None)
+        self._extra = None
+        self.title = title
+        self.link = link
+        self.content = content
+        self.published = published
+        for key, value in fields.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build an entry from a plain dict, e.g. one loaded from JSON.
+        """
+        if isinstance(data, cls):
+            return data
+        return cls(**data)
+
+    @property
+    def content(self):
+        return self._content.decode('utf-8')
+
+    @content.setter
+    def content(self, value):
+        if isinstance(value, bytes):
+            self._content = value
+        else:
+            self._content = str('' if value is None else value).encode('utf-8')
+
+    @property
+    def published(self):
+        return self.published_at.isoformat() if self.published_at else None
+
+    @published.setter
+    def published(self, value):
+        self.published_at = parse_published(value)
+
+    @property
+    def sort_key(self):
+        return self.published_at or EPOCH
+
+    def __setattr__(self, key, value):
+        if key in _INTERNED and isinstance(value, str):
+            value = sys.intern(value)
+        object.__setattr__(self, key, value)
+
+    # Mapping view: a key is present when its value is not None
+
+    def __getitem__(self, key):
+        if key in _SLOT_KEYS or key in ('content', 'published'):
+            value = getattr(self, key)
+        elif self._extra is not None and key in self._extra:
+            value = self._extra[key]
+        else:
+            raise KeyError(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if key in _SLOT_KEYS or key in ('content', 'published'):
+            setattr(self, key, value)
+            return
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in _SLOT_KEYS or key == 'published':
+            if getattr(self, key) is None:
+                raise KeyError(key)
+            setattr(self, key, None)
+        elif key == 'content':
+            self._content = b''
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        for key in _SLOT_KEYS[:2]:
+            if getattr(self, key) is not None:
+                yield key
+        yield 'content'
+        if self.published_at is not None:
+            yield 'published'
+        for key in _SLOT_KEYS[2:]:
+            if getattr(self, key) is not None:
+                yield key
+        if self._extra:
+            yield from list(self._extra)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"Entry({self.title!r}, {self.published!r}, provider={self.provider_name!r})"
+
+    def to_dict(self):
+        return dict(self.items())
@@ -0,0 +1,151 @@
+# src/aggregator/entry_store.py
+import hashlib
+import json
+import logging
+from datetime import datetime
+
+import pytz
+
+from src.utils.storage import SQLiteStore
+from .entry import utc_iso
+
+ENTRY_NEW = 'new'
+ENTRY_CHANGED = 'changed'
+ENTRY_UNCHANGED = 'unchanged'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    entry_id TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    published TEXT,
+    analysis TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+)
+"""
+
+
+def entry_identity(entry):
+    """
+    Return a stable identity for an entry.
+
+    Feed entries carry a guid; manual entries share their page URL, so the
+    title is appended to keep sections of the same page apart.
+    """
+    if entry.get('guid'):
+        return entry['guid']
+    return f"{entry.get('link', '')}#{entry.get('title', '')}"
+
+
+def content_hash(entry):
+    """
+    Hash the parts of an entry that downstream analysis depends on.
+    """
+    digest = hashlib.sha256()
+    for key in ('title', 'content'):
+        digest.update(str(entry.get(key, '')).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class EntryStore(SQLiteStore):
+    """
+    SQLite store of previously aggregated entries and their analysis.
+
+    Only what classification needs is kept: identity, content hash, publication
+    date for pruning and the saved analysis. ``published`` is stored as a UTC
+    ISO string so that it orders correctly as text.
+    """
+
+    def __init__(self, db_path):
+        super().__init__(db_path, _SCHEMA)
+        with self._lock, self._conn:
+            self._drop_entry_data()
+            self._normalize_published()
+
+    def _drop_entry_data(self):
+        # Older stores kept a never-read JSON copy of every entry in a NOT NULL column
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(entries)")}
+        if 'data' in columns:
+            self._conn.execute("ALTER TABLE entries DROP COLUMN data")
+
+    def _normalize_published(self):
+        # Rows written before published was normalized may carry other offsets
+        rows = self._conn.execute(
+            "SELECT entry_id, published FROM entries "
+            "WHERE published IS NOT NULL AND published NOT LIKE '%+00:00'"
+        ).fetchall()
+        self._conn.executemany(
+            "UPDATE entries SET published = ? WHERE entry_id = ?",
+            [(utc_iso(published), entry_id) for entry_id, published in rows]
+        )
+
+    def sync(self, entries):
+        """
+        Record fetched entries and classify them as new, changed or unchanged.
+
+        Unchanged entries pick up any analysis saved by a previous run, so it
+        does not have to be recomputed. Every returned entry carries
+        ``entry_id``, ``content_hash`` and ``status`` keys.
+        """
+        now = datetime.now(pytz.UTC).isoformat()
+        synced = []
+
+        with self._lock, self._conn:
+            for entry in entries:
+                entry_id = entry_identity(entry)
+                digest = content_hash(entry)
+                row = self._conn.execute(
+                    "SELECT content_hash, analysis FROM entries WHERE entry_id = ?",
+                    (entry_id,)
+                ).fetchone()
+
+                if row and row[0] == digest:
+                    if row[1] and 'analysis' not in entry:
+                        entry['analysis'] = json.loads(row[1])
+                    entry.update(entry_id=entry_id, content_hash=digest, status=ENTRY_UNCHANGED)
+                    self._conn.execute(
+                        "UPDATE entries SET last_seen = ? WHERE entry_id = ?", (now, entry_id)
+                    )
+                    synced.append(entry)
+                    continue
+
+                status = ENTRY_CHANGED if row else ENTRY_NEW
+                entry.update(entry_id=entry_id, content_hash=digest, status=status)
+                self._conn.execute(
+                    """
+                    INSERT INTO entries
+                        (entry_id, content_hash, published, first_seen, last_seen)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(entry_id) DO UPDATE SET
+                        content_hash = excluded.content_hash,
+                        published = excluded.published,
+                        analysis = NULL,
+                        last_seen = excluded.last_seen
+                    """,
+                    (entry_id, digest, utc_iso(entry.get('published')), now, now)
+                )
+                synced.append(entry)
+
+        return synced
+
+    def save_analysis(self, entry_id, analysis):
+        """
+        Attach an analysis result to a stored entry.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE entries SET analysis = ? WHERE entry_id = ?",
+                (json.dumps(analysis), entry_id)
+            )
+
+    def prune(self, before):
+        """
+        Drop entries published before the given datetime.
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE published < ?", (utc_iso(before),)
+            )
+        if cursor.rowcount:
+            logging.debug(f"Pruned {cursor.rowcount} entries older than {before}")
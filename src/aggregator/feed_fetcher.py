@@ -1,45 +1,50 @@
-import feedparser
+import html
+import requests
 from datetime import datetime
 import pytz
 import logging
+import xml.etree.ElementTree as ET
+from .entry import Entry
+from .html_parsing import html_to_text
+from .http_cache import fetch
+from .providers import provider_for_url
+from .stream_parser import UnsupportedFeed, iter_feed_items, safe_link
 
-def fetch_rss_entries(feed_url, current_week_range, source_config):
+
+def fetch_rss_entries(feed_url, current_week_range, source_config, http_cache=None):
     """
     Fetch and parse RSS/Atom feed entries.
+
+    Well-formed Atom/RSS documents go through the streaming parser, which skips
+    content outside the window and can stop early; anything it cannot handle
+    falls back to feedparser.
     """
     entries = []
     try:
-        feed = feedparser.parse(feed_url)
-        
-        if hasattr(feed, 'status') and feed.status >= 400:
-            logging.error(f"Failed to fetch feed from {feed_url} - Status: {feed.status}")
+        try:
+            response = fetch(feed_url, http_cache)
+        except requests.RequestException as e:
+            logging.error(f"Failed to fetch feed from {feed_url} - {e}")
             return entries
 
-        for entry in feed.entries:
+        max_entries = source_config.get('max_entries')
+        try:
+            items = list(iter_feed_items(
+                response.body,
+                current_week_range,
+                max_entries=max_entries,
+                date_ordered=source_config.get('date_ordered', True),
+                base_url=feed_url
+            ))
+        except (ET.ParseError, UnsupportedFeed) as e:
+            logging.debug(f"Falling back to feedparser for {feed_url}: {e}")
+            items = _parse_with_feedparser(response, feed_url, current_week_range, max_entries)
+
+        for item in items:
             try:
-                # Extract dates
-                entry_date = _parse_entry_date(entry)
-                if not entry_date:
-                    continue
-
-                # Only process if within date range
-                if current_week_range[0] <= entry_date < current_week_range[1]:
-                    # Extract content based on content type
-                    content = _extract_entry_content(entry, source_config.get('content_type', 'html'))
-                    
-                    # Create entry data
-                    entry_data = {
-                        'title': entry.get('title', 'No Title'),
-                        'link': entry.get('link', '#'),
-                        'published': entry_date.isoformat(),
-                        'content': content,
-                        'content_type': source_config.get('content_type', 'html'),
-                        'provider_name': source_config.get('provider_name', extract_provider_name(feed_url)),
-                        'source_name': source_config.get('name', 'Unknown Source')  # Add source name from config
-                    }
-                    
-                    entries.append(entry_data)
-                    logging.info(f"Added RSS entry: {entry_data['title']} from {feed_url}")
+                entry_data = _build_entry(item, feed_url, source_config)
+                entries.append(entry_data)
+                logging.info(f"Added RSS entry: {entry_data['title']} from {feed_url}")
 
             except Exception as e:
                 logging.error(f"Error processing entry from {feed_url}: {e}")
@@ -50,6 +55,68 @@ def fetch_rss_entries(feed_url, current_week_range, source_config):
     
     return entries
 
+
+def fetch_feed_source(source, current_week_range, http_cache=None, parser='auto'):
+    """
+    Registry entry point for feed sources; ``parser`` is unused for feeds.
+    """
+    return fetch_rss_entries(source['url'], current_week_range, source, http_cache)
+
+
+def _parse_with_feedparser(response, feed_url, current_week_range, max_entries=None):
+    """
+    Parse a feed with feedparser and return the items inside the date range.
+    """
+    # feedparser is only needed for feeds the streaming parser cannot handle
+    import feedparser
+
+    items = []
+    feed = feedparser.parse(
+        response.body,
+        response_headers={'content-location': feed_url, **response.headers}
+    )
+
+    for entry in feed.entries[:max_entries]:
+        try:
+            # Extract dates
+            entry_date = _parse_entry_date(entry)
+            if not entry_date:
+                continue
+
+            # Only process if within date range
+            if current_week_range[0] <= entry_date < current_week_range[1]:
+                items.append({
+                    'title': entry.get('title', 'No Title'),
+                    'link': safe_link(entry.get('link'), feed_url) or '#',
+                    'guid': entry.get('id', entry.get('link')),
+                    'published': entry_date,
+                    'content': _extract_entry_content(entry),
+                })
+
+        except Exception as e:
+            logging.error(f"Error processing entry from {feed_url}: {e}")
+            continue
+
+    return items
+
+
+def _build_entry(item, feed_url, source_config):
+    """
+    Create entry data from a parsed feed item.
+    """
+    # Format content based on content type
+    content_type = source_config.get('content_type', 'html')
+    return Entry(
+        title=item['title'],
+        link=item['link'],
+        guid=item['guid'],
+        published=item['published'],
+        content=_format_content(item['content'], content_type),
+        content_type=content_type,
+        provider_name=source_config.get('provider_name', provider_for_url(feed_url)),
+        source_name=source_config.get('name', 'Unknown Source')  # Add source name from config
+    )
+
 def _parse_entry_date(entry):
     """
     Parse the publication date from an entry.
@@ -60,23 +127,38 @@ def _parse_entry_date(entry):
         return datetime(*entry.updated_parsed[:6], tzinfo=pytz.UTC)
     return None
 
-def _extract_entry_content(entry, content_type):
+
+def _extract_entry_content(entry):
     """
-    Extract content from an entry while preserving specified format.
+    Extract the raw content of a feedparser entry.
     """
     content = ''
+    detail = None
     
     # Try different content fields
     if hasattr(entry, 'content'):
         if isinstance(entry.content, list):
-            content = entry.content[0].value
+            detail = entry.content[0]
+            content = detail.value
         else:
             content = entry.content
     elif hasattr(entry, 'summary'):
         content = entry.summary
+        detail = entry.get('summary_detail')
     elif hasattr(entry, 'description'):
         content = entry.description
-    
+
+    # feedparser sanitizes HTML but passes plain text through; escape it so
+    # it cannot inject markup, as the streaming parser does
+    if detail is not None and detail.get('type') == 'text/plain':
+        content = html.escape(content, quote=False)
+    return content
+
+
+def _format_content(content, content_type):
+    """
+    Convert extracted content while preserving specified format.
+    """
     # For markdown content, we want to preserve the original formatting
     # GitHub and some other platforms provide content in markdown format
     if content_type == 'markdown':
@@ -87,39 +169,7 @@ def _extract_entry_content(entry, content_type):
         pass
     elif content_type == 'plain':
         # For plain text, strip HTML tags if present
-        from bs4 import BeautifulSoup
-        if content:
-            content = BeautifulSoup(content, 'html.parser').get_text()
+        content = html_to_text(content)
     # For HTML content_type, keep the HTML as-is
     
     return content
-
-def extract_provider_name(feed_url):
-    """
-    Extract provider name from feed URL as fallback.
-    Only used if provider_name is not specified in source config.
-    """
-    # Extract domain from URL
-    domain = feed_url.split('//')[-1].split('/')[0].lower()
-    
-    # Handle known providers
-    if 'github' in domain:
-        return 'github'
-    elif 'gitlab' in domain:
-        return 'gitlab'
-    elif 'azure' in domain or 'microsoft' in domain:
-        return 'azure'
-    elif 'hashicorp' in domain:
-        return 'terraform'  # Default to terraform for HashiCorp
-    elif 'google' in domain:
-        return 'googlecloud'
-    elif 'anthropic' in domain:
-        return 'anthropic'
-    elif 'openai' in domain:
-        return 'openai'
-    elif 'aws' in domain or 'amazon' in domain:
-        return 'aws'
-    
-    # Remove www. and .com/.org/etc
-    provider = domain.replace('www.', '').split('.')[0]
-    return provider
@@ -0,0 +1,148 @@
+# src/aggregator/html_parsing.py
+import importlib.util
+from collections import namedtuple
+from functools import lru_cache
+from html.parser import HTMLParser
+
+from .providers import get_provider
+
+# Elements that never carry release-note content
+NOISE_TAGS = ['script', 'style', 'nav', 'header', 'footer']
+
+ProviderRule = namedtuple('ProviderRule', ['strainer', 'selectors', 'whole_page_fallback'])
+
+# Default to main content areas
+DEFAULT_CONTENT_TAGS = ('main', 'article')
+
+DATE_SELECTORS = ('time', '.date', '.published')
+TITLE_SELECTORS = ('h1', 'h2')
+
+
+@lru_cache(maxsize=None)
+def compile_selectors(selectors):
+    """
+    Compile a tuple of CSS selectors once per process.
+
+    bs4 and soupsieve are imported here rather than at module load, so
+    modules that only need html_to_text stay cheap to import.
+    """
+    import soupsieve
+    return [soupsieve.compile(selector) for selector in selectors]
+
+
+@lru_cache(maxsize=None)
+def provider_rule(provider):
+    """
+    Where a provider keeps its release notes, from the provider registry.
+
+    The strainer restricts the first parse to the relevant subtrees.
+    """
+    from bs4 import SoupStrainer
+
+    spec = get_provider(provider)
+    if spec is None or not spec.content_selectors:
+        return ProviderRule(
+            SoupStrainer(list(DEFAULT_CONTENT_TAGS)), compile_selectors(DEFAULT_CONTENT_TAGS), True
+        )
+    return ProviderRule(
+        SoupStrainer(list(spec.content_tags or DEFAULT_CONTENT_TAGS)),
+        compile_selectors(spec.content_selectors),
+        spec.whole_page_fallback
+    )
+
+
+def resolve_parser(name='auto'):
+    """
+    Return the BeautifulSoup parser backend to use.
+
+    ``auto`` picks lxml when it is installed and falls back to html.parser.
+    """
+    if name and name != 'auto':
+        return name
+    return 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+
+def select_first(selectors, element):
+    """
+    Return the first match of the first selector that matches anything.
+    """
+    for selector in compile_selectors(tuple(selectors)):
+        match = selector.select_one(element)
+        if match is not None:
+            return match
+    return None
+
+
+def find_content_elements(markup, provider, parser='auto'):
+    """
+    Parse a page and return the elements holding the provider's release notes.
+
+    Only the subtrees named by the provider's strainer are built first; the
+    whole page is parsed only if they contain no match.
+    """
+    from bs4 import BeautifulSoup
+
+    rule = provider_rule(provider)
+    parser = resolve_parser(parser)
+
+    elements = _select(BeautifulSoup(markup, parser, parse_only=rule.strainer), rule)
+    if elements:
+        return elements
+
+    soup = BeautifulSoup(markup, parser)
+    elements = _select(soup, rule)
+    if not elements and rule.whole_page_fallback:
+        elements = [soup]
+    return elements
+
+
+def select_content(soup, provider):
+    """
+    Return the elements of an already parsed page that hold the provider's release notes.
+    """
+    rule = provider_rule(provider)
+    elements = _select(soup, rule)
+    if not elements and rule.whole_page_fallback:
+        elements = [soup]
+    return elements
+
+
+def _select(soup, rule):
+    for element in soup(NOISE_TAGS):
+        element.decompose()
+    for selector in rule.selectors:
+        elements = selector.select(soup)
+        if elements:
+            return elements
+    return []
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self._skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style') and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+
+def html_to_text(markup):
+    """
+    Strip tags from an HTML fragment without building a document tree.
+    """
+    if not markup:
+        return markup
+    extractor = _TextExtractor()
+    extractor.feed(markup)
+    extractor.close()
+    return ''.join(extractor.parts)
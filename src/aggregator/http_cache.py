@@ -0,0 +1,132 @@
+# src/aggregator/http_cache.py
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import namedtuple
+
+import requests
+
+from src.metrics import get_metrics
+from src.utils.storage import atomic_write
+from .http_client import get_session
+
+CachedResponse = namedtuple('CachedResponse', ['url', 'status', 'body', 'headers', 'from_cache'])
+
+
+def fetch(url, http_cache=None, session=None, timeout=30):
+    """
+    Fetch a URL, going through the on-disk cache when one is provided.
+
+    Latency, size, status and cache use are recorded per URL in the run metrics.
+    """
+    started = time.perf_counter()
+    try:
+        result = _fetch(url, http_cache, session, timeout)
+    except requests.RequestException as e:
+        status = e.response.status_code if e.response is not None else 0
+        get_metrics().record_source(
+            url, fetch_seconds=time.perf_counter() - started, status=status, error=1
+        )
+        raise
+    get_metrics().record_source(
+        url,
+        fetch_seconds=time.perf_counter() - started,
+        bytes=len(result.body),
+        status=result.status,
+        cache_hit=int(result.from_cache),
+        error=0
+    )
+    return result
+
+
+def _fetch(url, http_cache, session, timeout):
+    if http_cache is not None:
+        return http_cache.get(url)
+
+    response = (session or get_session()).get(url, timeout=timeout)
+    response.raise_for_status()
+    headers = {'Content-Type': response.headers.get('Content-Type', '')}
+    return CachedResponse(url, response.status_code, response.content, headers, False)
+
+
+class HttpCache:
+    """
+    On-disk HTTP response cache using conditional GETs.
+
+    Bodies are stored alongside their ETag/Last-Modified validators. Entries
+    younger than ``cache_duration`` seconds are served without touching the
+    network; older ones are revalidated with If-None-Match/If-Modified-Since
+    and a 304 reuses the stored body.
+    """
+
+    def __init__(self, cache_dir='.cache/http', cache_duration=3600, session=None, timeout=30):
+        self.cache_dir = cache_dir
+        self.cache_duration = cache_duration
+        self.session = session or get_session()
+        self.timeout = timeout
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + '.json', base + '.body'
+
+    def _load(self, url):
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+            return meta, body
+        except (OSError, ValueError):
+            return None, None
+
+    def _store(self, url, meta, body=None):
+        meta_path, body_path = self._paths(url)
+        if body is not None:
+            atomic_write(body_path, body)
+        atomic_write(meta_path, json.dumps(meta).encode('utf-8'))
+
+    def get(self, url):
+        """
+        Return a CachedResponse for the URL, revalidating stale entries.
+        """
+        meta, body = self._load(url)
+        now = time.time()
+
+        if meta is not None and now - meta.get('fetched_at', 0) < self.cache_duration:
+            logging.debug(f"HTTP cache hit (fresh): {url}")
+            return CachedResponse(url, meta.get('status', 200), body, meta.get('headers', {}), True)
+
+        request_headers = {}
+        if meta is not None:
+            if meta.get('etag'):
+                request_headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                request_headers['If-Modified-Since'] = meta['last_modified']
+
+        response = self.session.get(url, headers=request_headers, timeout=self.timeout)
+
+        if response.status_code == 304 and meta is not None:
+            logging.debug(f"HTTP cache hit (304 Not Modified): {url}")
+            meta['fetched_at'] = now
+            self._store(url, meta)
+            return CachedResponse(url, meta.get('status', 200), body, meta.get('headers', {}), True)
+
+        response.raise_for_status()
+
+        headers = {'Content-Type': response.headers.get('Content-Type', '')}
+        meta = {
+            'url': url,
+            'status': response.status_code,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'headers': headers,
+            'fetched_at': now,
+        }
+        self._store(url, meta, response.content)
+        logging.debug(f"HTTP cache miss: {url} ({len(response.content)} bytes)")
+        return CachedResponse(url, response.status_code, response.content, headers, False)
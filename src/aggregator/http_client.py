@@ -0,0 +1,59 @@
+# src/aggregator/http_client.py
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+USER_AGENT = 'devops-news-aggregator (+https://github.com/ekbrothers/aggregated-devops-rss-ai)'
+
+_default_session = None
+_default_session_lock = threading.Lock()
+
+
+def create_session(http_settings=None, pool_maxsize=10):
+    """
+    Create a pooled requests session with retry/backoff.
+
+    Connections are kept alive and reused per host, gzip/deflate is negotiated,
+    and 429/5xx responses are retried with exponential backoff plus jitter,
+    honouring Retry-After when the server sends it.
+    """
+    http_settings = http_settings or {}
+
+    retry = Retry(
+        total=http_settings.get('retries', 3),
+        backoff_factor=http_settings.get('backoff_factor', 0.5),
+        backoff_max=http_settings.get('backoff_max', 30),
+        backoff_jitter=http_settings.get('backoff_jitter', 0.5),
+        status_forcelist=http_settings.get('retry_statuses', DEFAULT_RETRY_STATUSES),
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=http_settings.get('pool_connections', 10),
+        pool_maxsize=http_settings.get('pool_maxsize', pool_maxsize),
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({
+        'User-Agent': http_settings.get('user_agent', USER_AGENT),
+        'Accept-Encoding': 'gzip, deflate',
+    })
+    return session
+
+
+def get_session():
+    """
+    Return the process-wide default session, creating it on first use.
+    """
+    global _default_session
+    with _default_session_lock:
+        if _default_session is None:
+            _default_session = create_session()
+        return _default_session
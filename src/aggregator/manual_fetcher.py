@@ -1,35 +1,23 @@
 # src/aggregator/manual_fetcher.py
 import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 import pytz
 import logging
+from .entry import Entry
+from .html_parsing import DATE_SELECTORS, TITLE_SELECTORS, find_content_elements, select_first
+from .http_cache import fetch
+from .providers import extractor_for
 
-def fetch_manual_entries(source, current_week_range):
+
+def fetch_manual_entries(source, current_week_range, http_cache=None, parser='auto'):
     entries = []
     try:
-        response = requests.get(source['url'])
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Remove unnecessary elements
-        for element in soup(['script', 'style', 'nav', 'header', 'footer']):
-            element.decompose()
-            
+        response = fetch(source['url'], http_cache)
+
         # Get main content based on provider
         provider = source.get('provider_name', '').lower()
-        if provider == 'azuredevops':
-            # Azure DevOps specific parsing
-            content_elements = soup.select('article') or soup.select('.content-article')
-        elif provider == 'openai':
-            # OpenAI specific parsing
-            content_elements = soup.select('article') or soup.select('.article-content')
-        elif provider == 'anthropic':
-            # Anthropic specific parsing
-            content_elements = soup.select('article') or soup.select('.blog-post')
-        else:
-            # Default to main content areas
-            content_elements = soup.select('main') or soup.select('article') or [soup]
+        extract = extractor_for(provider) or find_content_elements
+        content_elements = extract(response.body, provider, parser)
             
         # Process each content element
         for element in content_elements:
@@ -40,7 +28,7 @@ def fetch_manual_entries(source, current_week_range):
             entry_date = datetime.now(pytz.UTC)  # Use current date as fallback
             
             # Try to find a date in the content
-            date_element = element.select_one('time') or element.select_one('.date') or element.select_one('.published')
+            date_element = select_first(DATE_SELECTORS, element)
             if date_element and date_element.get('datetime'):
                 try:
                     entry_date = datetime.fromisoformat(date_element['datetime'].replace('Z', '+00:00'))
@@ -49,18 +37,18 @@ def fetch_manual_entries(source, current_week_range):
             
             if current_week_range[0] <= entry_date < current_week_range[1]:
                 # Try to find a title
-                title_element = element.select_one('h1') or element.select_one('h2')
+                title_element = select_first(TITLE_SELECTORS, element)
                 title = title_element.get_text(strip=True) if title_element else source.get('name', 'No Title')
                 
-                entry = {
-                    'title': title,
-                    'link': source['url'],
-                    'content': content,
-                    'content_type': source.get('content_type', 'html'),
-                    'published': entry_date.isoformat(),
-                    'provider_name': source.get('provider_name', 'Unknown Platform'),
-                    'source_name': source.get('name', 'Unknown Source')  # Add source name from config
-                }
+                entry = Entry(
+                    title=title,
+                    link=source['url'],
+                    content=content,
+                    content_type=source.get('content_type', 'html'),
+                    published=entry_date,
+                    provider_name=source.get('provider_name', 'Unknown Platform'),
+                    source_name=source.get('name', 'Unknown Source')  # Add source name from config
+                )
                 entries.append(entry)
                 logging.info(f"Added manual entry: {entry['title']} from {source['url']}")
                 
@@ -1,12 +1,42 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
+from itertools import islice
+import os
+import time
 import pytz
 import logging
-from .feed_fetcher import fetch_rss_entries
-from .manual_fetcher import fetch_manual_entries
+from src.metrics import get_metrics
+from .concurrency import HostLimiter
+from .entry import Entry
+from .entry_store import ENTRY_UNCHANGED, EntryStore
+from .http_cache import HttpCache
+from .http_client import create_session
+from .providers import fetcher_for, load_plugins
+from .scheduler import PollScheduler
 
 class NewsAggregator:
     def __init__(self, config):
         self.config = config
+        settings = config.get('settings') or {}
+        self.max_workers = settings.get('max_workers', 8)
+        max_per_host = settings.get('max_per_host', 4)
+        http_settings = settings.get('http') or {}
+        self.host_limiter = HostLimiter(max_per_host)
+        self.session = create_session(http_settings, pool_maxsize=max_per_host)
+        self.html_parser = settings.get('html_parser', 'auto')
+        load_plugins(settings.get('plugins'))
+        self.cache_dir = settings.get('cache_dir', '.cache')
+        self.http_cache = HttpCache(
+            os.path.join(self.cache_dir, 'http'),
+            settings.get('cache_duration', 3600),
+            session=self.session,
+            timeout=http_settings.get('timeout', 30)
+        )
+        self.entry_store = None
+        if settings.get('incremental', True):
+            self.entry_store = EntryStore(os.path.join(self.cache_dir, 'entries.sqlite3'))
+        self.scheduler = PollScheduler.from_config(config)
         self.current_week_range = self._get_week_range()
 
     def _get_week_range(self):
@@ -21,59 +51,209 @@ class NewsAggregator:
         logging.info(f"Current week range: {last_friday} to {next_friday}")
         return last_friday, next_friday
 
-    def aggregate(self):
+    def refresh_week_range(self):
         """
-        Aggregate news from all configured sources.
+        Recompute the aggregation window, e.g. between runs of a long-lived process.
+        """
+        self.current_week_range = self._get_week_range()
+        return self.current_week_range
+
+    def _iter_sources(self):
+        """
+        Yield (category, source) pairs for every configured source with a URL.
         """
-        entries = []
         sources = self.config.get('sources', {})
-        
-        # Process all source categories
+
         for category, source_list in sources.items():
             # Skip if source_list is None or empty
             if not source_list:
                 logging.debug(f"Skipping empty category: {category}")
                 continue
-                
+
             for source in source_list:
-                try:
-                    # Skip if no URL provided
-                    if not source.get('url'):
-                        continue
-                        
-                    # Set default content type if not specified
-                    if 'content_type' not in source:
-                        # GitHub-related sources typically provide markdown
-                        if 'github.com' in source.get('url', ''):
-                            source['content_type'] = 'markdown'
-                        else:
-                            source['content_type'] = 'html'
-                    
-                    # Determine if manual or RSS feed
-                    if source.get('manual', False):
-                        source_entries = fetch_manual_entries(source, self.current_week_range)
+                # Skip if no URL provided
+                if not source.get('url'):
+                    continue
+
+                # Set default content type if not specified
+                if 'content_type' not in source:
+                    # GitHub-related sources typically provide markdown
+                    if 'github.com' in source.get('url', ''):
+                        source['content_type'] = 'markdown'
                     else:
-                        source_entries = fetch_rss_entries(source['url'], self.current_week_range, source)
-                    
-                    # Process entries
-                    for entry in source_entries:
-                        # Add source information
-                        entry['provider_name'] = source.get('provider_name', '')
-                        entry['source_type'] = category
-                        entry['content_type'] = source.get('content_type', 'html')
-                        
-                        entries.append(entry)
-                        logging.debug(f"Processed {entry['content_type']} entry from {source.get('name', 'Unknown')} ({source.get('url')})")
-                        
-                except Exception as e:
-                    logging.error(f"Error processing source {source.get('name', 'Unknown')} ({source.get('url')}): {e}")
+                        source['content_type'] = 'html'
+
+                yield category, source
+
+    def _fetch_source(self, category, source):
+        """
+        Fetch and annotate the entries of a single source.
+
+        Errors are logged and isolated so one failing source never affects the others.
+        With adaptive polling enabled, sources that are not due are served from
+        the entries stored at their last poll.
+        """
+        metrics = get_metrics()
+        if self.scheduler is not None:
+            stored = self.scheduler.stored_entries(source['url'])
+            if stored is not None:
+                start, end = self.current_week_range
+                source_entries = [entry for entry in stored if start <= entry_sort_key(entry) < end]
+                metrics.record_source(
+                    source['url'], name=source.get('name', 'Unknown'), category=category,
+                    entries=len(source_entries), polled=0
+                )
+                logging.info(
+                    f"Skipping {source.get('name', 'Unknown')}: not due, "
+                    f"reusing {len(source_entries)} stored entries"
+                )
+                return source_entries
+
+        try:
+            with self.host_limiter.limit(source['url']):
+                started = time.perf_counter()
+                with metrics.stage('fetch'):
+                    # Manual page, feed or plugin fetcher, imported on first use
+                    fetcher = fetcher_for(source)
+                    source_entries = fetcher(
+                        source, self.current_week_range,
+                        http_cache=self.http_cache, parser=self.html_parser
+                    )
+                total = time.perf_counter() - started
+
+            fetched = metrics.sources.get(source['url'], {})
+            metrics.record_source(
+                source['url'],
+                name=source.get('name', 'Unknown'),
+                category=category,
+                entries=len(source_entries),
+                total_seconds=total,
+                parse_seconds=max(0.0, total - fetched.get('fetch_seconds', 0.0)),
+                polled=1
+            )
+
+            # Process entries
+            for entry in source_entries:
+                # Add source information
+                entry['provider_name'] = source.get('provider_name', '')
+                entry['source_type'] = category
+                entry['content_type'] = source.get('content_type', 'html')
+                if source.get('status_url'):
+                    entry['status_url'] = source['status_url']
+                logging.debug(
+                    f"Processed {entry['content_type']} entry from "
+                    f"{source.get('name', 'Unknown')} ({source.get('url')})"
+                )
+
+            # Failed fetches leave the source due, so it is retried on the next run
+            if self.scheduler is not None and not fetched.get('error'):
+                self.scheduler.record(source['url'], source_entries)
+
+            return source_entries
+
+        except Exception as e:
+            logging.error(
+                f"Error processing source {source.get('name', 'Unknown')} "
+                f"({source.get('url')}): {e}"
+            )
+            metrics.record_source(
+                source['url'], name=source.get('name', 'Unknown'), category=category, error=1
+            )
+            return []
+
+    def iter_source_entries(self, ordered=False):
+        """
+        Yield each source's entries as soon as that source has been fetched.
+
+        At most ``max_workers`` sources are in flight: the next source is
+        submitted only when a finished one is handed downstream, so memory
+        stays bounded however many sources are configured. Sources arrive in
+        completion order, so slow feeds do not hold back downstream work on the
+        fast ones, or in configuration order when ``ordered`` is set.
+        """
+        jobs = self._iter_sources()
+        window = max(1, self.max_workers)
+
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            pending = deque(
+                executor.submit(self._fetch_source, category, source)
+                for category, source in islice(jobs, window)
+            )
+            while pending:
+                future = pending.popleft() if ordered else _take_first_done(pending)
+                source_entries = future.result()
+                for category, source in islice(jobs, 1):
+                    pending.append(executor.submit(self._fetch_source, category, source))
+                yield source_entries
+
+    def track(self, entries):
+        """
+        Record entries in the entry store, tagging them new, changed or unchanged.
+        """
+        if self.entry_store is None:
+            return entries
+        return self.entry_store.sync(entries)
+
+    def aggregate(self, changed_only=False):
+        """
+        Aggregate news from all configured sources.
+
+        Sources are fetched concurrently; results are collected in configuration
+        order so the final date sort is identical to a serial run. When the entry
+        store is enabled each entry is tagged new/changed/unchanged and unchanged
+        entries pick up the analysis the store saved for them;
+        ``changed_only`` restricts the result to new and changed entries.
+        """
+        entries = []
+        for source_entries in self.iter_source_entries(ordered=True):
+            entries.extend(source_entries)
+
+        if self.entry_store is not None:
+            entries = self.track(entries)
+            self.entry_store.prune(self.current_week_range[0])
+            unchanged = sum(1 for entry in entries if entry['status'] == ENTRY_UNCHANGED)
+            logging.info(
+                f"Entry store: {len(entries) - unchanged} new or changed, {unchanged} unchanged"
+            )
+            if changed_only:
+                entries = [entry for entry in entries if entry['status'] != ENTRY_UNCHANGED]
 
         # Sort entries by date
-        entries.sort(
-            key=lambda x: datetime.fromisoformat(x['published']) if isinstance(x.get('published'), str)
-            else x.get('published', datetime.min.replace(tzinfo=pytz.UTC)),
-            reverse=True
-        )
+        entries.sort(key=entry_sort_key, reverse=True)
 
         logging.info(f"Total entries fetched: {len(entries)}")
         return entries
+
+    def close(self):
+        """
+        Release the HTTP session and on-disk stores.
+        """
+        self.session.close()
+        if self.entry_store is not None:
+            self.entry_store.close()
+        if self.scheduler is not None:
+            self.scheduler.close()
+
+
+def _take_first_done(pending):
+    """
+    Remove and return a finished future from ``pending``, waiting for one if needed.
+    """
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    future = next(future for future in pending if future in done)
+    pending.remove(future)
+    return future
+
+
+def entry_sort_key(entry):
+    """
+    Sort key ordering entries by publication date.
+
+    Entry objects carry a precomputed key; plain dicts are parsed on each call.
+    """
+    if isinstance(entry, Entry):
+        return entry.sort_key
+    published = entry.get('published')
+    if isinstance(published, str):
+        return datetime.fromisoformat(published)
+    return published or datetime.min.replace(tzinfo=pytz.UTC)
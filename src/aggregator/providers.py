@@ -0,0 +1,134 @@
+# src/aggregator/providers.py
+import importlib
+import logging
+import threading
+from collections import namedtuple
+
+Provider = namedtuple('Provider', [
+    'name', 'domains', 'content_tags', 'content_selectors', 'whole_page_fallback', 'extractor',
+    'fetcher',
+])
+
+# Fetchers by source kind. A fetcher is called as
+# fetcher(source, current_week_range, http_cache=None, parser='auto') and returns entries.
+FETCHERS = {
+    'rss': 'src.aggregator.feed_fetcher:fetch_feed_source',
+    'manual': 'src.aggregator.manual_fetcher:fetch_manual_entries',
+    'crawl': 'src.aggregator.crawler:crawl_manual_entries',
+}
+
+# Registered providers, in the order their domains are matched
+_providers = {}
+_resolved = {}
+_lock = threading.Lock()
+
+
+def register_provider(name, domains=(), content_tags=None, content_selectors=None,
+                      whole_page_fallback=False, extractor=None, fetcher=None):
+    """
+    Register (or replace) a provider.
+
+    ``domains`` are substrings of feed hostnames that identify the provider.
+    ``content_tags``/``content_selectors`` tell the default extractor where a
+    page keeps its release notes. ``extractor`` and ``fetcher`` override the
+    defaults; they may be callables or ``"module:attribute"`` strings, which are
+    imported on first use so plugins cost nothing until a source needs them.
+    """
+    _providers[name] = Provider(
+        name, tuple(domains), tuple(content_tags) if content_tags else None,
+        tuple(content_selectors) if content_selectors else None,
+        whole_page_fallback, extractor, fetcher
+    )
+
+
+def register_fetcher(kind, target):
+    """
+    Register a fetcher that sources can select with ``fetcher: <kind>``.
+    """
+    FETCHERS[kind] = target
+
+
+def get_provider(name):
+    return _providers.get(name)
+
+
+def resolve(target):
+    """
+    Return the object a ``"module:attribute"`` string points to, importing it once.
+    """
+    if not isinstance(target, str):
+        return target
+    with _lock:
+        if target not in _resolved:
+            module_name, _, attribute = target.partition(':')
+            _resolved[target] = getattr(importlib.import_module(module_name), attribute)
+        return _resolved[target]
+
+
+def load_plugins(modules):
+    """
+    Import plugin modules; each registers its providers or fetchers on import.
+    """
+    for module_name in modules or []:
+        try:
+            importlib.import_module(module_name)
+            logging.info(f"Loaded provider plugin {module_name}")
+        except ImportError as e:
+            logging.error(f"Failed to load provider plugin {module_name}: {e}")
+
+
+def provider_for_url(url):
+    """
+    Guess the provider of a feed from its hostname.
+
+    Only used if provider_name is not specified in the source config.
+    """
+    domain = url.split('//')[-1].split('/')[0].lower()
+    for provider in _providers.values():
+        if any(fragment in domain for fragment in provider.domains):
+            return provider.name
+
+    # Remove www. and .com/.org/etc
+    return domain.replace('www.', '').split('.')[0]
+
+
+def fetcher_for(source):
+    """
+    Return the fetch function for a source.
+
+    A source's own ``fetcher`` wins over its provider's; otherwise manual
+    sources with a ``crawl`` block are crawled, other manual sources are
+    scraped and everything else is read as a feed.
+    """
+    provider = _providers.get(source.get('provider_name', '').lower())
+    target = source.get('fetcher') or (provider.fetcher if provider else None)
+    if not target:
+        if source.get('manual', False):
+            target = 'crawl' if source.get('crawl') else 'manual'
+        else:
+            target = 'rss'
+    return resolve(FETCHERS.get(target, target))
+
+
+def extractor_for(provider_name):
+    """
+    Return the provider's custom content extractor, or None to use the default.
+    """
+    provider = _providers.get(provider_name)
+    if provider is None or provider.extractor is None:
+        return None
+    return resolve(provider.extractor)
+
+
+register_provider('github', domains=['github'])
+register_provider('gitlab', domains=['gitlab'])
+register_provider('azure', domains=['azure', 'microsoft'])
+register_provider('terraform', domains=['hashicorp'])  # Default to terraform for HashiCorp
+register_provider('googlecloud', domains=['google'])
+register_provider('anthropic', domains=['anthropic'],
+                  content_tags=['article'], content_selectors=['article', '.blog-post'])
+register_provider('openai', domains=['openai'],
+                  content_tags=['article'], content_selectors=['article', '.article-content'])
+register_provider('aws', domains=['aws', 'amazon'])
+register_provider('azuredevops',
+                  content_tags=['article'], content_selectors=['article', '.content-article'])
@@ -0,0 +1,175 @@
+# src/aggregator/scheduler.py
+import hashlib
+import json
+import logging
+import os
+import time
+from statistics import median
+
+from src.utils.storage import SQLiteStore
+from .entry import Entry, parse_published
+from .entry_store import content_hash, entry_identity
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    url TEXT PRIMARY KEY,
+    signature TEXT,
+    entries TEXT NOT NULL,
+    item_cadence REAL,
+    interval REAL NOT NULL,
+    last_polled REAL NOT NULL,
+    last_changed REAL,
+    next_due REAL NOT NULL
+)
+"""
+
+
+def entries_signature(entries):
+    """
+    Hash the identities and contents of a source's entries, independent of order.
+    """
+    digest = hashlib.sha256()
+    for key in sorted(f"{entry_identity(entry)}\0{content_hash(entry)}" for entry in entries):
+        digest.update(key.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def item_cadence(entries):
+    """
+    Median seconds between consecutive item publication dates.
+
+    Returns None with fewer than two dated items.
+    """
+    timestamps = []
+    for entry in entries:
+        try:
+            published = parse_published(entry.get('published'))
+        except (TypeError, ValueError):
+            continue
+        if published is not None:
+            timestamps.append(published.timestamp())
+    timestamps.sort()
+    gaps = [
+        later - earlier for earlier, later in zip(timestamps, timestamps[1:]) if later > earlier
+    ]
+    return median(gaps) if gaps else None
+
+
+class PollScheduler(SQLiteStore):
+    """
+    Decide per source whether it is due for polling, based on how often it changes.
+
+    After every successful poll the source's entries are stored together with
+    their signature and the median gap between item dates. When the entries
+    changed, the next poll is scheduled ``cadence_fraction`` of the observed
+    cadence later; when they did not, the previous interval grows by
+    ``backoff``. Intervals are clamped to [min_interval, max_interval] seconds.
+    Sources that are not due are served from their stored entries.
+    """
+
+    def __init__(self, db_path, min_interval=3600, max_interval=604800, backoff=2.0,
+                 cadence_fraction=0.5):
+        super().__init__(db_path, _SCHEMA)
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.backoff = backoff
+        self.cadence_fraction = cadence_fraction
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Build a scheduler from ``settings.polling``; returns None when it is disabled.
+        """
+        settings = config.get('settings') or {}
+        polling = settings.get('polling') or {}
+        if not polling.get('enabled', False):
+            return None
+        return cls(
+            polling.get(
+                'db_path', os.path.join(settings.get('cache_dir', '.cache'), 'polling.sqlite3')
+            ),
+            min_interval=polling.get('min_interval', 3600),
+            max_interval=polling.get('max_interval', 604800),
+            backoff=polling.get('backoff', 2.0),
+            cadence_fraction=polling.get('cadence_fraction', 0.5)
+        )
+
+    def _clamp(self, interval):
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def stored_entries(self, url, now=None):
+        """
+        Return the entries stored for a source that is not due yet.
+
+        Returns None when the source should be polled.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT entries, next_due FROM sources WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None or row[1] <= now:
+            return None
+        return [Entry.from_dict(data) for data in json.loads(row[0])]
+
+    def next_due(self, url):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT next_due FROM sources WHERE url = ?", (url,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def record(self, url, entries, now=None):
+        """
+        Store a successful poll's entries and schedule the source's next poll.
+
+        Returns the new polling interval in seconds.
+        """
+        now = time.time() if now is None else now
+        signature = entries_signature(entries)
+        cadence = item_cadence(entries)
+
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT signature, item_cadence, interval, last_changed FROM sources WHERE url = ?",
+                (url,)
+            ).fetchone()
+            previous_signature, previous_cadence, previous_interval, last_changed = (
+                row or (None, None, None, None)
+            )
+            cadence = cadence or previous_cadence
+
+            if signature != previous_signature:
+                last_changed = now
+                if cadence:
+                    interval = self._clamp(cadence * self.cadence_fraction)
+                else:
+                    interval = self.min_interval
+            else:
+                interval = self._clamp((previous_interval or self.min_interval) * self.backoff)
+
+            self._conn.execute(
+                """
+                INSERT INTO sources (
+                    url, signature, entries, item_cadence, interval, last_polled, last_changed,
+                    next_due
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    signature = excluded.signature,
+                    entries = excluded.entries,
+                    item_cadence = excluded.item_cadence,
+                    interval = excluded.interval,
+                    last_polled = excluded.last_polled,
+                    last_changed = excluded.last_changed,
+                    next_due = excluded.next_due
+                """,
+                (
+                    url, signature, json.dumps([dict(entry) for entry in entries]),
+                    cadence, interval, now, last_changed, now + interval
+                )
+            )
+
+        logging.debug(f"Next poll of {url} in {interval / 3600:.1f}h")
+        return interval
@@ -0,0 +1,216 @@
+# src/aggregator/stream_parser.py
+import html
+import io
+import logging
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin
+
+import pytz
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+CONTENT_ENCODED = '{http://purl.org/rss/1.0/modules/content/}encoded'
+DC_DATE = '{http://purl.org/dc/elements/1.1/}date'
+RSS1 = '{http://purl.org/rss/1.0/}'
+RSS_ITEM_TAGS = ('item', RSS1 + 'item')
+XML_BASE = '{http://www.w3.org/XML/1998/namespace}base'
+XHTML = '{http://www.w3.org/1999/xhtml}'
+
+
+class UnsupportedFeed(ValueError):
+    """
+    Raised when a document is not a plain Atom or RSS feed.
+    """
+
+
+def iter_feed_items(body, week_range, max_entries=None, date_ordered=True, base_url=None):
+    """
+    Incrementally parse an Atom/RSS document and yield items inside ``week_range``.
+
+    Each item's date is read before anything else, so content is only extracted
+    for items inside the window. While the feed has been newest-first so far
+    and ``date_ordered`` is set, parsing stops at the first item older than the
+    window start. The first dated item never stops it: on its own it says
+    nothing about the feed's order, and oldest-first feeds start old.
+    ``max_entries`` caps the number of items examined.
+
+    Links and content are treated the way feedparser treats them: relative URLs
+    are resolved against ``xml:base`` or ``base_url`` (the feed URL) and HTML is
+    sanitized, so both parsers hand the same markup to the templates.
+
+    Yields dicts with title, link, guid, published (datetime) and content.
+    Raises ET.ParseError for malformed XML and UnsupportedFeed for other formats.
+    """
+    start, end = week_range
+    examined = 0
+    previous_date = None
+    in_order = True
+    events = ET.iterparse(io.BytesIO(body), events=('start', 'end'))
+    item_tag, base_url = _feed_format(events, base_url)
+
+    for event, elem in events:
+        if event != 'end' or elem.tag not in item_tag:
+            continue
+
+        examined += 1
+        is_atom = elem.tag == ATOM + 'entry'
+        entry_date = _atom_date(elem) if is_atom else _rss_date(elem)
+
+        if entry_date is not None:
+            descending = previous_date is not None and entry_date <= previous_date
+            in_order = in_order and (previous_date is None or descending)
+            previous_date = entry_date
+
+            if start <= entry_date < end:
+                item_base = urljoin(base_url or '', elem.get(XML_BASE, ''))
+                build_item = _atom_item if is_atom else _rss_item
+                yield build_item(elem, entry_date, item_base)
+            elif entry_date < start and date_ordered and in_order and descending:
+                logging.debug(f"Stopping feed parse at {entry_date}: older than window start")
+                return
+
+        elem.clear()
+        if max_entries and examined >= max_entries:
+            return
+
+
+def _feed_format(events, base_url):
+    # Read up to the root element: the item tags to look for and the document base URL
+    for event, elem in events:
+        if event != 'start':
+            continue
+        base_url = urljoin(base_url or '', elem.get(XML_BASE, ''))
+        if elem.tag == ATOM + 'feed':
+            return (ATOM + 'entry',), base_url
+        if elem.tag in ('rss', '{http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF'):
+            return RSS_ITEM_TAGS, base_url
+        raise UnsupportedFeed(f"Unsupported feed root element: {elem.tag}")
+    raise UnsupportedFeed("Empty feed document")
+
+
+def clean_html(content, base_url=None):
+    """
+    Resolve relative URLs in an HTML fragment and strip scripts, event handlers
+    and other unsafe markup, using the same rules as feedparser.
+    """
+    if not content:
+        return content or ''
+    # Only items inside the window get here, so feedparser loads on first use
+    from feedparser.sanitizer import _sanitize_html
+    from feedparser.urls import resolve_relative_uris
+
+    if base_url:
+        content = resolve_relative_uris(content, base_url, 'utf-8', 'text/html')
+    return _sanitize_html(content, 'utf-8', 'text/html')
+
+
+def safe_link(link, base_url=None):
+    """
+    Resolve a link against ``base_url``; returns None for empty or unsafe (e.g. javascript:) links.
+    """
+    if not link:
+        return None
+    from feedparser.urls import make_safe_absolute_uri
+
+    return make_safe_absolute_uri(base_url or '', link) or None
+
+
+def _text(elem, tag):
+    child = elem.find(tag)
+    if child is None or child.text is None:
+        return None
+    return child.text.strip()
+
+
+def _to_utc(value):
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=pytz.UTC)
+    return value.astimezone(pytz.UTC).replace(microsecond=0)
+
+
+def _parse_iso(value):
+    try:
+        return _to_utc(datetime.fromisoformat(value.replace('Z', '+00:00')))
+    except (AttributeError, ValueError):
+        return None
+
+
+def _atom_date(elem):
+    for tag in ('published', 'updated'):
+        value = _parse_iso(_text(elem, ATOM + tag))
+        if value is not None:
+            return value
+    return None
+
+
+def _rss_date(elem):
+    value = _text(elem, 'pubDate')
+    if value:
+        try:
+            return _to_utc(parsedate_to_datetime(value))
+        except (TypeError, ValueError):
+            pass
+    return _parse_iso(_text(elem, DC_DATE))
+
+
+def _atom_content(elem, tag, base_url):
+    child = elem.find(ATOM + tag)
+    if child is None:
+        return None
+    content_type = child.get('type', 'text')
+    if content_type == 'xhtml':
+        markup = _xhtml_markup(child)
+    elif content_type in ('html', 'text/html'):
+        markup = child.text or ''
+    else:
+        # Plain text is escaped so it cannot inject markup
+        return html.escape(child.text or '', quote=False)
+    return clean_html(markup, urljoin(base_url, child.get(XML_BASE, '')))
+
+
+def _xhtml_markup(child):
+    # Inline XHTML sits in a wrapper <div>; serialize its contents without the namespace
+    wrapper = child[0] if len(child) == 1 and child[0].tag == XHTML + 'div' else child
+    for node in wrapper.iter():
+        if isinstance(node.tag, str) and node.tag.startswith(XHTML):
+            node.tag = node.tag[len(XHTML):]
+    nodes = ''.join(ET.tostring(node, encoding='unicode') for node in wrapper)
+    return html.escape(wrapper.text or '', quote=False) + nodes
+
+
+def _atom_item(elem, entry_date, base_url):
+    link = None
+    for link_elem in elem.findall(ATOM + 'link'):
+        if link_elem.get('rel', 'alternate') == 'alternate':
+            link = safe_link(link_elem.get('href'), base_url)
+            break
+    content = _atom_content(elem, 'content', base_url)
+    if content is None:
+        content = _atom_content(elem, 'summary', base_url) or ''
+    title = elem.find(ATOM + 'title')
+    if title is not None and title.get('type') in ('html', 'xhtml'):
+        title = _atom_content(elem, 'title', base_url).strip()
+    else:
+        title = _text(elem, ATOM + 'title')
+    return {
+        'title': title or 'No Title',
+        'link': link or '#',
+        'guid': _text(elem, ATOM + 'id') or link,
+        'published': entry_date,
+        'content': content,
+    }
+
+
+def _rss_item(elem, entry_date, base_url):
+    link = safe_link(_text(elem, 'link') or _text(elem, RSS1 + 'link'), base_url)
+    content = _text(elem, CONTENT_ENCODED)
+    if content is None:
+        content = _text(elem, 'description') or _text(elem, RSS1 + 'description') or ''
+    return {
+        'title': _text(elem, 'title') or _text(elem, RSS1 + 'title') or 'No Title',
+        'link': link or '#',
+        'guid': _text(elem, 'guid') or link,
+        'published': entry_date,
+        'content': clean_html(content, base_url),
+    }
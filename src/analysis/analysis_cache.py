@@ -0,0 +1,95 @@
+# src/analysis/analysis_cache.py
+import hashlib
+import json
+import logging
+import os
+import time
+
+from src.utils.storage import SQLiteStore
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    cache_key TEXT PRIMARY KEY,
+    analysis TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+def cache_key(content, source, title, source_type, source_metadata, prompt_version):
+    """
+    Hash every input that influences the analysis of an entry.
+    """
+    payload = json.dumps(
+        [prompt_version, source, title, source_type, content, source_metadata or {}],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class AnalysisCache(SQLiteStore):
+    """
+    Persistent cache of enhanced analyses keyed by a hash of the prompt inputs.
+
+    Entries expire after ``ttl`` seconds and the least recently used ones are
+    evicted once more than ``max_entries`` are stored.
+    """
+
+    def __init__(self, db_path, ttl=30 * 24 * 3600, max_entries=5000):
+        super().__init__(db_path, _SCHEMA)
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Build the cache described by ``settings.cache_dir`` and ``settings.analysis``.
+        """
+        settings = config.get('settings') or {}
+        analysis_settings = settings.get('analysis') or {}
+        return cls(
+            os.path.join(settings.get('cache_dir', '.cache'), 'analysis.sqlite3'),
+            ttl=analysis_settings.get('cache_ttl', 30 * 24 * 3600),
+            max_entries=analysis_settings.get('cache_max_entries', 5000)
+        )
+
+    def get(self, key):
+        """
+        Return the cached analysis for a key, or None if missing or expired.
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT analysis, created_at FROM analyses WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM analyses WHERE cache_key = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE analyses SET accessed_at = ? WHERE cache_key = ?", (now, key)
+            )
+        return json.loads(row[0])
+
+    def set(self, key, analysis):
+        """
+        Store an analysis and evict expired or excess entries.
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analyses (cache_key, analysis, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(analysis), now, now)
+            )
+            self._conn.execute("DELETE FROM analyses WHERE created_at < ?", (now - self.ttl,))
+            cursor = self._conn.execute(
+                "DELETE FROM analyses WHERE cache_key IN ("
+                "SELECT cache_key FROM analyses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+        if cursor.rowcount:
+            logging.debug(f"Evicted {cursor.rowcount} analyses from cache")
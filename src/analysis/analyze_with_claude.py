@@ -1,51 +1,276 @@
 import json
 import logging
-from anthropic import Anthropic
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
+from .analysis_cache import cache_key
+from .chunking import DEFAULT_TOKEN_BUDGET, chunk_content
+from .tokens import estimate_tokens
+from src.metrics import get_metrics
 
-def analyze_entry(content: str, source: str, title: str, api_key: str, source_type: str = None, source_metadata: Dict = None) -> Dict:
+# The SDK is imported when the first client is created, not at module load
+if TYPE_CHECKING:
+    from anthropic import Anthropic, APIError
+
+# Bump whenever the prompt template or response handling changes so cached
+# analyses produced by the old prompt are no longer served.
+PROMPT_VERSION = "2"
+
+MODEL = "claude-3-5-sonnet-latest"
+MAX_TOKENS = 1000
+
+IMPACT_ORDER = {'LOW': 1, 'MEDIUM': 2, 'HIGH': 3}
+LIST_FIELDS = (
+    'key_changes', 'action_items', 'affected_services', 'breaking_changes',
+    'security_updates', 'deprecations', 'new_features'
+)
+
+
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> 'Anthropic':
+    """
+    Return a shared client per API key so connections are reused across calls.
+    """
+    from anthropic import Anthropic
+    return Anthropic(api_key=api_key)
+
+
+def analyze_entry(content: str, source: str, title: str, api_key: str,
+                  source_type: str = None, source_metadata: Dict = None, cache=None,
+                  limiter=None, token_budget: int = DEFAULT_TOKEN_BUDGET,
+                  chunk_workers: int = 4) -> Dict:
     """
     Analyze a single entry using Claude AI.
+
+    When an AnalysisCache is given, unchanged inputs are answered from it without
+    calling the API. A RateLimiter, if given, paces requests and handles 429 backoff.
+    Content larger than ``token_budget`` is summarized chunk by chunk in parallel
+    and the partial analyses are merged.
     """
-    # Create source-specific prompt
-    prompt = _create_source_specific_prompt(content, source, title, source_type, source_metadata)
+    key = None
+    if cache is not None:
+        key = cache_key(content, source, title, source_type, source_metadata, PROMPT_VERSION)
+        cached = cache.get(key)
+        if cached is not None:
+            logging.debug(f"Analysis cache hit for '{title}'")
+            get_metrics().increment('analysis_cache', result='hit')
+            return cached
+        get_metrics().increment('analysis_cache', result='miss')
+
+    # Create source-specific prompts, one per chunk of oversized content
+    prompts = _create_prompts(content, source, title, source_type, source_metadata, token_budget)
+    client = _get_client(api_key)
 
     try:
-        client = Anthropic(api_key)
-        response = client.completions.create(
-            model="claude-v1",
-            prompt=prompt,
-            max_tokens=1000,
-            stop_sequences=["}"]
+        if len(prompts) == 1:
+            response_texts = [_request_completion(client, prompts[0], limiter)]
+        else:
+            logging.info(f"Splitting '{title}' into {len(prompts)} chunks for analysis")
+            with ThreadPoolExecutor(max_workers=max(1, chunk_workers)) as pool:
+                response_texts = list(pool.map(
+                    lambda prompt: _request_completion(client, prompt, limiter), prompts
+                ))
+    except Exception as e:
+        logging.error(f"Error analyzing entry '{title}': {e}")
+        return _get_default_analysis(source_type)
+
+    enhanced_analysis = _parse_analysis(
+        response_texts, title, content, source_type, source_metadata
+    )
+    if cache is not None and not enhanced_analysis.get('is_fallback'):
+        cache.set(key, enhanced_analysis)
+    return enhanced_analysis
+
+
+def _create_prompts(content: str, source: str, title: str, source_type: str,
+                    source_metadata: Dict, token_budget: int) -> List[str]:
+    """
+    Create one prompt per chunk of content that fits within the token budget.
+    """
+    chunks = chunk_content(content, token_budget)
+    if len(chunks) == 1:
+        return [
+            _create_source_specific_prompt(content, source, title, source_type, source_metadata)
+        ]
+    return [
+        _create_source_specific_prompt(
+            chunk, source, f"{title} (part {index} of {len(chunks)})", source_type, source_metadata
         )
-        response_text = response.completion.strip()
-        
+        for index, chunk in enumerate(chunks, start=1)
+    ]
+
+
+def _parse_analysis(response_texts: List[str], title: str, content: str, source_type: str,
+                    source_metadata: Dict) -> Dict:
+    """
+    Turn Claude's raw JSON response(s) into an enhanced analysis.
+
+    Several responses (one per chunk) are merged into a single analysis first.
+    """
+    analyses = []
+    for response_text in response_texts:
         # Ensure the JSON is properly closed
         if not response_text.endswith('}'):
             response_text += "}"
-        
+
         logging.debug(f"Claude AI raw response for '{title}': {response_text}")
-        
+
         try:
             # Parse the JSON response
-            analysis = json.loads(response_text)
-            
-            # Enhance the analysis with source-specific processing
-            enhanced_analysis = _enhance_analysis(analysis, title, content, source_type, source_metadata)
-            
-            logging.info(f"Analyzed entry: {title} - Impact level: {enhanced_analysis.get('impact_level', 'None')}")
-            return enhanced_analysis
-            
+            analyses.append(json.loads(response_text))
         except json.JSONDecodeError as e:
             logging.error(f"JSON decode error for entry '{title}': {e}")
             logging.error(f"Response Text: {response_text}")
-            return _get_default_analysis(source_type)
-            
+
+    if not analyses:
+        return _get_default_analysis(source_type)
+
+    try:
+        analysis = analyses[0] if len(analyses) == 1 else _merge_analyses(analyses)
+
+        # Enhance the analysis with source-specific processing
+        enhanced_analysis = _enhance_analysis(
+            analysis, title, content, source_type, source_metadata
+        )
+        
+        logging.info(
+            f"Analyzed entry: {title} - "
+            f"Impact level: {enhanced_analysis.get('impact_level', 'None')}"
+        )
+        return enhanced_analysis
+        
     except Exception as e:
         logging.error(f"Error analyzing entry '{title}': {e}")
         return _get_default_analysis(source_type)
 
+
+def _merge_analyses(analyses: List[Dict]) -> Dict:
+    """
+    Reduce per-chunk analyses into one analysis with the same schema.
+    """
+    merged = {
+        'summary': ' '.join(
+            _unique(str(a.get('summary', '')) for a in analyses if a.get('summary'))
+        ),
+        'impact_level': max(
+            (str(a.get('impact_level', 'LOW')).upper() for a in analyses),
+            key=lambda level: IMPACT_ORDER.get(level, 0)
+        ),
+        'platform_status': next(
+            (
+                a['platform_status'] for a in analyses
+                if a.get('platform_status') not in (None, '', 'Unknown')
+            ),
+            'Unknown'
+        )
+    }
+    for field in LIST_FIELDS:
+        merged[field] = _unique(item for a in analyses for item in (a.get(field) or []))
+    return merged
+
+
+def _unique(items) -> List:
+    seen = set()
+    result = []
+    for item in items:
+        marker = str(item).strip().lower()
+        if marker and marker not in seen:
+            seen.add(marker)
+            result.append(item)
+    return result
+
+
+def _request_completion(client: 'Anthropic', prompt: str, limiter=None) -> str:
+    """
+    Send a prompt and return the raw completion text.
+
+    Without a limiter the SDK's own retry policy applies; with one, retries
+    happen here instead, so 429s can slow every worker down. Server errors and
+    dropped connections are retried with the same backoff but leave the rate
+    alone.
+    """
+    metrics = get_metrics()
+    if limiter is None:
+        with metrics.timer('llm_request_seconds'):
+            return _response_text(_create_message(client, prompt))
+
+    from anthropic import APIConnectionError, APIStatusError
+
+    client = client.with_options(max_retries=0)
+    estimated_tokens = estimate_tokens(prompt) + MAX_TOKENS
+    attempt = 0
+    while True:
+        limiter.acquire(estimated_tokens)
+        try:
+            with metrics.timer('llm_request_seconds'):
+                response = _create_message(client, prompt)
+        except (APIStatusError, APIConnectionError) as e:
+            delay = _retry_delay(e, attempt, limiter)
+            if delay is None:
+                raise
+            attempt += 1
+            time.sleep(delay)
+            continue
+
+        limiter.on_success()
+        return _response_text(response)
+
+
+def _retry_delay(error, attempt: int, limiter):
+    """
+    Seconds to wait before retrying a failed request, or None to give up.
+    """
+    from anthropic import APIStatusError, RateLimitError
+
+    metrics = get_metrics()
+    if isinstance(error, RateLimitError):
+        metrics.increment('llm_rate_limited')
+        if attempt >= limiter.max_retries:
+            return None
+        delay = limiter.on_rate_limited(attempt, _retry_after(error))
+        logging.warning(f"Rate limited by Claude API, retrying in {delay:.1f}s")
+        return delay
+    if isinstance(error, APIStatusError) and error.status_code < 500:
+        return None
+    metrics.increment('llm_server_errors')
+    if attempt >= limiter.max_retries:
+        return None
+    delay = limiter.backoff(attempt, _retry_after(error))
+    logging.warning(f"Claude API request failed ({error}), retrying in {delay:.1f}s")
+    return delay
+
+
+def _message_params(prompt: str) -> Dict:
+    """
+    Request parameters shared by single and batch analysis calls.
+    """
+    return {
+        "model": MODEL,
+        "max_tokens": MAX_TOKENS,
+        "messages": [{"role": "user", "content": prompt}],
+        "stop_sequences": ["}"]
+    }
+
+
+def _create_message(client: 'Anthropic', prompt: str):
+    return client.messages.create(**_message_params(prompt))
+
+
+def _response_text(response) -> str:
+    return ''.join(block.text for block in response.content if block.type == 'text').strip()
+
+
+def _retry_after(error: 'APIError'):
+    """
+    Read the Retry-After header of an error response, if present.
+    """
+    try:
+        return float(error.response.headers.get('retry-after'))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
 def _create_source_specific_prompt(content: str, source: str, title: str, source_type: str, source_metadata: Dict) -> str:
     """
     Create a source-specific prompt based on the type of source.
@@ -209,5 +434,6 @@ def _get_default_analysis(source_type: str = None) -> Dict:
         'platform_status': 'Unknown',
         'categories': [source_type.replace('_', ' ').title()] if source_type else ['General'],
         'source_type': source_type or 'unknown',
-        'source_metadata': {}
+        'source_metadata': {},
+        'is_fallback': True
     }
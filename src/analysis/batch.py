@@ -0,0 +1,228 @@
+# src/analysis/batch.py
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Dict, List
+
+from src.utils.storage import atomic_write
+from .analysis_cache import AnalysisCache, cache_key
+from .analyze_with_claude import (
+    PROMPT_VERSION,
+    _create_prompts,
+    _get_client,
+    _get_default_analysis,
+    _message_params,
+    _parse_analysis,
+    _response_text,
+)
+from .chunking import token_budget_for
+from .executor import source_metadata
+
+
+class BatchAnalyzer:
+    """
+    Analyzes entries through the Message Batches API.
+
+    The batch id and every finished result are written to a local state file
+    as soon as they are known, so a run that crashes or times out resumes
+    polling the same batch on its next start instead of resubmitting it.
+    """
+
+    def __init__(self, api_key, state_path, cache=None, poll_interval=60, max_wait=3600,
+                 token_budgets=None):
+        self.api_key = api_key
+        self.token_budgets = token_budgets or {}
+        self.state_path = state_path
+        self.cache = cache
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+
+    @classmethod
+    def from_config(cls, api_key, config):
+        """
+        Build a batch analyzer from the ``settings.analysis`` section of config.yml.
+        """
+        settings = config.get('settings') or {}
+        analysis_settings = settings.get('analysis') or {}
+        return cls(
+            api_key,
+            os.path.join(settings.get('cache_dir', '.cache'), 'analysis_batch.json'),
+            cache=AnalysisCache.from_config(config),
+            poll_interval=analysis_settings.get('batch_poll_interval', 60),
+            max_wait=analysis_settings.get('batch_max_wait', 3600),
+            token_budgets=analysis_settings.get('token_budgets')
+        )
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'batches': [], 'results': {}}
+
+    def _save_state(self, state):
+        atomic_write(self.state_path, json.dumps(state))
+
+    def analyze(self, entries: List[Dict]) -> List[Dict]:
+        """
+        Analyze entries as one bulk job and return their analyses in input order.
+
+        Oversized entries contribute one request per chunk and are merged once
+        every chunk has succeeded. Entries whose batch has not finished within
+        ``max_wait``, or whose batch could not be submitted or read because the
+        API failed, get the default analysis; a submitted batch is picked up
+        again on the next run.
+        """
+        items = [_batch_item(entry, self.token_budgets) for entry in entries]
+        analyses = self._cached(items)
+
+        state = self._load_state()
+        pending = {item['custom_id']: item for item in items if item['custom_id'] not in analyses}
+        requests = {
+            request_id: prompt
+            for item in pending.values()
+            for request_id, prompt in item['requests'].items()
+        }
+        if requests:
+            # Imported with the client, on first use
+            from anthropic import AnthropicError
+
+            try:
+                self._run(requests, state)
+            except AnthropicError as e:
+                # Like concurrent mode, a failing API degrades to unanalyzed
+                # entries instead of failing the digest; a batch that was
+                # already submitted stays in the state file for the next run
+                logging.error(f"Batch analysis failed, {len(pending)} entries left unanalyzed: {e}")
+
+        for custom_id, item in pending.items():
+            results = [state['results'].get(request_id) or {} for request_id in item['requests']]
+            if any(result.get('type') != 'succeeded' for result in results):
+                continue
+            analysis = _parse_analysis([result['text'] for result in results], *item['parse_args'])
+            if not analysis.get('is_fallback') and self.cache is not None:
+                self.cache.set(custom_id, analysis)
+            analyses[custom_id] = analysis
+
+        running = [batch for batch in state['batches'] if not batch.get('ended')]
+        if not running and os.path.exists(self.state_path):
+            # No batch is left running, so the next run starts from a clean slate.
+            os.remove(self.state_path)
+
+        return [
+            analyses.get(item['custom_id']) or _get_default_analysis(item['parse_args'][2])
+            for item in items
+        ]
+
+    def _cached(self, items):
+        if self.cache is None:
+            return {}
+        analyses = {}
+        for item in items:
+            cached = self.cache.get(item['custom_id'])
+            if cached is not None:
+                analyses[item['custom_id']] = cached
+        return analyses
+
+    def analyze_iter(self, entries):
+        """
+        Stream interface matching AnalysisExecutor.analyze_iter.
+
+        A batch job needs every prompt up front, so the stream is drained first.
+        """
+        entries = list(entries)
+        pending = [entry for entry in entries if 'analysis' not in entry]
+        analyses = dict(zip(map(id, pending), self.analyze(pending)))
+        for entry in entries:
+            yield entry, analyses.get(id(entry))
+
+    def close(self):
+        """
+        Close the analysis cache.
+        """
+        if self.cache is not None:
+            self.cache.close()
+
+    def _run(self, requests, state):
+        client = _get_client(self.api_key)
+        # Requests in a batch that is still running are waited for, not resubmitted;
+        # failed requests from finished batches get another chance.
+        in_flight = {
+            cid
+            for batch in state['batches'] if not batch.get('ended')
+            for cid in batch['custom_ids']
+        }
+        to_submit = {
+            cid: prompt for cid, prompt in requests.items()
+            if cid not in in_flight and state['results'].get(cid, {}).get('type') != 'succeeded'
+        }
+
+        if to_submit:
+            batch = client.messages.batches.create(requests=[
+                {'custom_id': cid, 'params': _message_params(prompt)}
+                for cid, prompt in to_submit.items()
+            ])
+            state['batches'].append({
+                'id': batch.id,
+                'custom_ids': list(to_submit),
+            })
+            self._save_state(state)
+            logging.info(f"Submitted analysis batch {batch.id} with {len(to_submit)} requests")
+        else:
+            logging.info(f"Resuming analysis batches from {self.state_path}")
+
+        deadline = time.monotonic() + self.max_wait
+        for batch in state['batches']:
+            if batch.get('ended'):
+                continue
+            if not self._wait(client, batch['id'], deadline):
+                logging.warning(f"Analysis batch {batch['id']} still running; will resume next run")
+                continue
+            for result in client.messages.batches.results(batch['id']):
+                state['results'][result.custom_id] = _result_state(result)
+            batch['ended'] = True
+            self._save_state(state)
+
+    def _wait(self, client, batch_id, deadline):
+        while True:
+            batch = client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == 'ended':
+                return True
+            if time.monotonic() + self.poll_interval > deadline:
+                return False
+            logging.debug(f"Analysis batch {batch_id} is {batch.processing_status}")
+            time.sleep(self.poll_interval)
+
+
+def _batch_item(entry: Dict, token_budgets: Dict) -> Dict:
+    content = str(entry.get('content', ''))
+    source = entry.get('source_name', 'Unknown Source')
+    title = entry.get('title', 'No Title')
+    source_type = entry.get('source_type')
+    metadata = source_metadata(entry)
+    custom_id = cache_key(content, source, title, source_type, metadata, PROMPT_VERSION)
+    prompts = _create_prompts(
+        content, source, title, source_type, metadata, token_budget_for(source_type, token_budgets)
+    )
+    if len(prompts) == 1:
+        requests = {custom_id: prompts[0]}
+    else:
+        # custom_id is limited to 64 characters, so chunk ids are re-hashed
+        requests = {
+            hashlib.sha256(f"{custom_id}:{index}".encode('utf-8')).hexdigest(): prompt
+            for index, prompt in enumerate(prompts)
+        }
+    return {
+        'custom_id': custom_id,
+        'requests': requests,
+        'parse_args': (title, content, source_type, metadata),
+    }
+
+
+def _result_state(result) -> Dict:
+    if result.result.type == 'succeeded':
+        return {'type': 'succeeded', 'text': _response_text(result.result.message)}
+    logging.error(f"Batch analysis request {result.custom_id} {result.result.type}")
+    return {'type': result.result.type}
@@ -0,0 +1,76 @@
+# src/analysis/chunking.py
+import re
+from typing import Dict, List
+
+from .tokens import CHARS_PER_TOKEN, estimate_tokens
+
+DEFAULT_TOKEN_BUDGET = 8000
+
+# Split points, most to least preferred: headings (markdown or HTML), then
+# paragraphs/list items, then single lines.
+_SECTION_BOUNDARY = re.compile(r'(?m)^(?=#{1,6}\s)|(?=<h[1-6][\s>])', re.IGNORECASE)
+_PARAGRAPH_BOUNDARY = re.compile(r'\n\s*\n|(?=<p[\s>])|(?=<li[\s>])', re.IGNORECASE)
+_LINE_BOUNDARY = re.compile(r'\n')
+_BOUNDARIES = (_SECTION_BOUNDARY, _PARAGRAPH_BOUNDARY, _LINE_BOUNDARY)
+
+
+def token_budget_for(source_type: str, budgets: Dict = None) -> int:
+    """
+    Return the content token budget configured for a source type.
+    """
+    budgets = budgets or {}
+    return int(budgets.get(source_type, budgets.get('default', DEFAULT_TOKEN_BUDGET)))
+
+
+def chunk_content(content: str, token_budget: int) -> List[str]:
+    """
+    Split content into chunks of at most ``token_budget`` estimated tokens.
+
+    Markdown and HTML headings are preferred split points so every chunk holds
+    whole sections of a changelog; oversized sections fall back to paragraph,
+    line and finally fixed-size splits. Neighbouring small pieces are packed
+    together greedily.
+    """
+    if estimate_tokens(content) <= token_budget:
+        return [content]
+
+    chunks = []
+    current = ''
+    for piece in _split(content, token_budget, 0):
+        if current and estimate_tokens(current + piece) > token_budget:
+            chunks.append(current)
+            current = ''
+        current += piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _split(text: str, token_budget: int, level: int) -> List[str]:
+    if estimate_tokens(text) <= token_budget:
+        return [text]
+
+    if level >= len(_BOUNDARIES):
+        size = token_budget * CHARS_PER_TOKEN
+        return [text[i:i + size] for i in range(0, len(text), size)]
+
+    pieces = [piece for piece in _split_keeping_separators(text, _BOUNDARIES[level]) if piece]
+    if len(pieces) == 1:
+        return _split(text, token_budget, level + 1)
+
+    result = []
+    for piece in pieces:
+        result.extend(_split(piece, token_budget, level + 1))
+    return result
+
+
+def _split_keeping_separators(text: str, pattern) -> List[str]:
+    pieces = []
+    start = 0
+    for match in pattern.finditer(text):
+        end = match.end()
+        if end > start:
+            pieces.append(text[start:end])
+            start = end
+    pieces.append(text[start:])
+    return pieces
@@ -0,0 +1,103 @@
+# src/analysis/executor.py
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+
+from .analysis_cache import AnalysisCache
+from .analyze_with_claude import analyze_entry
+from .chunking import token_budget_for
+from .rate_limiter import RateLimiter
+from src.metrics import get_metrics
+
+
+class AnalysisExecutor:
+    """
+    Runs analyze_entry over many entries concurrently.
+
+    All workers share one API client, one analysis cache and one rate limiter;
+    results are yielded in the order of the input entries.
+    """
+
+    def __init__(self, api_key, max_workers=4, requests_per_minute=50, tokens_per_minute=40000,
+                 max_retries=5, cache=None, token_budgets=None):
+        self.api_key = api_key
+        self.token_budgets = token_budgets or {}
+        self.max_workers = max(1, max_workers)
+        self.limiter = RateLimiter(requests_per_minute, tokens_per_minute, max_retries)
+        self.cache = cache
+
+    @classmethod
+    def from_config(cls, api_key, config):
+        """
+        Build an executor from the ``settings.analysis`` section of config.yml.
+        """
+        settings = config.get('settings') or {}
+        analysis_settings = settings.get('analysis') or {}
+        return cls(
+            api_key,
+            max_workers=analysis_settings.get('max_workers', 4),
+            requests_per_minute=analysis_settings.get('requests_per_minute', 50),
+            tokens_per_minute=analysis_settings.get('tokens_per_minute', 40000),
+            max_retries=analysis_settings.get('max_retries', 5),
+            cache=AnalysisCache.from_config(config),
+            token_budgets=analysis_settings.get('token_budgets')
+        )
+
+    def _analyze(self, entry: Dict) -> Dict:
+        with get_metrics().stage('analyze'):
+            return analyze_entry(
+                str(entry.get('content', '')),
+                entry.get('source_name', 'Unknown Source'),
+                entry.get('title', 'No Title'),
+                self.api_key,
+                source_type=entry.get('source_type'),
+                source_metadata=source_metadata(entry),
+                cache=self.cache,
+                limiter=self.limiter,
+                token_budget=token_budget_for(entry.get('source_type'), self.token_budgets)
+            )
+
+    def analyze_iter(self, entries):
+        """
+        Analyze a stream of entries, yielding ``(entry, analysis)`` in input order.
+
+        At most twice ``max_workers`` entries are in flight, so the stream is
+        consumed only as fast as analysis keeps up. Entries that already carry
+        an analysis pass through with ``None``.
+        """
+        window = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for entry in entries:
+                future = None if 'analysis' in entry else pool.submit(self._analyze, entry)
+                window.append((entry, future))
+                while len(window) >= self.max_workers * 2 or (window and _ready(window[0][1])):
+                    yield _resolve(window.popleft())
+            while window:
+                yield _resolve(window.popleft())
+
+    def close(self):
+        """
+        Close the analysis cache.
+        """
+        if self.cache is not None:
+            self.cache.close()
+
+
+def _ready(future):
+    return future is None or future.done()
+
+
+def _resolve(item):
+    entry, future = item
+    return entry, future.result() if future is not None else None
+
+
+def source_metadata(entry: Dict) -> Dict:
+    """
+    Metadata about an entry's source passed along with its analysis request.
+    """
+    return {
+        'provider_name': entry.get('provider_name', ''),
+        'link': entry.get('link', ''),
+        'status_url': entry.get('status_url'),
+    }
@@ -0,0 +1,86 @@
+# src/analysis/rate_limiter.py
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Classic token bucket refilled continuously at ``rate_per_minute``.
+    """
+
+    def __init__(self, rate_per_minute, capacity=None):
+        self.rate_per_minute = float(rate_per_minute)
+        self.capacity = float(capacity or rate_per_minute)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now, scale):
+        elapsed = now - self._updated
+        refill = elapsed * self.rate_per_minute * scale / 60.0
+        self._tokens = min(self.capacity, self._tokens + refill)
+        self._updated = now
+
+    def reserve(self, amount, now, scale=1.0):
+        """
+        Take ``amount`` tokens and return how long the caller must wait for them.
+        """
+        self._refill(now, scale)
+        amount = min(float(amount), self.capacity)
+        self._tokens -= amount
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens * 60.0 / (self.rate_per_minute * scale)
+
+
+class RateLimiter:
+    """
+    Enforces requests-per-minute and tokens-per-minute limits for the API.
+
+    Throughput adapts to the server: every 429 halves the effective rate and
+    each success slowly restores it.
+    """
+
+    def __init__(self, requests_per_minute=50, tokens_per_minute=40000, max_retries=5,
+                 min_scale=0.1, recovery_step=0.05):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.max_retries = max_retries
+        self.min_scale = min_scale
+        self.recovery_step = recovery_step
+        self.scale = 1.0
+        self._lock = threading.Lock()
+
+    def acquire(self, estimated_tokens):
+        """
+        Block until one request of ``estimated_tokens`` may be sent.
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(
+                self.requests.reserve(1, now, self.scale),
+                self.tokens.reserve(estimated_tokens, now, self.scale)
+            )
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_success(self):
+        with self._lock:
+            self.scale = min(1.0, self.scale + self.recovery_step)
+
+    def on_rate_limited(self, attempt, retry_after=None):
+        """
+        Record a 429 and return how many seconds to back off before retrying.
+        """
+        with self._lock:
+            self.scale = max(self.min_scale, self.scale / 2)
+        return self.backoff(attempt, retry_after)
+
+    def backoff(self, attempt, retry_after=None):
+        """
+        Seconds to wait before retry ``attempt``: ``retry_after`` if the server
+        sent one, otherwise exponential backoff with jitter.
+        """
+        if retry_after is not None:
+            return retry_after
+        return min(60.0, 2 ** attempt) + random.uniform(0, 1)
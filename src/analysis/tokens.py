@@ -0,0 +1,14 @@
+# src/analysis/tokens.py
+import math
+
+# Rough characters-per-token ratio for English prose and markup.
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text):
+    """
+    Cheaply estimate the number of tokens in a piece of text.
+    """
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
@@ -0,0 +1,279 @@
+# src/daemon.py
+import hashlib
+import http.server
+import json
+import logging
+import os
+import signal
+import threading
+import time
+from datetime import datetime
+
+import pytz
+
+from src.aggregator.config_loader import load_config
+from src.aggregator.entry_store import content_hash, entry_identity
+from src.aggregator.news_aggregator import NewsAggregator
+from src.metrics import reset_metrics, write_run_metrics
+from src.output.markdown_renderer import MarkdownRenderer
+from src.pipeline import build_pipeline
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+# Daemon settings read only at start-up, with their defaults
+RESTART_SETTINGS = {'host': '127.0.0.1', 'port': 8700}
+
+
+def build_fingerprint(entries, week_range, config_text):
+    """
+    Hash everything the generated site depends on: entries and their analysis,
+    the aggregation window, the configuration and the template files.
+    """
+    digest = hashlib.sha256()
+    digest.update(config_text)
+    digest.update(f"{week_range[0].isoformat()}|{week_range[1].isoformat()}".encode('utf-8'))
+    for key in sorted(
+        json.dumps([
+            entry.get('entry_id') or entry_identity(entry),
+            entry.get('content_hash') or content_hash(entry),
+            entry.get('analysis'),
+            entry.get('duplicates'),
+        ], sort_keys=True, default=str)
+        for entry in entries
+    ):
+        digest.update(key.encode('utf-8'))
+    for directory, _, files in sorted(os.walk(TEMPLATE_DIR)):
+        for name in sorted(files):
+            path = os.path.join(directory, name)
+            digest.update(f"{path}:{os.stat(path).st_mtime_ns}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+class AggregatorDaemon:
+    """
+    Long-running aggregator that keeps sessions, stores, templates and the
+    markdown worker pool warm between refreshes.
+
+    On a configuration reload every component is rebuilt and the previous
+    ones are closed; the endpoint's host and port only change on restart.
+
+    Sources are refreshed every ``settings.daemon.refresh_interval`` seconds
+    and ``dist/`` is regenerated only when the fingerprint of its inputs
+    changes. ``config.yml`` is reloaded when it changes on disk, and a local
+    HTTP endpoint (``POST /rebuild``, ``GET /status``) triggers an immediate
+    rebuild or reports the last one.
+    """
+
+    def __init__(self, config_path, build_analyzer, write_outputs):
+        self.config_path = config_path
+        self.build_analyzer = build_analyzer
+        self.write_outputs = write_outputs
+        self._rebuild = threading.Event()
+        self._stop = threading.Event()
+        self._status_lock = threading.Lock()
+        self.status = {'state': 'starting', 'builds': 0, 'refreshes': 0}
+        self.fingerprint = None
+        self.config = None
+        self.config_mtime = None
+        self.aggregator = None
+        self.analyzer = None
+        self.markdown_renderer = None
+        self._load_config()
+
+    def _settings(self):
+        return (self.config.get('settings') or {}).get('daemon') or {}
+
+    def _load_config(self):
+        """
+        (Re)load the configuration and rebuild the components that depend on it.
+
+        A configuration that fails to load is logged and the previous one kept.
+        """
+        mtime = os.stat(self.config_path).st_mtime_ns
+        try:
+            config = load_config(self.config_path)
+            with open(self.config_path, 'rb') as f:
+                self.config_text = f.read()
+        except Exception as e:
+            if self.config is None:
+                raise
+            logging.error(f"Keeping previous configuration: {e}")
+            self.config_mtime = mtime
+            return
+
+        self._close_components()
+        if self.config is not None:
+            self._warn_restart_settings(config)
+        self.config = config
+        self.config_mtime = mtime
+        self.aggregator = NewsAggregator(config)
+        self.analyzer = self.build_analyzer(config)
+        self.markdown_renderer = MarkdownRenderer.from_config(config)
+        self.fingerprint = None  # Output depends on the configuration
+        logging.info(f"Loaded configuration from {self.config_path}")
+
+    def _warn_restart_settings(self, config):
+        previous = self._settings()
+        current = (config.get('settings') or {}).get('daemon') or {}
+        for key, default in RESTART_SETTINGS.items():
+            before, after = previous.get(key, default), current.get(key, default)
+            if before != after:
+                logging.warning(
+                    f"settings.daemon.{key} changed from {before!r} to {after!r}; "
+                    f"restart the daemon to apply it"
+                )
+
+    def _reload_if_changed(self):
+        """
+        Reload the configuration if the file changed; returns True when it did.
+        """
+        try:
+            mtime = os.stat(self.config_path).st_mtime_ns
+        except OSError as e:
+            logging.error(f"Cannot stat {self.config_path}: {e}")
+            return False
+        if mtime == self.config_mtime:
+            return False
+        logging.info(f"{self.config_path} changed; reloading")
+        self._load_config()
+        return True
+
+    def _set_status(self, **fields):
+        with self._status_lock:
+            self.status.update(fields)
+
+    def get_status(self):
+        with self._status_lock:
+            return dict(self.status)
+
+    def refresh(self, force=False):
+        """
+        Run the pipeline and regenerate the site if its inputs changed.
+
+        Returns True when ``dist/`` was rebuilt.
+        """
+        started = time.perf_counter()
+        self._set_status(state='refreshing')
+        reset_metrics()
+        week_range = self.aggregator.refresh_week_range()
+        stream = build_pipeline(self.aggregator, self.config, self.analyzer)
+        try:
+            entries = list(stream)
+        finally:
+            # Stops the pipeline threads and fetch pool if a stage failed
+            stream.close()
+        fingerprint = build_fingerprint(entries, week_range, self.config_text)
+
+        built = force or fingerprint != self.fingerprint
+        if built:
+            self.write_outputs(self.config, iter(entries), week_range, self.markdown_renderer)
+            self.fingerprint = fingerprint
+            logging.info(
+                f"Rebuilt site with {len(entries)} entries "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+        else:
+            logging.info(f"No input changes across {len(entries)} entries; site left as is")
+        write_run_metrics(self.config)
+
+        now = datetime.now(pytz.UTC).isoformat()
+        status = self.get_status()
+        self._set_status(
+            state='idle',
+            refreshes=status['refreshes'] + 1,
+            builds=status['builds'] + int(built),
+            last_refresh=now,
+            last_build=now if built else status.get('last_build'),
+            entries=len(entries),
+            fingerprint=self.fingerprint,
+            refresh_seconds=round(time.perf_counter() - started, 3)
+        )
+        return built
+
+    def trigger(self):
+        """
+        Request an immediate rebuild from another thread.
+        """
+        self._rebuild.set()
+
+    def stop(self):
+        self._stop.set()
+        self._rebuild.set()
+
+    def _start_http(self):
+        settings = self._settings()
+        daemon = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                logging.debug(f"daemon http: {format % args}")
+
+            def _reply(self, status, payload):
+                body = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                if self.path.rstrip('/') != '/rebuild':
+                    self._reply(404, {'error': 'not found'})
+                    return
+                daemon.trigger()
+                self._reply(202, {'status': 'rebuild scheduled'})
+
+            def do_GET(self):
+                if self.path.rstrip('/') != '/status':
+                    self._reply(404, {'error': 'not found'})
+                    return
+                self._reply(200, daemon.get_status())
+
+        host = settings.get('host', RESTART_SETTINGS['host'])
+        port = settings.get('port', RESTART_SETTINGS['port'])
+        server = http.server.ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='daemon-http', daemon=True).start()
+        logging.info(
+            f"Rebuild endpoint listening on http://{host}:{server.server_address[1]}/rebuild"
+        )
+        return server
+
+    def serve_forever(self):
+        """
+        Refresh on schedule, on config changes and on request until stopped.
+
+        SIGTERM and SIGINT stop the loop after the current refresh.
+        """
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: self.stop())
+        server = self._start_http()
+        next_refresh = 0.0
+        try:
+            while not self._stop.is_set():
+                reloaded = self._reload_if_changed()
+                forced = self._rebuild.is_set()
+                if forced or reloaded or time.time() >= next_refresh:
+                    self._rebuild.clear()
+                    try:
+                        self.refresh(force=forced)
+                    except Exception as e:
+                        logging.error(f"Refresh failed: {e}")
+                        self._set_status(state='error', error=str(e))
+                    next_refresh = time.time() + self._settings().get('refresh_interval', 900)
+                self._rebuild.wait(timeout=max(0.0, min(
+                    self._settings().get('reload_check_interval', 5), next_refresh - time.time()
+                )))
+        finally:
+            server.shutdown()
+            server.server_close()
+            self._close_components()
+            logging.info("Aggregator daemon stopped")
+
+    def _close_components(self):
+        if self.markdown_renderer is not None:
+            self.markdown_renderer.close()
+        if self.analyzer is not None:
+            self.analyzer.close()
+        if self.aggregator is not None:
+            self.aggregator.close()
@@ -0,0 +1,278 @@
+# src/metrics.py
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytz
+
+from src.utils.storage import atomic_write
+
+METRIC_PREFIX = 'aggregator'
+
+# Numeric per-source fields exported as Prometheus gauges
+SOURCE_GAUGES = (
+    'fetch_seconds', 'parse_seconds', 'bytes', 'status', 'cache_hit', 'entries', 'error', 'polled'
+)
+
+
+class Metrics:
+    """
+    Thread-safe collector of run timings, counters and per-source fetch data.
+
+    Timers accumulate count/sum/max per (name, labels). When profiling is
+    enabled, one cProfile profiler covers the whole run and every ``stage``
+    block records its net traced allocation; the merged profile and a
+    tracemalloc snapshot of the top allocation sites are written at the end.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self.timers = {}
+        self.counters = {}
+        self.sources = {}
+        self.profile_dir = None
+        self._profilers = []
+        self._allocations = {}
+
+    def enable_profiling(self, profile_dir):
+        """
+        Profile the rest of the run and dump results into ``profile_dir``.
+
+        Call once, from the main thread, before any worker threads start.
+        Python 3.12+ allows a single active profiler, which sees every thread;
+        earlier versions profile per thread, so each new thread gets its own
+        profiler and all of them are merged when dumped.
+        """
+        os.makedirs(profile_dir, exist_ok=True)
+        self.profile_dir = profile_dir
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+        if sys.version_info < (3, 12):
+            threading.setprofile(self._profile_thread)
+        self._start_profiler()
+
+    def _start_profiler(self):
+        profiler = cProfile.Profile()
+        with self._lock:
+            self._profilers.append(profiler)
+        profiler.enable()
+
+    def _profile_thread(self, *args):
+        # Called for the first profiling event of a new thread; enabling the
+        # thread's own profiler replaces this hook
+        self._start_profiler()
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            count, total, peak = self.timers.get(key, (0, 0.0, 0.0))
+            self.timers[key] = (count + 1, total + seconds, max(peak, seconds))
+
+    def increment(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """
+        Time a block and add it to the ``name`` timer.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time one pass through a pipeline stage; when profiling, also record its allocations.
+        """
+        if self.profile_dir is None:
+            with self.timer('stage_seconds', stage=name):
+                yield
+            return
+
+        allocated_before = tracemalloc.get_traced_memory()[0]
+        with self.timer('stage_seconds', stage=name):
+            yield
+        # Process-wide, so overlapping stages are included
+        allocated = tracemalloc.get_traced_memory()[0] - allocated_before
+        with self._lock:
+            self._allocations[name] = self._allocations.get(name, 0) + allocated
+
+    def record_source(self, url, **fields):
+        """
+        Merge fields into the per-source record for ``url``.
+        """
+        with self._lock:
+            self.sources.setdefault(url, {'url': url}).update(fields)
+
+    def report(self):
+        """
+        Return the run report as a JSON-serializable dict.
+        """
+        with self._lock:
+            timers = [
+                {
+                    'name': name, 'labels': dict(labels), 'count': count,
+                    'seconds': total, 'max_seconds': peak,
+                }
+                for (name, labels), (count, total, peak) in sorted(self.timers.items())
+            ]
+            counters = [
+                {'name': name, 'labels': dict(labels), 'value': value}
+                for (name, labels), value in sorted(self.counters.items())
+            ]
+            sources = sorted(self.sources.values(), key=lambda s: -s.get('fetch_seconds', 0))
+        return {
+            'started_at': datetime.fromtimestamp(self.started_at, pytz.UTC).isoformat(),
+            'duration_seconds': time.time() - self.started_at,
+            'timers': timers,
+            'counters': counters,
+            'sources': sources,
+        }
+
+    def write_json(self, path):
+        report = self.report()
+        atomic_write(path, json.dumps(report, indent=2, default=str))
+        logging.info(f"Run report written to {path}")
+        return report
+
+    def write_prometheus(self, path):
+        """
+        Write metrics in the Prometheus text format for the node_exporter textfile collector.
+        """
+        report = self.report()
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            full_name = f"{METRIC_PREFIX}_{name}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {kind}")
+            for labels, value in samples:
+                label_text = ','.join(
+                    f'{key}="{_escape_label(label_value)}"'
+                    for key, label_value in sorted(labels.items())
+                )
+                lines.append(
+                    f"{full_name}{{{label_text}}} {value}" if label_text else f"{full_name} {value}"
+                )
+
+        metric('run_duration_seconds', 'gauge', 'Duration of the last run.',
+               [({}, round(report['duration_seconds'], 6))])
+        metric('run_timestamp_seconds', 'gauge', 'Start time of the last run.',
+               [({}, int(self.started_at))])
+
+        for name in sorted({timer['name'] for timer in report['timers']}):
+            samples = [timer for timer in report['timers'] if timer['name'] == name]
+            metric(f"{name}_total", 'gauge', f"Total seconds spent in {name}.",
+                   [(timer['labels'], round(timer['seconds'], 6)) for timer in samples])
+            metric(f"{name}_count", 'gauge', f"Number of {name} observations.",
+                   [(timer['labels'], timer['count']) for timer in samples])
+            metric(f"{name}_max", 'gauge', f"Slowest {name} observation.",
+                   [(timer['labels'], round(timer['max_seconds'], 6)) for timer in samples])
+
+        for name in sorted({counter['name'] for counter in report['counters']}):
+            metric(f"{name}_total", 'counter', f"Count of {name}.",
+                   [(c['labels'], c['value']) for c in report['counters'] if c['name'] == name])
+
+        for field in SOURCE_GAUGES:
+            samples = [
+                ({'source': source.get('name', source['url'])}, float(source[field]))
+                for source in report['sources'] if isinstance(source.get(field), (int, float))
+            ]
+            if samples:
+                metric(f"source_{field}", 'gauge',
+                       f"Per-source {field.replace('_', ' ')} of the last run.", samples)
+
+        atomic_write(path, '\n'.join(lines) + '\n')
+        logging.info(f"Prometheus metrics written to {path}")
+
+    def dump_profiles(self):
+        """
+        Stop profiling; write the merged profile, per-stage allocations and top allocation sites.
+        """
+        if self.profile_dir is None:
+            return
+        with self._lock:
+            profilers, self._profilers = self._profilers, []
+            allocations = dict(self._allocations)
+
+        if profilers:
+            threading.setprofile(None)
+            stats = pstats.Stats(profilers[0])
+            for profiler in profilers[1:]:
+                stats.add(profiler)
+            stats.dump_stats(os.path.join(self.profile_dir, 'run.prof'))
+            text = io.StringIO()
+            stats.stream = text
+            stats.sort_stats('cumulative').print_stats(60)
+            atomic_write(os.path.join(self.profile_dir, 'run.txt'), text.getvalue())
+
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [
+            f"traced memory: current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB", ""
+        ]
+        lines.append("net allocation per stage:")
+        lines.extend(
+            f"{size / 1024:12.1f} KiB  {name}" for name, size in sorted(allocations.items())
+        )
+        lines.extend(["", "top allocation sites still held:"])
+        top = tracemalloc.take_snapshot().statistics('lineno')[:25]
+        lines.extend(str(stat) for stat in top)
+        atomic_write(os.path.join(self.profile_dir, 'tracemalloc.txt'), '\n'.join(lines) + '\n')
+        logging.info(
+            f"Profiles written to {self.profile_dir} "
+            f"(traced memory {current / 2**20:.1f} MiB, peak {peak / 2**20:.1f} MiB)"
+        )
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+_metrics = Metrics()
+
+
+def get_metrics():
+    """
+    Return the process-wide metrics collector.
+    """
+    return _metrics
+
+
+def write_run_metrics(config):
+    """
+    Write the run report, Prometheus metrics and any stage profiles per ``settings.metrics``.
+    """
+    metrics_settings = (config.get('settings') or {}).get('metrics') or {}
+    metrics = get_metrics()
+    try:
+        if metrics_settings.get('report_path', '.cache/run_report.json'):
+            metrics.write_json(metrics_settings.get('report_path', '.cache/run_report.json'))
+        if metrics_settings.get('prometheus_path'):
+            metrics.write_prometheus(metrics_settings['prometheus_path'])
+        metrics.dump_profiles()
+    except OSError as e:
+        logging.error(f"Error writing run metrics: {e}")
+
+
+def reset_metrics():
+    """
+    Start a fresh collector, e.g. before another run in the same process.
+    """
+    global _metrics
+    _metrics = Metrics()
+    return _metrics
@@ -1,3 +1,19 @@
 # src/output/__init__.py
-from .html_generator import generate_html
-from .rss_generator import generate_rss
+# Generators are imported on first access, so importing a light submodule
+# (history, feed_writer, search_index) does not load jinja2 or markdown.
+_LAZY = {
+    'generate_html': '.html_generator',
+    'generate_rss': '.rss_generator',
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = list(_LAZY)
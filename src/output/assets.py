@@ -0,0 +1,235 @@
+# src/output/assets.py
+import hashlib
+import json
+import logging
+import os
+import re
+
+from src.utils.icon_mapping import ICON_MAPPING
+from src.utils.storage import atomic_write
+
+# Bump when the build output changes for unchanged sources
+ASSET_PIPELINE_VERSION = 1
+
+ICONS_DIR = os.path.join('src', 'assets', 'icons')
+MANIFEST_NAME = 'manifest.json'
+
+_STYLE_BLOCK_RE = re.compile(r'<style[^>]*>(.*?)</style>', re.S)
+_SCRIPT_BLOCK_RE = re.compile(r'<script[^>]*>(.*?)</script>', re.S)
+
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCTUATION_RE = re.compile(r'\s*([{}:;,>])\s*')
+
+_SVG_PROLOG_RE = re.compile(r'<\?xml.*?\?>|<!--.*?-->|<script\b[^>]*?(?:/>|>.*?</script>)', re.S)
+_SVG_ROOT_RE = re.compile(r'<svg\b([^>]*)>(.*)</svg>', re.S)
+_SVG_ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*"([^"]*)"')
+_SVG_ID_RE = re.compile(r'\bid="([^"]+)"')
+_SVG_CLASS_RE = re.compile(r'\bclass="([^"]+)"')
+_SVG_STYLE_CLASS_RE = re.compile(r'\.(-?[A-Za-z_][\w-]*)')
+# Root attributes that would break stacking icons in one document
+_SVG_ROOT_DROP = {'id', 'width', 'height', 'x', 'y', 'style', 'xml:space'}
+
+
+def minify_css(css):
+    """
+    Strip comments and insignificant whitespace from a stylesheet.
+    """
+    css = _CSS_COMMENT_RE.sub('', css)
+    css = _CSS_SPACE_RE.sub(' ', css)
+    css = _CSS_PUNCTUATION_RE.sub(r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+def minify_js(js):
+    """
+    Drop indentation, blank lines and whole-line comments from a script.
+
+    Only line-level whitespace is touched, so string and regex literals are
+    never rewritten.
+    """
+    lines = (line.strip() for line in js.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+
+def _prefix_svg(name, body):
+    # Icons share one document: namespace ids and classes per icon
+    ids = set(_SVG_ID_RE.findall(body))
+    for value in ids:
+        body = body.replace(f'id="{value}"', f'id="{name}-{value}"')
+        body = body.replace(f'#{value})', f'#{name}-{value})')
+        body = body.replace(f'href="#{value}"', f'href="#{name}-{value}"')
+    body = _SVG_CLASS_RE.sub(
+        lambda m: 'class="' + ' '.join(f'{name}-{c}' for c in m.group(1).split()) + '"', body
+    )
+    return re.sub(
+        r'(<style[^>]*>)(.*?)(</style>)',
+        lambda m: m.group(1) + _SVG_STYLE_CLASS_RE.sub(rf'.{name}-\1', m.group(2)) + m.group(3),
+        body,
+        flags=re.S
+    )
+
+
+def _sprite_symbol(name, svg):
+    match = _SVG_ROOT_RE.search(_SVG_PROLOG_RE.sub('', svg))
+    if match is None:
+        return None
+    attributes = dict(_SVG_ATTR_RE.findall(match.group(1)))
+    if 'viewBox' not in attributes and 'width' in attributes and 'height' in attributes:
+        width, height = (attributes[key].replace('px', '') for key in ('width', 'height'))
+        attributes['viewBox'] = f'0 0 {width} {height}'
+    kept = ' '.join(
+        f'{key}="{value}"' for key, value in attributes.items() if key not in _SVG_ROOT_DROP
+    )
+    body = _CSS_SPACE_RE.sub(' ', _prefix_svg(name, match.group(2))).strip()
+    return f'<svg id="{name}" {kept}>{body}</svg>'
+
+
+def build_icon_sprite(icons_dir=ICONS_DIR):
+    """
+    Combine the provider icons into one SVG stack.
+
+    Each icon becomes a nested <svg id="<name>"> shown only when it is the URL
+    fragment target, so ``icons.svg#github`` renders the GitHub icon in an <img>.
+    Returns the sprite markup and the names of the icons it contains.
+    """
+    symbols = []
+    names = []
+    for filename in sorted(set(ICON_MAPPING.values())):
+        path = os.path.join(icons_dir, filename)
+        name = os.path.splitext(filename)[0]
+        svg = open(path, encoding='utf-8').read() if os.path.exists(path) else ''
+        symbol = _sprite_symbol(name, svg)
+        if symbol is None:
+            logging.warning(f"Icon {path} is missing or not an SVG; using the fallback icon")
+            continue
+        symbols.append(symbol)
+        names.append(name)
+    sprite = (
+        '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">'
+        '<style>svg>svg:not(:target){display:none}</style>'
+        + ''.join(symbols) + '</svg>'
+    )
+    return sprite, names
+
+
+def _source_hash(paths):
+    digest = hashlib.sha256(str(ASSET_PIPELINE_VERSION).encode('utf-8'))
+    for path in paths:
+        digest.update(path.encode('utf-8'))
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _build_styles(template_dir):
+    text = open(os.path.join(template_dir, 'styles.html'), encoding='utf-8').read()
+    return minify_css('\n'.join(_STYLE_BLOCK_RE.findall(text))), {}
+
+
+def _build_scripts(template_dir):
+    text = open(os.path.join(template_dir, 'scripts.html'), encoding='utf-8').read()
+    return minify_js('\n'.join(_SCRIPT_BLOCK_RE.findall(text))), {}
+
+
+def _build_icons(template_dir):
+    sprite, names = build_icon_sprite()
+    return sprite, {'icons': names}
+
+
+def _asset_sources(template_dir):
+    icon_paths = [os.path.join(ICONS_DIR, f) for f in sorted(set(ICON_MAPPING.values()))]
+    return {
+        'styles.css': ([os.path.join(template_dir, 'styles.html')], _build_styles),
+        'scripts.js': ([os.path.join(template_dir, 'scripts.html')], _build_scripts),
+        'icons.svg': (icon_paths, _build_icons),
+    }
+
+
+class AssetManifest:
+    """
+    Fingerprinted asset URLs for templates, as written to assets/manifest.json.
+    """
+
+    def __init__(self, entries, assets_dir):
+        self.entries = entries
+        self.assets_dir = assets_dir
+
+    def url(self, name):
+        return f"assets/{self.entries[name]['file']}"
+
+    def icon_url(self, icon_filename):
+        name = os.path.splitext(icon_filename)[0]
+        if name not in self.entries['icons.svg'].get('icons', []):
+            name = 'question'
+        return f"{self.url('icons.svg')}#{name}"
+
+    def add(self, name, content):
+        """
+        Write generated ``content`` as a fingerprinted asset and return its URL.
+
+        Generated assets depend on the run rather than on source files, so they
+        are named after the hash of their own content. The previous file is
+        removed as stale by the next build_assets.
+        """
+        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        stem, extension = os.path.splitext(name)
+        filename = f"{stem}-{content_hash[:12]}{extension}"
+        atomic_write(os.path.join(self.assets_dir, filename), content)
+        self.entries[name] = {'file': filename, 'hash': content_hash}
+        self.save()
+        return self.url(name)
+
+    def save(self):
+        manifest = json.dumps(self.entries, indent=2, sort_keys=True)
+        atomic_write(os.path.join(self.assets_dir, MANIFEST_NAME), manifest)
+
+
+def build_assets(output_dir, template_dir):
+    """
+    Build minified, content-hashed assets into ``output_dir/assets``.
+
+    An asset is rebuilt only when the hash of its sources differs from the one
+    recorded in the manifest or its output file is gone. Fingerprinted files
+    that the new manifest no longer references are removed.
+    """
+    assets_dir = os.path.join(output_dir, 'assets')
+    os.makedirs(assets_dir, exist_ok=True)
+    manifest_path = os.path.join(assets_dir, MANIFEST_NAME)
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = {}
+
+    entries = {}
+    for name, (sources, build) in _asset_sources(template_dir).items():
+        source_hash = _source_hash(sources)
+        cached = previous.get(name)
+        if (cached and cached.get('hash') == source_hash
+                and os.path.exists(os.path.join(assets_dir, cached['file']))):
+            entries[name] = cached
+            continue
+
+        content, extra = build(template_dir)
+        stem, extension = os.path.splitext(name)
+        filename = f"{stem}-{source_hash[:12]}{extension}"
+        with open(os.path.join(assets_dir, filename), 'w', encoding='utf-8') as f:
+            f.write(content)
+        entries[name] = {'file': filename, 'hash': source_hash, **extra}
+        logging.info(f"Built asset {filename}")
+
+    stale = (
+        {entry['file'] for entry in previous.values()}
+        - {entry['file'] for entry in entries.values()}
+    )
+    for filename in stale:
+        try:
+            os.remove(os.path.join(assets_dir, filename))
+        except OSError:
+            pass
+
+    manifest = AssetManifest(entries, assets_dir)
+    manifest.save()
+    return manifest
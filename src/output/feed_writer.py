@@ -0,0 +1,204 @@
+# src/output/feed_writer.py
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from xml.sax.saxutils import escape, quoteattr
+
+import pytz
+
+from src.aggregator.entry_store import entry_identity
+from src.aggregator.html_parsing import html_to_text
+from src.utils.storage import atomic_open
+
+JSON_FEED_VERSION = 'https://jsonfeed.org/version/1.1'
+FEED_FILES = {'rss': 'feed.xml', 'atom': 'atom.xml', 'json': 'feed.json'}
+SNIPPET_LENGTH = 500
+
+
+def _parse_date(value):
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=pytz.UTC)
+
+
+def _description(entry, description_mode):
+    if description_mode == 'content':
+        return str(entry.get('content', ''))
+    analysis = entry.get('analysis') or {}
+    if analysis.get('summary') and not analysis.get('is_fallback'):
+        return analysis['summary']
+    text = ' '.join(html_to_text(str(entry.get('content', ''))).split())
+    return text if len(text) <= SNIPPET_LENGTH else text[:SNIPPET_LENGTH].rstrip() + '...'
+
+
+def feed_item(entry, description_mode='summary'):
+    """
+    Convert an aggregated entry into a JSON Feed item, the stored item format.
+    """
+    description = _description(entry, description_mode)
+    item = {
+        'id': entry_identity(entry),
+        'url': entry.get('link', '#'),
+        'title': entry.get('title', 'No Title'),
+        'date_published': str(entry.get('published', '')),
+        'authors': [{'name': entry.get('source_name', 'Unknown Source')}],
+        'tags': list((entry.get('analysis') or {}).get('categories', [])),
+    }
+    if description_mode == 'content':
+        item['content_html'] = description
+    else:
+        item['summary'] = description
+        item['content_text'] = description
+    return item
+
+
+class FeedWriter:
+    """
+    Maintain rolling-window RSS, Atom and JSON feeds in ``output_dir``.
+
+    Published items are kept in a JSON merge store at ``state_path``, whatever
+    ``formats`` are written: new items are merged into it by id, then only
+    items from the last ``max_weeks`` weeks are kept, newest first, up to
+    ``max_items``. Without a store, a previous feed.json in ``output_dir`` seeds
+    the merge. Every file is streamed item by item to a temporary file that
+    replaces the old one when complete.
+    """
+
+    def __init__(self, output_dir='dist', site_url='', title='DevOps Updates Digest',
+                 formats=('rss', 'atom', 'json'), max_items=200, max_weeks=8,
+                 description_mode='summary', state_path='.cache/feed_items.json'):
+        self.output_dir = output_dir
+        self.state_path = state_path
+        self.site_url = site_url
+        self.title = title
+        self.formats = list(formats)
+        self.max_items = max_items
+        self.max_weeks = max_weeks
+        self.description_mode = description_mode
+
+    @classmethod
+    def from_config(cls, config, output_dir='dist'):
+        """
+        Build the writer described by ``settings.feeds``.
+        """
+        settings = config.get('settings') or {}
+        feed_settings = settings.get('feeds') or {}
+        return cls(
+            output_dir,
+            site_url=feed_settings.get('site_url', ''),
+            title=feed_settings.get('title', 'DevOps Updates Digest'),
+            formats=feed_settings.get('formats', ['rss', 'atom', 'json']),
+            max_items=feed_settings.get('max_items', 200),
+            max_weeks=feed_settings.get('max_weeks', 8),
+            description_mode=feed_settings.get('description', 'summary'),
+            state_path=feed_settings.get(
+                'state_path', os.path.join(settings.get('cache_dir', '.cache'), 'feed_items.json')
+            )
+        )
+
+    def write(self, entries, description):
+        """
+        Merge entries into the existing feeds and rewrite every configured format.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        items = {item['id']: item for item in self._existing_items()}
+        for entry in entries:
+            item = feed_item(entry, self.description_mode)
+            items[item['id']] = item
+
+        cutoff = datetime.now(pytz.UTC) - timedelta(weeks=self.max_weeks)
+        dated = [(_parse_date(item.get('date_published')), item) for item in items.values()]
+        window = sorted(
+            ((date, item) for date, item in dated if date is not None and date >= cutoff),
+            key=lambda pair: pair[0],
+            reverse=True
+        )[:self.max_items]
+
+        writers = {'rss': self._write_rss, 'atom': self._write_atom, 'json': self._write_json}
+        for feed_format in self.formats:
+            path = os.path.join(self.output_dir, FEED_FILES[feed_format])
+            with atomic_open(path) as f:
+                writers[feed_format](f, window, description)
+            logging.info(f"{feed_format.upper()} feed with {len(window)} items written to {path}")
+        self._save_items(window)
+
+    def _existing_items(self):
+        for path, load in (
+            (self.state_path, lambda data: data['items']),
+            (os.path.join(self.output_dir, FEED_FILES['json']), lambda data: data.get('items', [])),
+        ):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    return load(json.load(f))
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                continue
+        return []
+
+    def _save_items(self, window):
+        with atomic_open(self.state_path) as f:
+            f.write('{"items": [\n')
+            for position, (date, item) in enumerate(window):
+                f.write((',\n' if position else '') + json.dumps(item))
+            f.write('\n]}\n')
+
+    def _write_rss(self, f, window, description):
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        f.write('<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom"><channel>')
+        f.write(f'<title>{escape(self.title)}</title><link>{escape(self.site_url)}</link>')
+        f.write(f'<description>{escape(description)}</description><language>en</language>')
+        f.write(f'<lastBuildDate>{format_datetime(datetime.now(pytz.UTC))}</lastBuildDate>')
+        f.write(f'<atom:link href={quoteattr(self.site_url + FEED_FILES["rss"])} '
+                f'rel="self" type="application/rss+xml"/>\n')
+        for date, item in window:
+            f.write(f'<item><title>{escape(item["title"])}</title>')
+            f.write(f'<link>{escape(item["url"])}</link>')
+            f.write(f'<guid isPermaLink="false">{escape(item["id"])}</guid>')
+            f.write(f'<pubDate>{format_datetime(date)}</pubDate>')
+            body = item.get('content_html', item.get('summary', ''))
+            f.write(f'<description>{escape(body)}</description>')
+            for tag in item.get('tags', []):
+                f.write(f'<category>{escape(tag)}</category>')
+            f.write('</item>\n')
+        f.write('</channel></rss>\n')
+
+    def _write_atom(self, f, window, description):
+        updated = window[0][0] if window else datetime.now(pytz.UTC)
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        f.write('<feed xmlns="http://www.w3.org/2005/Atom">')
+        f.write(f'<title>{escape(self.title)}</title><subtitle>{escape(description)}</subtitle>')
+        f.write(f'<id>{escape(self.site_url or self.title)}</id>')
+        f.write(f'<link href={quoteattr(self.site_url)}/>')
+        f.write(f'<link rel="self" href={quoteattr(self.site_url + FEED_FILES["atom"])}/>')
+        f.write(f'<updated>{updated.isoformat()}</updated>\n')
+        for date, item in window:
+            f.write(f'<entry><title>{escape(item["title"])}</title><id>{escape(item["id"])}</id>')
+            f.write(f'<link href={quoteattr(item["url"])}/>')
+            f.write(f'<published>{date.isoformat()}</published>')
+            f.write(f'<updated>{date.isoformat()}</updated>')
+            for author in item.get('authors', []):
+                f.write(f'<author><name>{escape(author["name"])}</name></author>')
+            for tag in item.get('tags', []):
+                f.write(f'<category term={quoteattr(tag)}/>')
+            if 'content_html' in item:
+                f.write(f'<content type="html">{escape(item["content_html"])}</content>')
+            else:
+                f.write(f'<summary>{escape(item.get("summary", ""))}</summary>')
+            f.write('</entry>\n')
+        f.write('</feed>\n')
+
+    def _write_json(self, f, window, description):
+        header = {
+            'version': JSON_FEED_VERSION,
+            'title': self.title,
+            'home_page_url': self.site_url,
+            'feed_url': self.site_url + FEED_FILES['json'],
+            'description': description,
+        }
+        f.write(json.dumps(header)[:-1] + ', "items": [\n')
+        for position, (date, item) in enumerate(window):
+            f.write((',\n' if position else '') + json.dumps(item))
+        f.write('\n]}\n')
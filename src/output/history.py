@@ -0,0 +1,263 @@
+# src/output/history.py
+import json
+import logging
+import os
+import re
+import sqlite3
+from datetime import datetime
+
+import pytz
+
+from src.aggregator.entry import utc_iso
+from src.aggregator.entry_store import entry_identity
+from src.utils.storage import SQLiteStore
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    entry_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    link TEXT,
+    provider TEXT,
+    source_name TEXT,
+    source_type TEXT,
+    published TEXT,
+    impact TEXT,
+    has_breaking INTEGER NOT NULL DEFAULT 0,
+    has_security INTEGER NOT NULL DEFAULT 0,
+    summary TEXT,
+    changes TEXT,
+    content TEXT,
+    analysis TEXT,
+    week_start TEXT,
+    archived_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_published ON entries (published);
+CREATE INDEX IF NOT EXISTS entries_provider ON entries (provider, published);
+CREATE INDEX IF NOT EXISTS entries_impact ON entries (impact, published);
+
+CREATE TABLE IF NOT EXISTS entry_categories (
+    entry_id TEXT NOT NULL,
+    category TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (category, entry_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entry_categories_entry ON entry_categories (entry_id);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    title, summary, changes, content, content='entries', content_rowid='rowid'
+);
+
+CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts (rowid, title, summary, changes, content)
+    VALUES (new.rowid, new.title, new.summary, new.changes, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts (entries_fts, rowid, title, summary, changes, content)
+    VALUES ('delete', old.rowid, old.title, old.summary, old.changes, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_au AFTER UPDATE ON entries BEGIN
+    INSERT INTO entries_fts (entries_fts, rowid, title, summary, changes, content)
+    VALUES ('delete', old.rowid, old.title, old.summary, old.changes, old.content);
+    INSERT INTO entries_fts (rowid, title, summary, changes, content)
+    VALUES (new.rowid, new.title, new.summary, new.changes, new.content);
+END;
+"""
+
+# Analysis lists whose text is searchable alongside title, summary and content
+CHANGE_FIELDS = (
+    'key_changes', 'breaking_changes', 'security_updates', 'new_features', 'deprecations'
+)
+
+_FTS_OPERATORS = {'AND', 'OR', 'NOT'}
+_FTS_PLAIN = re.compile(r'^\w+\*?$')
+_FTS_TOKEN = re.compile(r'"[^"]*"|[()]|[^\s()]+')
+
+
+def _quote(token):
+    return '"' + token.replace('"', '""') + '"'
+
+
+def fts_query(text):
+    """
+    Make free text safe for FTS5 MATCH while keeping its query syntax.
+
+    Bare words, AND/OR/NOT, parentheses, prefix* terms and "quoted phrases"
+    pass through; any other word (e.g. terraform-provider-azurerm or a:b) is
+    quoted as a phrase so its punctuation is not read as FTS5 syntax.
+    """
+    parts = []
+    for token in _FTS_TOKEN.findall(text):
+        keep = (
+            token in ('(', ')') or token in _FTS_OPERATORS or _FTS_PLAIN.match(token)
+            or len(token) > 1 and token.startswith('"') and token.endswith('"')
+        )
+        parts.append(token if keep else _quote(token))
+    return ' '.join(parts)
+
+
+def _phrase_query(text):
+    # Last resort for input that is still not valid FTS5: every word as a phrase
+    return ' '.join(_quote(word) for word in text.replace('(', ' ').replace(')', ' ').split())
+
+
+def _date_bound(value):
+    bound = utc_iso(value)
+    if bound is None:
+        raise ValueError(f"Not an ISO date: {value}")
+    return bound
+
+
+# Query filters: (argument, SQL clause, parameter for the clause)
+_FILTERS = (
+    ('provider', "e.provider = ?", lambda value: value.lower()),
+    ('source', "e.source_name LIKE ?", lambda value: f"%{value}%"),
+    ('impact', "e.impact = ?", lambda value: value.upper()),
+    ('category', "e.entry_id IN (SELECT entry_id FROM entry_categories WHERE category = ?)", str),
+    ('since', "e.published >= ?", _date_bound),
+    ('until', "e.published < ?", _date_bound),
+)
+
+
+class HistoryArchive(SQLiteStore):
+    """
+    Permanent SQLite archive of every aggregated entry and its analysis.
+
+    Entries are keyed by entry_identity, so re-archiving an entry updates it in
+    place. An FTS5 index over title, summary, analysis changes and content
+    backs free-text queries; provider, impact, category and date filters use
+    ordinary indexes.
+    """
+
+    def __init__(self, db_path):
+        super().__init__(db_path, _SCHEMA)
+        self._conn.row_factory = sqlite3.Row
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Open the archive at ``settings.history.db_path``.
+        """
+        settings = config.get('settings') or {}
+        history_settings = settings.get('history') or {}
+        return cls(history_settings.get(
+            'db_path', os.path.join(settings.get('cache_dir', '.cache'), 'history.sqlite3')
+        ))
+
+    def record(self, entries, week_range=None):
+        """
+        Insert or update entries and their analysis; returns the number stored.
+        """
+        week_start = week_range[0].isoformat() if week_range else None
+        now = datetime.now(pytz.UTC).isoformat()
+        count = 0
+        with self._conn:
+            for entry in entries:
+                analysis = entry.get('analysis') or {}
+                changes = '\n'.join(
+                    str(item) for field in CHANGE_FIELDS for item in analysis.get(field, [])
+                )
+                entry_id = entry.get('entry_id') or entry_identity(entry)
+                self._conn.execute(
+                    """
+                    INSERT INTO entries (
+                        entry_id, title, link, provider, source_name, source_type, published,
+                        impact, has_breaking, has_security, summary, changes, content, analysis,
+                        week_start, archived_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(entry_id) DO UPDATE SET
+                        title = excluded.title,
+                        link = excluded.link,
+                        provider = excluded.provider,
+                        source_name = excluded.source_name,
+                        source_type = excluded.source_type,
+                        published = excluded.published,
+                        impact = excluded.impact,
+                        has_breaking = excluded.has_breaking,
+                        has_security = excluded.has_security,
+                        summary = excluded.summary,
+                        changes = excluded.changes,
+                        content = excluded.content,
+                        analysis = excluded.analysis,
+                        archived_at = excluded.archived_at
+                    """,
+                    (
+                        entry_id,
+                        str(entry.get('title', 'No Title')),
+                        entry.get('link'),
+                        str(entry.get('provider_name', '')).lower(),
+                        entry.get('source_name'),
+                        entry.get('source_type'),
+                        utc_iso(entry.get('published')),
+                        str(analysis.get('impact_level', '')).upper() or None,
+                        int(bool(analysis.get('breaking_changes'))),
+                        int(bool(analysis.get('security_updates'))),
+                        analysis.get('summary'),
+                        changes,
+                        str(entry.get('content', '')),
+                        json.dumps(analysis) if analysis else None,
+                        week_start,
+                        now
+                    )
+                )
+                self._conn.execute("DELETE FROM entry_categories WHERE entry_id = ?", (entry_id,))
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO entry_categories (entry_id, category) VALUES (?, ?)",
+                    [(entry_id, str(category)) for category in analysis.get('categories', [])]
+                )
+                count += 1
+        logging.info(f"Archived {count} entries")
+        return count
+
+    def query(self, text=None, provider=None, source=None, impact=None, category=None,
+              since=None, until=None, breaking=False, security=False, limit=50):
+        """
+        Return archived entries matching every given filter, newest first.
+
+        ``text`` is an FTS5 query in which words with punctuation, such as
+        provider names, are matched as phrases; ``source`` matches part of the
+        source name; ``since``/``until`` are ISO dates (inclusive/exclusive).
+        Raises ValueError for dates that are not ISO dates.
+        """
+        filters = {
+            'provider': provider, 'source': source, 'impact': impact, 'category': category,
+            'since': since, 'until': until,
+        }
+        clauses = []
+        params = []
+        if text:
+            clauses.append("e.rowid IN (SELECT rowid FROM entries_fts WHERE entries_fts MATCH ?)")
+            params.append(fts_query(text))
+        for name, clause, to_param in _FILTERS:
+            if filters[name]:
+                clauses.append(clause)
+                params.append(to_param(filters[name]))
+        if breaking:
+            clauses.append("e.has_breaking = 1")
+        if security:
+            clauses.append("e.has_security = 1")
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"""
+            SELECT e.entry_id, e.title, e.link, e.provider, e.source_name, e.published,
+                   e.impact, e.summary, e.analysis
+            FROM entries AS e {where}
+            ORDER BY e.published DESC
+            LIMIT ?
+        """
+        try:
+            rows = self._conn.execute(sql, (*params, limit)).fetchall()
+        except sqlite3.OperationalError as e:
+            if not text:
+                raise
+            # E.g. unbalanced parentheses: search for the words as phrases instead
+            logging.debug(f"FTS query {params[0]!r} failed ({e}); retrying as phrases")
+            params[0] = _phrase_query(text)
+            rows = self._conn.execute(sql, (*params, limit)).fetchall()
+
+        results = []
+        for row in rows:
+            result = dict(row)
+            analysis = json.loads(result.pop('analysis') or '{}')
+            result['categories'] = analysis.get('categories', [])
+            result['breaking_changes'] = analysis.get('breaking_changes', [])
+            results.append(result)
+        return results
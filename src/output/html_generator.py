@@ -1,31 +1,44 @@
-from jinja2 import Environment, FileSystemLoader
+import hashlib
 import os
 import logging
 import shutil
 from datetime import datetime
-import markdown
+from functools import lru_cache
+from src.metrics import get_metrics
 from src.utils.icon_mapping import ICON_MAPPING
+from .assets import build_assets
+from .markdown_renderer import MarkdownRenderer
+from .search_index import write_search_index
 
-def generate_html(entries, week_range, executive_summary, action_items, additional_resources, template_path='src/templates/base.html', output_dir='dist'):
+
+def generate_html(entries, week_range, executive_summary, action_items, additional_resources,
+                  template_path='src/templates/base.html', output_dir='dist',
+                  markdown_renderer=None, mode='full'):
     """
     Generate HTML newsletter from analyzed entries.
+
+    Markdown content is converted after all entries have arrived, through
+    ``markdown_renderer`` (an uncached MarkdownRenderer by default). Duplicate
+    references are read at the same point: deduplication appends them to an
+    entry that has already been streamed.
+
+    In ``full`` mode every entry body is inlined into index.html. In
+    ``sharded`` mode the index only carries titles, summaries and analysis;
+    each body is written to ``fragments/<id>.html`` and loaded on expand.
     """
+    metrics = get_metrics()
     try:
-        # Create necessary directories
-        os.makedirs(os.path.join(output_dir, 'assets/icons'), exist_ok=True)
+        # Build fingerprinted styles, scripts and icon sprite; unchanged ones are reused
+        template_dir = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates'
+        )
+        with metrics.stage('build_assets'):
+            assets = build_assets(output_dir, template_dir)
         
-        # Copy local icons to the output directory
-        for icon_file in ICON_MAPPING.values():
-            source_path = os.path.join('src', 'assets', 'icons', icon_file)
-            dest_path = os.path.join(output_dir, 'assets', 'icons', icon_file)
-            if os.path.exists(source_path):
-                shutil.copy2(source_path, dest_path)
-                logging.debug(f"Copied {source_path} to {dest_path}")
-            else:
-                logging.error(f"Icon file {source_path} does not exist.")
-        
-        # Initialize markdown converter with code highlighting
-        md = markdown.Markdown(extensions=['fenced_code', 'codehilite', 'tables'])
+        # Markdown entries are rendered together once the stream is consumed
+        markdown_entries = []
+        # (processed entry, source entry) pairs; duplicates can arrive after an entry
+        received = []
         
         # Process entries and organize by platform
         platforms = {}
@@ -33,14 +46,16 @@ def generate_html(entries, week_range, executive_summary, action_items, addition
             'breaking_changes_count': 0,
             'security_updates_count': 0,
             'new_features_count': 0,
-            'total_updates_count': len(entries)
+            'total_updates_count': 0
         }
         
+        # Entries may be a stream; each one is processed as soon as it arrives
         for entry in entries:
+            stats['total_updates_count'] += 1
             platform_name = entry.get('provider_name', 'unknown').lower()
             source_name = entry.get('source_name', platform_name.title())
             icon_filename = ICON_MAPPING.get(platform_name, 'question.svg')
-            icon_path = f"assets/icons/{icon_filename}"
+            icon_path = assets.icon_url(icon_filename)
             
             if platform_name not in platforms:
                 platforms[platform_name] = {
@@ -53,15 +68,12 @@ def generate_html(entries, week_range, executive_summary, action_items, addition
             content = str(entry.get('content', 'No content available.'))
             content_type = entry.get('content_type', 'html')
             
-            # Convert markdown to HTML if content is markdown
-            if content_type == 'markdown':
-                content = md.convert(content)
-            
             # Get Claude's analysis
             analysis = entry.get('analysis', {})
             
             processed_entry = {
                 "title": str(entry.get('title', 'No Title')),
+                "source_name": source_name,
                 "url": str(entry.get('link', '#')),
                 "published": str(entry.get('published', '')),
                 "content": content,
@@ -81,32 +93,51 @@ def generate_html(entries, week_range, executive_summary, action_items, addition
                 "action_items": analysis.get('action_items', []),
                 "affected_services": analysis.get('affected_services', []),
                 "platform_status": analysis.get('platform_status', 'Unknown'),
-                "summary": analysis.get('summary', '')
+                "summary": analysis.get('summary', ''),
+                "duplicates": [],
+                "body_url": None
             }
             
             # Update statistics based on Claude's analysis
-            if processed_entry['breaking_changes']:
-                stats['breaking_changes_count'] += 1
-            if processed_entry['security_updates']:
-                stats['security_updates_count'] += 1
-            if processed_entry['new_features']:
-                stats['new_features_count'] += 1
+            _count_updates(stats, processed_entry)
             
             # Add to platforms
             platforms[platform_name]["entries"].append(processed_entry)
-        
+            received.append((processed_entry, entry))
+            if content_type == 'markdown':
+                markdown_entries.append(processed_entry)
+
+        _attach_duplicates(received)
+
+        # Convert markdown to HTML, reusing cached renders
+        if markdown_entries:
+            with metrics.stage('render_markdown'):
+                _render_markdown(markdown_entries, markdown_renderer or MarkdownRenderer())
+
+        platforms = _newest_first(platforms)
+
         # Remove 'unknown' platform if present
         if 'unknown' in platforms:
             logging.warning("Some entries have an unknown provider. These entries will be excluded.")
             del platforms['unknown']
 
-        # Setup Jinja2 environment with correct template directory
-        template_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # Get src directory
-        env = Environment(loader=FileSystemLoader(os.path.join(template_dir, 'templates')))
-        
-        # Add safe filter to allow HTML in content
-        env.filters['safe'] = lambda x: x
-        
+        # Number entries in display order; the ids key the search index
+        displayed_entries = [
+            item for platform in platforms.values() for item in platform['entries']
+        ]
+        for search_id, processed_entry in enumerate(displayed_entries):
+            processed_entry['search_id'] = search_id
+        with metrics.stage('search_index'):
+            write_search_index(displayed_entries, assets)
+
+        # Shared Jinja2 environment; compiled templates stay cached across runs in one process
+        env = _environment(template_dir)
+
+        if mode == 'sharded':
+            with metrics.stage('render_fragments'):
+                body_template = env.get_template('components/entry_body.html')
+                _write_fragments(platforms, body_template, output_dir)
+
         template = env.get_template('base.html')  # Now we can use relative path
         
         # Prepare template data
@@ -117,17 +148,100 @@ def generate_html(entries, week_range, executive_summary, action_items, addition
             'breaking_changes_count': stats['breaking_changes_count'],
             'security_updates_count': stats['security_updates_count'],
             'new_features_count': stats['new_features_count'],
-            'total_updates_count': stats['total_updates_count']
+            'total_updates_count': stats['total_updates_count'],
+            'assets': assets
         }
         
-        # Render HTML
-        html_content = template.render(**template_data)
+        # Render HTML, streaming it to disk chunk by chunk
         output_path = os.path.join(output_dir, 'index.html')
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        with metrics.stage('render_template'), open(output_path, 'w', encoding='utf-8') as f:
+            f.writelines(template.generate(**template_data))
         
         logging.info(f"HTML newsletter generated successfully at {output_path}")
         
     except Exception as e:
         logging.error(f"Error generating HTML newsletter: {e}")
         raise
+
+
+def _count_updates(stats, processed_entry):
+    for field in ('breaking_changes', 'security_updates', 'new_features'):
+        if processed_entry[field]:
+            stats[f"{field}_count"] += 1
+
+
+def _attach_duplicates(received):
+    # Later duplicates were merged into entries that had already been yielded
+    for processed_entry, entry in received:
+        processed_entry['duplicates'] = entry.get('duplicates') or []
+
+
+def _render_markdown(markdown_entries, renderer):
+    rendered = renderer.render_all([item['content'] for item in markdown_entries])
+    for processed_entry, html in zip(markdown_entries, rendered):
+        processed_entry['content'] = html
+
+
+def _newest_first(platforms):
+    """
+    Sort each platform's entries and the platforms themselves by most recent update.
+
+    Streamed entries arrive in completion order, not publication order.
+    """
+    for platform in platforms.values():
+        platform['entries'].sort(key=_published_key, reverse=True)
+    return dict(sorted(
+        platforms.items(), key=lambda item: _published_key(item[1]['entries'][0]), reverse=True
+    ))
+
+
+@lru_cache(maxsize=None)
+def _environment(template_dir):
+    """
+    Return the Jinja2 environment for a template directory.
+
+    Templates are compiled once per process and recompiled only when their
+    source files change on disk.
+    """
+    from jinja2 import Environment, FileSystemLoader
+
+    env = Environment(loader=FileSystemLoader(template_dir))
+
+    # Add safe filter to allow HTML in content
+    env.filters['safe'] = lambda x: x
+    return env
+
+
+def _write_fragments(platforms, template, output_dir):
+    """
+    Write each entry body to its own fragment file and point the entry at it.
+    """
+    fragments_dir = os.path.join(output_dir, 'fragments')
+    # Bodies of entries that left the window must not linger on the site
+    shutil.rmtree(fragments_dir, ignore_errors=True)
+    os.makedirs(fragments_dir)
+
+    count = 0
+    for platform in platforms.values():
+        for processed_entry in platform['entries']:
+            identity = '|'.join(
+                processed_entry[key] for key in ('url', 'title', 'published')
+            )
+            fragment_id = hashlib.sha256(identity.encode('utf-8')).hexdigest()[:16]
+            fragment_path = os.path.join(fragments_dir, f"{fragment_id}.html")
+            with open(fragment_path, 'w', encoding='utf-8') as f:
+                for chunk in template.generate(entry=processed_entry):
+                    f.write(chunk)
+            processed_entry['body_url'] = f"fragments/{fragment_id}.html"
+            count += 1
+    logging.info(f"Wrote {count} entry fragments to {fragments_dir}")
+
+
+def _published_key(processed_entry):
+    """
+    Sort key for processed entries by their ISO publication date.
+    """
+    try:
+        return datetime.fromisoformat(processed_entry['published']).timestamp()
+    except (TypeError, ValueError):
+        return float('-inf')
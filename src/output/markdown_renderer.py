@@ -0,0 +1,189 @@
+# src/output/markdown_renderer.py
+import hashlib
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+
+from src.utils.storage import SQLiteStore
+
+MARKDOWN_EXTENSIONS = ['fenced_code', 'codehilite', 'tables']
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS renders (
+    render_key TEXT PRIMARY KEY,
+    html TEXT NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+# One converter per process; worker processes build their own on first use
+_converter = None
+
+
+def _package_version(name):
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+@lru_cache(maxsize=None)
+def render_version():
+    """
+    Rendered HTML depends on the extensions and on the markdown/Pygments releases.
+    """
+    return '|'.join([
+        ','.join(MARKDOWN_EXTENSIONS), _package_version('markdown'), _package_version('pygments')
+    ])
+
+
+def render_key(text):
+    """
+    Hash a markdown document together with everything that affects its HTML.
+    """
+    return hashlib.sha256(f"{render_version()}\n{text}".encode('utf-8')).hexdigest()
+
+
+def render_markdown(text):
+    """
+    Convert one markdown document to HTML.
+
+    The converter is reset before every document so no state (references,
+    stashed HTML) leaks between entries; the result only depends on ``text``.
+    """
+    global _converter
+    if _converter is None:
+        # markdown and Pygments load only once there is something to render
+        import markdown
+        _converter = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+    return _converter.reset().convert(text)
+
+
+class MarkdownRenderCache(SQLiteStore):
+    """
+    Persistent cache of rendered markdown keyed by render_key.
+
+    The least recently used renders are evicted once more than ``max_entries``
+    are stored.
+    """
+
+    def __init__(self, db_path, max_entries=5000):
+        super().__init__(db_path, _SCHEMA)
+        self.max_entries = max_entries
+
+    def get_many(self, keys):
+        """
+        Return a dict of the cached renders for the given keys.
+        """
+        keys = list(set(keys))
+        found = {}
+        now = time.time()
+        with self._lock, self._conn:
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ','.join('?' * len(batch))
+                found.update(self._conn.execute(
+                    f"SELECT render_key, html FROM renders WHERE render_key IN ({placeholders})",
+                    batch
+                ).fetchall())
+                self._conn.execute(
+                    f"UPDATE renders SET accessed_at = ? WHERE render_key IN ({placeholders})",
+                    [now, *batch]
+                )
+        return found
+
+    def set_many(self, renders):
+        """
+        Store rendered HTML by key and evict excess entries.
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO renders (render_key, html, accessed_at) VALUES (?, ?, ?)",
+                [(key, html, now) for key, html in renders.items()]
+            )
+            cursor = self._conn.execute(
+                "DELETE FROM renders WHERE render_key IN ("
+                "SELECT render_key FROM renders ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+        if cursor.rowcount:
+            logging.debug(f"Evicted {cursor.rowcount} markdown renders from cache")
+
+
+class MarkdownRenderer:
+    """
+    Render many markdown documents, reusing cached HTML where possible.
+
+    Cache misses are converted in a process pool of ``workers`` processes when
+    there are at least ``parallel_threshold`` of them, otherwise serially in
+    this process. Both paths run render_markdown, so the HTML is identical.
+    The pool is started on first use and kept until ``close()``, so a
+    long-lived process does not pay for worker start-up on every render.
+    """
+
+    def __init__(self, cache=None, workers=None, parallel_threshold=8):
+        self.cache = cache
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.parallel_threshold = parallel_threshold
+        self._pool = None
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Build the renderer described by ``settings.cache_dir`` and ``settings.markdown``.
+        """
+        settings = config.get('settings') or {}
+        markdown_settings = settings.get('markdown') or {}
+        cache = None
+        if markdown_settings.get('cache', True):
+            cache = MarkdownRenderCache(
+                os.path.join(settings.get('cache_dir', '.cache'), 'markdown.sqlite3'),
+                max_entries=markdown_settings.get('cache_max_entries', 5000)
+            )
+        return cls(
+            cache,
+            workers=markdown_settings.get('workers'),
+            parallel_threshold=markdown_settings.get('parallel_threshold', 8)
+        )
+
+    def render_all(self, texts):
+        """
+        Return the HTML for each markdown document, in input order.
+        """
+        keys = [render_key(text) for text in texts]
+        rendered = self.cache.get_many(keys) if self.cache is not None else {}
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in rendered:
+                missing.setdefault(key, text)
+
+        if missing:
+            fresh = dict(zip(missing, self._convert(list(missing.values()))))
+            if self.cache is not None:
+                self.cache.set_many(fresh)
+            rendered.update(fresh)
+
+        logging.info(
+            f"Rendered {len(missing)} markdown documents "
+            f"({len(texts) - len(missing)} from cache)"
+        )
+        return [rendered[key] for key in keys]
+
+    def _convert(self, texts):
+        if self.workers > 1 and len(texts) >= self.parallel_threshold:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            return list(self._pool.map(render_markdown, texts, chunksize=4))
+        return [render_markdown(text) for text in texts]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self.cache is not None:
+            self.cache.close()
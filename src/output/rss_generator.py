@@ -1,31 +1,20 @@
 # src/output/rss_generator.py
-import feedgenerator
-import os
-from datetime import datetime
 import logging
+from src.metrics import get_metrics
+from .feed_writer import FeedWriter
 
-def generate_rss(entries, week_range, output_dir='dist'):
+
+def generate_rss(entries, week_range, output_dir='dist', feed_writer=None):
+    """
+    Merge entries into the rolling-window RSS/Atom/JSON feeds.
+    """
     try:
-        os.makedirs(output_dir, exist_ok=True)
-        rss = feedgenerator.Rss201rev2Feed(
-            title="DevOps Updates Digest",
-            link="https://yourusername.github.io/yourrepo/",  # Update with your GitHub Pages URL
-            description=f"Weekly digest of DevOps platform updates from {week_range[0].strftime('%B %d, %Y')} to {week_range[1].strftime('%B %d, %Y')}",
-            language="en"
-        )
-        
-        for entry in entries:
-            rss.add_item(
-                title=entry.get('title', 'No Title'),
-                link=entry.get('link', '#'),
-                description=entry.get('content', 'No content available.'),
-                pubdate=entry.get('published_parsed')
+        feed_writer = feed_writer or FeedWriter(output_dir)
+        with get_metrics().stage('render_feeds'):
+            start, end = (day.strftime('%B %d, %Y') for day in week_range[:2])
+            feed_writer.write(
+                entries, f"Weekly digest of DevOps platform updates from {start} to {end}"
             )
-        
-        output_path = os.path.join(output_dir, 'feed.xml')
-        with open(output_path, 'w', encoding='utf-8') as f:
-            rss.write(f, 'utf-8')
-        
-        logging.info(f"RSS feed generated successfully at {output_path}")
+        logging.info(f"Feeds generated successfully in {feed_writer.output_dir}")
     except Exception as e:
         logging.error(f"Error generating RSS feed: {e}")
@@ -0,0 +1,84 @@
+# src/output/search_index.py
+import base64
+import json
+import logging
+import re
+
+SEARCH_INDEX_VERSION = 1
+
+_TOKEN_RE = re.compile(r'\w+')
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Analysis fields whose text is searchable besides title and source name
+SEARCHABLE_FIELDS = ('summary', 'categories', 'affected_services', 'key_changes')
+
+
+def tokenize(text):
+    """
+    Lower-case word tokens; scripts.html tokenizes queries the same way.
+    """
+    return _TOKEN_RE.findall(str(text).lower())
+
+
+def slugify(label):
+    """
+    Reduce a category label to the form used by the filter tags (CI/CD -> cicd).
+    """
+    return _SLUG_RE.sub('', label.lower())
+
+
+def _bitset(ids, count):
+    bits = bytearray((count + 7) // 8)
+    for entry_id in ids:
+        bits[entry_id >> 3] |= 1 << (entry_id & 7)
+    return base64.b64encode(bytes(bits)).decode('ascii')
+
+
+def build_search_index(processed_entries):
+    """
+    Build the inverted index for a list of processed entries.
+
+    An entry's id is its position in the list. ``terms`` is sorted so the
+    client can binary-search prefixes; ``postings[i]`` lists the ids holding
+    ``terms[i]``. Impact levels and category slugs map to base64 bitsets with
+    bit ``id`` set for every matching entry.
+    """
+    postings = {}
+    impacts = {}
+    categories = {}
+
+    for entry_id, processed_entry in enumerate(processed_entries):
+        texts = [processed_entry['title'], processed_entry.get('source_name', '')]
+        for field in SEARCHABLE_FIELDS:
+            value = processed_entry.get(field) or []
+            texts.extend(value if isinstance(value, list) else [value])
+        for token in set(tokenize(' '.join(map(str, texts)))):
+            postings.setdefault(token, []).append(entry_id)
+
+        impacts.setdefault(processed_entry['impact'].lower(), []).append(entry_id)
+        for category in processed_entry.get('categories', []):
+            categories.setdefault(slugify(str(category)), []).append(entry_id)
+
+    count = len(processed_entries)
+    terms = sorted(postings)
+    return {
+        'version': SEARCH_INDEX_VERSION,
+        'count': count,
+        'terms': terms,
+        'postings': [postings[term] for term in terms],
+        'impact': {level: _bitset(ids, count) for level, ids in impacts.items()},
+        'categories': {slug: _bitset(ids, count) for slug, ids in categories.items()},
+    }
+
+
+def write_search_index(processed_entries, assets):
+    """
+    Write the index as the fingerprinted ``search-index.json`` asset and return its URL.
+
+    Ids are display positions that change between runs, so the file name
+    follows the content and a cached index never meets a newer page.
+    """
+    index = build_search_index(processed_entries)
+    url = assets.add('search-index.json', json.dumps(index, separators=(',', ':')))
+    logging.info(f"Search index with {len(index['terms'])} terms written to {url}")
+    return url
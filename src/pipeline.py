@@ -0,0 +1,151 @@
+# src/pipeline.py
+import logging
+import queue
+import threading
+import traceback
+
+from src.aggregator.dedupe import iter_unique_entries
+from src.aggregator.news_aggregator import entry_sort_key
+from src.metrics import get_metrics
+
+_END = object()
+
+
+class _Failure:
+    def __init__(self, error):
+        self.error = error
+
+
+def _put(items, stop, item):
+    # Block until there is room, giving up once the consumer has gone away
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _produce(iterable, items, stop, name):
+    iterator = iter(iterable)
+    try:
+        for item in iterator:
+            if not _put(items, stop, item):
+                logging.debug(f"Stopping {name or 'stage'}: consumer went away")
+                break
+    except BaseException as e:
+        # Drop the failed stages' locals so the stages they read from are
+        # closed now rather than whenever the traceback is collected
+        traceback.clear_frames(e.__traceback__)
+        _put(items, stop, _Failure(e))
+    finally:
+        # Closing a generator stage closes the stages it reads from
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            close()
+        _put(items, stop, _END)
+
+
+def threaded(iterable, maxsize=32, name=None):
+    """
+    Drive an iterable from a background thread, handing items over through a
+    bounded queue.
+
+    The producer blocks once ``maxsize`` items are waiting, which keeps the
+    amount of in-flight data bounded while letting stages overlap. Exceptions
+    raised by the producer are re-raised in the consumer. When the consumer
+    stops early (it raised, or closed the generator) the producer gives up,
+    closes its iterable so upstream stages shut down too, and the queue is
+    drained.
+    """
+    items = queue.Queue(maxsize)
+    stop = threading.Event()
+    producer = threading.Thread(target=_produce, args=(iterable, items, stop, name), name=name)
+    producer.daemon = True
+    producer.start()
+
+    try:
+        while True:
+            item = items.get()
+            if item is _END:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        while not items.empty():
+            items.get_nowait()
+
+
+def normalize_stage(source_batches, aggregator):
+    """
+    Flatten per-source batches and tag entries via the entry store.
+    """
+    metrics = get_metrics()
+    for source_entries in source_batches:
+        with metrics.stage('normalize'):
+            tracked = aggregator.track(source_entries)
+        metrics.increment('entries', len(tracked), stage='normalize')
+        yield from tracked
+
+
+def date_filter_stage(entries, week_range):
+    """
+    Drop entries published outside the aggregation window.
+    """
+    metrics = get_metrics()
+    start, end = week_range
+    for entry in entries:
+        with metrics.stage('date_filter'):
+            in_range = start <= entry_sort_key(entry) < end
+        if in_range:
+            metrics.increment('entries', stage='date_filter')
+            yield entry
+        else:
+            metrics.increment('entries_dropped', stage='date_filter')
+            logging.debug(f"Dropping out-of-range entry: {entry.get('title')}")
+
+
+def analyze_stage(entries, analyzer=None, store=None):
+    """
+    Attach analysis to entries that do not carry one yet.
+    """
+    if analyzer is None:
+        yield from entries
+        return
+
+    metrics = get_metrics()
+    for entry, analysis in analyzer.analyze_iter(entries):
+        metrics.increment('entries', stage='analyze')
+        if analysis is not None:
+            entry['analysis'] = analysis
+            if store is not None and entry.get('entry_id') and not analysis.get('is_fallback'):
+                store.save_analysis(entry['entry_id'], analysis)
+        yield entry
+
+
+def build_pipeline(aggregator, config, analyzer=None):
+    """
+    Connect fetch -> normalize -> date-filter -> dedupe -> analyze as a stream.
+
+    Every stage runs in its own thread and hands entries to the next one
+    through a bounded queue (``settings.pipeline_queue_size``), so analysis of
+    early sources overlaps with fetching of slow ones. The returned generator
+    yields analyzed entries in completion order.
+    """
+    settings = config.get('settings') or {}
+    maxsize = settings.get('pipeline_queue_size', 32)
+
+    if aggregator.entry_store is not None:
+        aggregator.entry_store.prune(aggregator.current_week_range[0])
+
+    stream = threaded(aggregator.iter_source_entries(), maxsize, name='fetch')
+    stream = threaded(normalize_stage(stream, aggregator), maxsize, name='normalize')
+    stream = date_filter_stage(stream, aggregator.current_week_range)
+    if settings.get('dedupe', True):
+        threshold = settings.get('dedupe_threshold', 0.8)
+        stream = threaded(iter_unique_entries(stream, threshold), maxsize, name='dedupe')
+    stream = analyze_stage(stream, analyzer, aggregator.entry_store)
+    return threaded(stream, maxsize, name='analyze')
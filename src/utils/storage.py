@@ -0,0 +1,65 @@
+# src/utils/storage.py
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+def ensure_parent(path):
+    """
+    Create the directory that will hold ``path``.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+@contextmanager
+def atomic_open(path, mode='w'):
+    """
+    Open a temporary file that replaces ``path`` only if the block completes.
+
+    Readers see the old file or the new one, never a partial write. The
+    temporary name is unique per process and thread, so concurrent writers of
+    the same path do not clobber each other's half-written files.
+    """
+    ensure_parent(path)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, mode, encoding=None if 'b' in mode else 'utf-8') as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write(path, data):
+    """
+    Atomically replace ``path`` with text or bytes.
+    """
+    with atomic_open(path, 'wb' if isinstance(data, bytes) else 'w') as f:
+        f.write(data)
+
+
+class SQLiteStore:
+    """
+    Base for the SQLite-backed stores and caches.
+
+    One connection is shared by all threads and serialized by ``_lock``;
+    ``schema`` is executed when the database is opened.
+    """
+
+    def __init__(self, db_path, schema):
+        ensure_parent(db_path)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(schema)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()